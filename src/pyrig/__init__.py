@@ -0,0 +1,41 @@
+"""Rigging library for Maya.
+
+The submodules are imported on first access: `import pyrig` loads nothing
+else, `pyrig.node.Node` imports pyrig.node the first time it is used. The
+modules refer to each other this way instead of importing at call time.
+"""
+import importlib
+
+SUBMODULES = (
+    "apiAttribute",
+    "attribute",
+    "backend",
+    "benchmark",
+    "constants",
+    "container",
+    "control",
+    "core",
+    "dataType",
+    "joint",
+    "maths",
+    "name",
+    "node",
+    "profiler",
+    "schema",
+    "session",
+    "transform",
+)
+
+
+def __getattr__(name):
+    """Import the submodules on first access."""
+    if name in SUBMODULES:
+        return importlib.import_module("{}.{}".format(__name__, name))
+    raise AttributeError(
+        "module '{}' has no attribute '{}'".format(__name__, name)
+    )
+
+
+def __dir__():
+    """"""
+    return sorted(set(globals()) | set(SUBMODULES))
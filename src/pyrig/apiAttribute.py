@@ -0,0 +1,358 @@
+import logging
+
+from pyrig.backend import cmds, om
+
+import pyrig.core as pr
+import pyrig.attribute
+import pyrig.session
+
+LOG = logging.getLogger(__name__)
+
+
+def find_plug(plug):
+    """Return the MPlug matching the given "node.attr" string or None."""
+    selection = om.MSelectionList()
+    try:
+        selection.add(str(plug))
+        return selection.getPlug(0)
+    except (RuntimeError, TypeError):
+        return None
+
+
+def plug_value(mplug):
+    """Read the given MPlug the way `Attribute.get_value` returns it.
+
+    Compounds are returned as tuples and matrices as Mat44, angles and
+    distances are converted to the ui units like cmds.getAttr does.
+    Returns NotImplemented for the plugs that are not supported (arrays,
+    generic and non-matrix/string typed attributes).
+    """
+    if mplug.isArray:
+        return NotImplemented
+
+    if mplug.isCompound:
+        values = tuple(
+            plug_value(mplug.child(i)) for i in range(mplug.numChildren())
+        )
+        if NotImplemented in values:
+            return NotImplemented
+        return values
+
+    attribute = mplug.attribute()
+    if attribute.hasFn(om.MFn.kUnitAttribute):
+        unit_type = om.MFnUnitAttribute(attribute).unitType()
+        if unit_type == om.MFnUnitAttribute.kAngle:
+            return mplug.asMAngle().asUnits(om.MAngle.uiUnit())
+        if unit_type == om.MFnUnitAttribute.kDistance:
+            return mplug.asMDistance().asUnits(om.MDistance.uiUnit())
+        if unit_type == om.MFnUnitAttribute.kTime:
+            return mplug.asMTime().asUnits(om.MTime.uiUnit())
+        return mplug.asDouble()
+
+    if attribute.hasFn(om.MFn.kEnumAttribute):
+        return mplug.asInt()
+
+    if attribute.hasFn(om.MFn.kNumericAttribute):
+        numeric_type = om.MFnNumericAttribute(attribute).numericType()
+        if numeric_type == om.MFnNumericData.kBoolean:
+            return mplug.asBool()
+        if numeric_type in (
+            om.MFnNumericData.kByte,
+            om.MFnNumericData.kChar,
+            om.MFnNumericData.kShort,
+            om.MFnNumericData.kInt,
+            om.MFnNumericData.kInt64,
+        ):
+            return mplug.asInt()
+        if numeric_type in (om.MFnNumericData.kFloat, om.MFnNumericData.kDouble):
+            return mplug.asDouble()
+        return NotImplemented
+
+    if attribute.hasFn(om.MFn.kMatrixAttribute):
+        return _matrix_value(mplug)
+
+    if attribute.hasFn(om.MFn.kTypedAttribute):
+        data_type = om.MFnTypedAttribute(attribute).attrType()
+        if data_type == om.MFnData.kString:
+            return mplug.asString()
+        if data_type == om.MFnData.kMatrix:
+            return _matrix_value(mplug)
+
+    return NotImplemented
+
+
+def find_plugs(attributes):
+    """Return the MPlugs of the given attributes/"node.attr" strings.
+
+    The plugs are resolved in a single MSelectionList, the valid MPlugs of
+    ApiAttributes are reused. Plugs that do not exist are None.
+    """
+    mplugs = [None] * len(attributes)
+    if om is None:
+        return mplugs
+
+    selection = om.MSelectionList()
+    indices = {}
+    for i, attribute in enumerate(attributes):
+        if isinstance(attribute, ApiAttribute) and attribute._mplug is not None:
+            if attribute._mplug_handle.isValid():
+                mplugs[i] = attribute._mplug
+                continue
+        plug = str(attribute)
+        if plug not in indices:
+            try:
+                selection.add(plug)
+            except (RuntimeError, TypeError):
+                indices[plug] = None
+                continue
+            indices[plug] = selection.length() - 1
+        if indices[plug] is not None:
+            mplugs[i] = selection.getPlug(indices[plug])
+    return mplugs
+
+
+def read_values(attributes):
+    """Read the values of the given attributes/"node.attr" strings.
+
+    The plugs are resolved in a single MSelectionList and read directly,
+    the values are returned in order, formatted like `Attribute.get_value`.
+    Plugs not supported by `plug_value` and backends without OpenMaya
+    fall back to cmds.getAttr.
+    """
+    session = pyrig.session.current()
+    if session is not None:
+        session.flush()
+
+    plugs = [str(attribute) for attribute in attributes]
+    mplugs = find_plugs(attributes)
+
+    values = []
+    for plug, mplug in zip(plugs, mplugs):
+        value = plug_value(mplug) if mplug is not None else NotImplemented
+        if value is NotImplemented:
+            value = pyrig.attribute.convert_value(cmds.getAttr(plug, silent=True))
+        values.append(value)
+    return values
+
+
+def write_values(values, force_lock=False):
+    """Set {attribute/"node.attr": value} in a single modifier.
+
+    The values and, with force_lock, the unlock/lock of the locked plugs
+    are queued in one edit session. Values `pyrig.session.set_plug_value`
+    does not support are set with cmds in the same pass.
+    """
+    attributes = list(values)
+    mplugs = find_plugs(attributes)
+
+    with pr.edit_session("pyrig_set_values") as session:
+        locked = []
+        if force_lock:
+            for attribute, mplug in zip(attributes, mplugs):
+                if mplug is not None and mplug.isLocked:
+                    session.set_lock(attribute, False)
+                    locked.append(attribute)
+
+        for attribute, mplug in zip(attributes, mplugs):
+            value = values[attribute]
+            if value is None:
+                value = pyrig.attribute._as_attribute(attribute).default
+            value = pyrig.attribute.prepare_value(value)
+            if mplug is None or not session.set_value(mplug, value):
+                pyrig.attribute._as_attribute(attribute)._set_attr(value)
+
+        for attribute in locked:
+            session.set_lock(attribute, True)
+
+
+def _matrix_value(mplug):
+    """Read a matrix plug as Mat44."""
+    try:
+        matrix = om.MFnMatrixData(mplug.asMObject()).matrix()
+    except RuntimeError:
+        return NotImplemented
+    return pr.Types.Mat44(list(matrix))
+
+
+class ApiAttribute(pyrig.attribute.Attribute):
+    """Attribute resolving its MPlug once and querying it directly.
+
+    Edits still go through cmds to stay undoable, only the queries are
+    done on the plug. Unsupported cases fall back to the cmds Attribute.
+    """
+
+    def __init__(self, node_object, attr_name):
+        """"""
+        super(ApiAttribute, self).__init__(node_object, attr_name)
+        self._mplug = None
+        self._mplug_handle = None
+
+    # Properties
+    @property
+    def mplug(self):
+        """The resolved MPlug, None if the plug does not exist."""
+        if self._mplug_handle is None or not self._mplug_handle.isValid():
+            self._set_mplug(find_plug(self.plug))
+        return self._mplug
+
+    @property
+    def lock(self):
+        """"""
+        queued = self._get_queued_lock()
+        if queued is not None:
+            return queued
+        mplug = self.mplug
+        if mplug is None:
+            return super(ApiAttribute, self).lock
+        return mplug.isLocked
+
+    @lock.setter
+    def lock(self, val):
+        pyrig.attribute.Attribute.lock.fset(self, val)
+
+    @property
+    def keyable(self):
+        """"""
+        mplug = self.mplug
+        if mplug is None:
+            return super(ApiAttribute, self).keyable
+        return mplug.isKeyable
+
+    @keyable.setter
+    def keyable(self, val):
+        pyrig.attribute.Attribute.keyable.fset(self, val)
+
+    @property
+    def visible(self):
+        """"""
+        mplug = self.mplug
+        if mplug is None:
+            return super(ApiAttribute, self).visible
+        return mplug.isKeyable or mplug.isChannelBox
+
+    @visible.setter
+    def visible(self, val):
+        pyrig.attribute.Attribute.visible.fset(self, val)
+
+    @property
+    def parent(self):
+        """"""
+        mplug = self.mplug
+        if mplug is None:
+            return super(ApiAttribute, self).parent
+
+        if self.name.index is not None:
+            parent = self.__class__(self.node, self.name.unindexed())
+            parent._set_mplug(mplug.array())
+            return parent
+
+        if not mplug.isChild:
+            return None
+        parent_plug = mplug.parent()
+        if len(self.name.tokens) > 1:
+            parent_name = str(self.name[:-1])
+        else:
+            parent_name = om.MFnAttribute(parent_plug.attribute()).name
+        parent = self.__class__(self.node, parent_name)
+        parent._set_mplug(parent_plug)
+        return parent
+
+    @property
+    def children(self):
+        """"""
+        mplug = self.mplug
+        if mplug is None or mplug.isArray:
+            return super(ApiAttribute, self).children
+        if not mplug.isCompound:
+            return None
+
+        children = []
+        for i in range(mplug.numChildren()):
+            child_plug = mplug.child(i)
+            child_name = om.MFnAttribute(child_plug.attribute()).name
+            child = self.__class__(
+                self.node, "{}.{}".format(self.attr, child_name)
+            )
+            child._set_mplug(child_plug)
+            children.append(child)
+        return children
+
+    # Properties - multi-attr
+    @property
+    def valid_indices(self):
+        """"""
+        if pyrig.session.current() is not None:
+            return super(ApiAttribute, self).valid_indices
+        mplug = self.mplug
+        if mplug is None or not mplug.isArray:
+            return super(ApiAttribute, self).valid_indices
+        return list(mplug.getExistingArrayAttributeIndices())
+
+    # Methods
+    def get_value(self, format=None):
+        """"""
+        self._sync()
+        mplug = self.mplug
+        value = plug_value(mplug) if mplug is not None else NotImplemented
+        if value is NotImplemented:
+            return super(ApiAttribute, self).get_value(format=format)
+
+        if format:
+            value = self._data_format(value, format, loads=True)
+        return value
+
+    def get_input(self):
+        """"""
+        self._sync()
+        mplug = self.mplug
+        if mplug is None:
+            return super(ApiAttribute, self).get_input()
+
+        source = mplug.source()
+        if source.isNull:
+            return None
+        return self._from_mplug(source)
+
+    def get_outputs(self):
+        """"""
+        self._sync()
+        mplug = self.mplug
+        if mplug is None:
+            return super(ApiAttribute, self).get_outputs()
+        return [self._from_mplug(each) for each in mplug.destinations()]
+
+    def is_multi(self):
+        """"""
+        mplug = self.mplug
+        if mplug is None:
+            return super(ApiAttribute, self).is_multi()
+        # False for the elements, like Attribute.is_multi
+        return mplug.isArray
+
+    # Internal Methods
+    def _set_mplug(self, mplug):
+        """Store the given MPlug and the handle used to validate it."""
+        self._mplug = mplug
+        self._mplug_handle = None
+        if mplug is not None:
+            self._mplug_handle = om.MObjectHandle(mplug.node())
+
+    @staticmethod
+    def _from_mplug(mplug):
+        """Convert the given MPlug to a pyrig attribute."""
+        mobject = mplug.node()
+        uuid = om.MFnDependencyNode(mobject).uuid().asString()
+        node = pyrig.node.get_registered(uuid)
+        if node is None:
+            node = pr.get(pyrig.node.get_node_name(mobject))
+
+        attr_name = mplug.partialName(
+            includeNonMandatoryIndices=True,
+            includeInstancedIndices=True,
+            useFullAttributePath=True,
+            useLongNames=True,
+        )
+        attribute = node.attr(attr_name)
+        if isinstance(attribute, ApiAttribute):
+            attribute._set_mplug(mplug)
+        return attribute
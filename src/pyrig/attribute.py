@@ -1,23 +1,172 @@
 import logging
+import re
 import six
 import json
 from collections import UserDict
 
-import maya.api.OpenMaya as om
-from maya import cmds
+from pyrig.backend import cmds, om
 
 import pyrig.core as pr
 from pyrig.constants import Format
 import pyrig.name
+import pyrig.schema
+import pyrig.session
 
 LOG = logging.getLogger(__name__)
 
 FORCE_LOCK = False
 FORCE_CONNECTION = True
 CONNECT_LEAF = False
+USE_API = False
+
+# Numeric compound types, set with one value per child.
+NUMERIC_COMPOUND_TYPES = (
+    "double2", "double3", "double4",
+    "float2", "float3",
+    "long2", "long3",
+    "short2", "short3",
+)
+# Array data types, set with the list of values.
+ARRAY_DATA_TYPES = ("doubleArray", "Int32Array")
+# Attribute types whose data type can differ per node, see `Attribute.type`.
+PER_NODE_ATTRIBUTE_TYPES = ("typed", "generic")
 
 # TODO call in, call out
 
+
+def convert_value(value):
+    """Convert a cmds.getAttr result the way `Attribute.get_value` returns it."""
+    if isinstance(value, list):
+        if len(value) == 1:
+            # remove "list in list" (eg. node[translate].value)
+            value = value[0]
+        if isinstance(value, (list, tuple)) and len(value) == 16:
+            # matrix class
+            value = pr.Types.Mat44(value)
+    return value
+
+
+def prepare_value(value):
+    """Convert a value given to `Attribute.set_value` to python types."""
+    if isinstance(value, (pr.Types.Mat44, pr.Types.Vec3)):
+        return list(value)
+    if om is not None and isinstance(value, (om.MMatrix, om.MVector)):
+        return list(value)
+    if om is not None and isinstance(value, om.MPoint):
+        return list(value)[:-1]
+    return value
+
+
+def set_values(values, **kwargs):
+    """Set the values of many attributes in one pass.
+
+    The locked plugs are unlocked once, every value is set, then they are
+    locked back. With OpenMaya the whole pass is a single modifier.
+
+    Parameters
+    ----------
+    values : dict
+        {Attribute or "node.attr": value}, None sets the default value.
+    force_lock : bool, optional
+        Unlock the locked plugs during the pass.
+        by default FORCE_LOCK
+    """
+    force_lock = kwargs.get("force_lock", FORCE_LOCK)
+    if om is not None:
+        return pyrig.apiAttribute.write_values(values, force_lock=force_lock)
+
+    items = []
+    for attribute, value in values.items():
+        attribute = _as_attribute(attribute)
+        if value is None:
+            value = attribute.default
+        items.append((attribute, prepare_value(value)))
+
+    locked = [attribute for attribute, _ in items if force_lock and attribute.lock]
+    for attribute in locked:
+        cmds.setAttr(attribute.plug, lock=False)
+    try:
+        for attribute, value in items:
+            attribute._set_attr(value)
+    finally:
+        for attribute in locked:
+            cmds.setAttr(attribute.plug, lock=True)
+
+
+def plan_connections(source, destination, skip=None):
+    """Return the [(source, destination), ...] connecting the leaves.
+
+    The children of both compounds are resolved once. A compound receives
+    a scalar on each of its children, or the children of a compound with
+    the same number of children (eg. float3 -> double3). The destination
+    children whose long name is in skip, short or long names, are skipped.
+    Other plugs are connected as they are.
+    """
+    destination_children = destination.children
+    if not destination_children:
+        return [(source, destination)]
+
+    skipped = set()
+    for attr_name in skip or []:
+        long_name = destination.node.attr(attr_name).name.long
+        if long_name:
+            skipped.add(long_name)
+
+    source_children = source.children
+    if not source_children:
+        pairs = [(source, child) for child in destination_children]
+    elif len(source_children) == len(destination_children):
+        pairs = list(zip(source_children, destination_children))
+    else:
+        return [(source, destination)]
+    return [
+        (source_child, destination_child)
+        for source_child, destination_child in pairs
+        if destination_child.name.long not in skipped
+    ]
+
+
+def connect_all(connections, **kwargs):
+    """Connect the given [(source, destination), ...] Attributes.
+
+    With OpenMaya, several connections are made by a single modifier.
+    force and force_lock default to FORCE_CONNECTION and FORCE_LOCK.
+    """
+    force = kwargs.get("force", FORCE_CONNECTION)
+    force_lock = kwargs.get("force_lock", FORCE_LOCK)
+    if len(connections) > 1 and om is not None and pyrig.session.current() is None:
+        with pr.edit_session("pyrig_connect"):
+            return connect_all(connections, force=force, force_lock=force_lock)
+
+    session = pyrig.session.current()
+    for source, destination in connections:
+        destination._force_lock(store=force_lock)
+        if session is not None:
+            session.connect(source.plug, destination.plug, force=force)
+        else:
+            cmds.connectAttr(source.plug, destination.plug, f=force)
+        destination._force_lock(restore=force_lock)
+
+
+def set_flags(attribute, **flags):
+    """Set cmds.setAttr flags like keyable or channelBox, queued in a session."""
+    session = pyrig.session.current()
+    if session is not None:
+        session.set_flags(attribute.plug, **flags)
+    else:
+        cmds.setAttr(attribute.plug, **flags)
+
+
+def _as_attribute(attribute):
+    """Return the Attribute of the given "node.attr" string."""
+    if isinstance(attribute, Attribute):
+        return attribute
+    retrieved = pr.get(attribute)
+    if not isinstance(retrieved, Attribute):
+        raise RuntimeError("No object matches name: {}".format(attribute))
+    return retrieved
+
+
 class Attribute(object):
     """"""
 
@@ -57,10 +206,10 @@ class Attribute(object):
     def __getitem__(self, key):
         """Enables Attribute[str/int]"""
         if isinstance(key, six.string_types):
-            return Attribute(self.node, "{}.{}".format(self.attr, key))
+            return self.__class__(self.node, "{}.{}".format(self.attr, key))
         elif isinstance(key, int):
             key = self.get_next_available_index() if key == -1 else key
-            return Attribute(self.node, "{}[{}]".format(self.attr, key))
+            return self.__class__(self.node, "{}[{}]".format(self.attr, key))
 
     # Properties
     @property
@@ -86,7 +235,15 @@ class Attribute(object):
     def type(self):
         """"""
         try:
-            return cmds.getAttr(self.plug, typ=True)
+            # typed and generic attributes hold a data type per node
+            per_node = self._attribute_query(attributeType=True)
+            return pyrig.schema.SCHEMA.query(
+                self.node,
+                self.name[-1].unindexed(),
+                ("type", self.name.index is not None),
+                lambda: cmds.getAttr(self.plug, typ=True),
+                per_node=per_node in PER_NODE_ATTRIBUTE_TYPES,
+            )
         except:
             return "unknown"
 
@@ -116,14 +273,22 @@ class Attribute(object):
     @default.setter
     def default(self, val):
         cmds.addAttr(self.plug, e=True, dv=val)
+        self._invalidate_schema()
 
     @property
     def lock(self):
         """"""
+        queued = self._get_queued_lock()
+        if queued is not None:
+            return queued
         return cmds.getAttr(self.plug, l=True)
 
     @lock.setter
     def lock(self, val):
+        session = pyrig.session.current()
+        if session is not None:
+            session.set_lock(self.plug, val)
+            return
         cmds.setAttr(self.plug, l=val)
 
     @property
@@ -162,6 +327,7 @@ class Attribute(object):
     @min.setter
     def min(self, val):
         cmds.addAttr(self.plug, e=True, min=val)
+        self._invalidate_schema()
 
     @property
     def max(self):
@@ -173,6 +339,7 @@ class Attribute(object):
     @max.setter
     def max(self, val):
         cmds.addAttr(self.plug, e=True, max=val)
+        self._invalidate_schema()
 
     @property
     def input(self):
@@ -200,13 +367,13 @@ class Attribute(object):
     def parent(self):
         """"""
         if self.name.index is not None:
-            return pr.get("{}.{}".format(self.node, self.name.unindexed()))
+            return self.__class__(self.node, self.name.unindexed())
 
         parent_attr_name = self._attribute_query(listParent=True)
         if not parent_attr_name:
             return None
         
-        return pr.get("{}.{}".format(self.node, parent_attr_name[0]))
+        return self.__class__(self.node, parent_attr_name[0])
 
     @property
     def children(self):
@@ -214,13 +381,18 @@ class Attribute(object):
         children = self._attribute_query(listChildren=True)
         if not children:
             return None
-        children_attr = ["{}.{}".format(self.attr, child) for child in children]
-        return [pr.get("{}.{}".format(self.node, child)) for child in children_attr]
+        return [
+            self.__class__(self.node, "{}.{}".format(self.attr, child))
+            for child in children
+        ]
 
     # Properties - multi-attr
     @property
     def valid_indices(self):
-        """"""
+        """Existing indices, cached by the current session if any."""
+        session = pyrig.session.current()
+        if session is not None:
+            return session.multi_indices(self.plug)
         return cmds.getAttr(self.plug, multiIndices=True) or []
     
     @property
@@ -252,6 +424,10 @@ class Attribute(object):
     # Methods
     def exists(self):
         """"""
+        if self.name.index is None and pyrig.schema.SCHEMA.has_static(
+            self.node, self.name[-1].unindexed()
+        ):
+            return True
         return self._attribute_query(unindexed=False, exists=True)
     
     def create(self, **kwargs):
@@ -279,12 +455,18 @@ class Attribute(object):
             properties["keyable"] = True
 
         cmds.addAttr(str(self.node), ln=self.attr, **properties)
+        self._invalidate_schema()
 
         for name, value in flags.items():
             setattr(self, name, value)
 
         return self
 
+    def delete(self):
+        """Delete the dynamic attribute."""
+        cmds.deleteAttr(self.plug)
+        self._invalidate_schema()
+
     def set_value(self, value, format=None, **kwargs):
         """"""
         force_lock = kwargs.get("force_lock", FORCE_LOCK)
@@ -297,45 +479,26 @@ class Attribute(object):
 
         self._force_lock(store=force_lock)
 
-        # openMaya cls
-        if isinstance(value, (om.MMatrix, om.MVector)):
-            value = list(value)
-        elif isinstance(value, (om.MPoint)):
-            value = list(value)[:-1]
-        # Simple
-        if isinstance(value, (int, float, bool)):
-            cmds.setAttr(self.plug, value)
-        # String
-        elif isinstance(value, (str, six.text_type)):
-            cmds.setAttr(self.plug, value, type="string")
-        # Matrix_list/Float3
-        elif isinstance(value, (list, tuple)):
-            if len(value) == 16:  # matrix
-                cmds.setAttr(self.plug, *value, type="matrix")
-            if len(value) == 3:  # vector
-                cmds.setAttr(self.plug, *value, type="float3")
+        value = prepare_value(value)
+        session = pyrig.session.current()
+        if session is None or not session.set_value(self.plug, value):
+            self._set_attr(value)
 
         self._force_lock(restore=force_lock)
     
     def get_value(self, format=None):
         """"""
+        self._sync()
         value = cmds.getAttr(self.plug, silent=True)
 
         if format:
             value = self._data_format(value, format, loads=True)
 
-        if isinstance(value, list):
-            if len(value) == 1:
-                # remove "list in list" (eg. node[translate].value)
-                value = value[0]
-            if len(value) == 16:
-                # matrix class
-                value = pr.Types.Mat44(value)
-
-        return value
+        return convert_value(value)
     
     def get_input(self):
         """"""
+        self._sync()
         input_ = cmds.listConnections(self.plug, s=True, d=False, p=True)
         return pr.get(input_[0]) if input_ else None
     
@@ -343,7 +506,7 @@ class Attribute(object):
         """"""
         force_lock = kwargs.get("force_lock", FORCE_LOCK)
         force_connection = kwargs.get("force_co", FORCE_CONNECTION)
-        connect_leaf = kwargs.get("chidren_co", CONNECT_LEAF)
+        connect_leaf = kwargs.get("connect_leaf", CONNECT_LEAF)
         skip = kwargs.get("skip", [])
 
         if plug is None:
@@ -352,35 +515,18 @@ class Attribute(object):
         
         if not isinstance(plug, Attribute):
             plug = pr.get(plug)
-        
-        if connect_leaf:
-            if self.children:
-                attr_to_skip = []
-                for attr in [Attribute(self, attr) for attr in skip]:
-                    if attr.exists():
-                        attr_to_skip.append(attr.name.long)
-                if not plug.children:
-                    for destination_child in self.children:
-                        if not destination_child in attr_to_skip:
-                            destination_child.set_input(plug, **kwargs)
-                    return
-                else:
-                    if len(self.children) == len(plug.children):
-                        for destination_child, source_child in zip(
-                            self.children, plug.children
-                        ):
-                            if not destination_child.attr in attr_to_skip:
-                                destination_child.set_input(source_child, **kwargs)
-                        return
 
-        self._force_lock(store=force_lock)
-        cmds.connectAttr(plug.plug, self.plug, f=force_connection)
-        self._force_lock(restore=force_lock)
+        if connect_leaf:
+            connections = plan_connections(plug, self, skip=skip)
+        else:
+            connections = [(plug, self)]
+        connect_all(connections, force=force_connection, force_lock=force_lock)
 
     def get_outputs(self):
         """"""
+        self._sync()
         outputs = cmds.listConnections(self.plug, s=False, d=True, p=True)
-        return [pr.get(x) for x in outputs or []]
+        return pr.get_many(outputs or [])
 
     def connect(self, plug, **kwargs):
         """"""
@@ -393,6 +539,7 @@ class Attribute(object):
         if plug:
             if not isinstance(plug, Attribute):
                 plug = pr.get(plug)
+            self._sync()
             if cmds.isConnected(self.plug, str(plug)):
                 plug.break_connections(input=True, output=False, **kwargs)
             return
@@ -404,9 +551,14 @@ class Attribute(object):
         force_lock = kwargs.get("force_lock", FORCE_LOCK)
         if input is True:
             self._force_lock(store=force_lock)
+            self._sync()
             plugs = cmds.listConnections(self.plug, s=True, d=False, p=True)
             if plugs:
-                cmds.disconnectAttr(plugs[0], self.plug)
+                session = pyrig.session.current()
+                if session is not None:
+                    session.disconnect(plugs[0], self.plug)
+                else:
+                    cmds.disconnectAttr(plugs[0], self.plug)
             self._force_lock(restore=force_lock)
 
         if output is True:
@@ -418,14 +570,17 @@ class Attribute(object):
         if not isinstance(plug, Attribute):
             plug = pr.get(plug)
 
-        plug.shift(recursive=True, **kwargs)
+        plug.shift(**kwargs)
         self.connect(plug, **kwargs)
 
-    def shift(self, **kwargs):
-        """"""
+    def shift(self, count=1, **kwargs):
+        """Move this element and the following ones count indices up.
+
+        The following elements are only moved until enough free indices
+        absorb the shift.
+        """
         if self.name.index is not None:
-            valid_indices = self.parent.valid_indices
-            self._move_to_next_index(valid_indices=valid_indices, **kwargs)
+            self.parent._shift_elements(self.name.index, count, **kwargs)
 
     def reset(self, **kwargs):
         """"""
@@ -440,23 +595,168 @@ class Attribute(object):
     # Methods - multi-attr
     def is_multi(self):
         """"""
+        if self.name.index is not None:
+            return False
         try:
-            self._attribute_query(unindexed=False, multi=True)
+            return bool(self._attribute_query(multi=True))
         except:
             return False
 
     def get_next_available_index(self):
-        """"""
-        for i, multi_index in enumerate(self.valid_indices):
-            if i != multi_index:
-                return i
-        return len(self.valid_indices)
+        """Return the first free index of the multi."""
+        valid_indices = self.valid_indices
+        # the indices are sorted and unique, index i is used by i or more
+        low, high = 0, len(valid_indices)
+        while low < high:
+            middle = (low + high) // 2
+            if valid_indices[middle] == middle:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def get_available_indices(self, count):
+        """Return the count first free indices of the multi."""
+        used = set(self.valid_indices)
+        indices = []
+        index = 0
+        while len(indices) < count:
+            if index not in used:
+                indices.append(index)
+            index += 1
+        return indices
+
+    def append(self, plugs, **kwargs):
+        """Connect the given plugs to the first free indices of the multi.
+
+        Returns the connected elements.
+        """
+        plugs = list(plugs)
+        elements = [self[i] for i in self.get_available_indices(len(plugs))]
+        for element, plug in zip(elements, plugs):
+            element.set_input(plug, **kwargs)
+        return elements
+
+    def insert_at(self, index, plugs, **kwargs):
+        """Connect the given plugs from index, the elements there are shifted.
+
+        Returns the connected elements.
+        """
+        plugs = list(plugs)
+        self._shift_elements(index, len(plugs), **kwargs)
+        elements = [self[index + i] for i in range(len(plugs))]
+        for element, plug in zip(elements, plugs):
+            element.set_input(plug, **kwargs)
+        return elements
+
+    def remove(self, indices, **kwargs):
+        """Remove the given elements of the multi, breaking their connections."""
+        force_lock = kwargs.get("force_lock", FORCE_LOCK)
+        session = pyrig.session.current()
+        for index in indices:
+            element = self[index]
+            if force_lock and element.lock:
+                element.lock = False
+            if session is not None:
+                session.remove_multi_instance(element.plug)
+            else:
+                cmds.removeMultiInstance(element.plug, b=True)
+
+    def compact(self, **kwargs):
+        """Move the elements of the multi to the indices 0 to size - 1."""
+        moves = [
+            (index, i) for i, index in enumerate(self.valid_indices) if index != i
+        ]
+        self._move_elements(moves, **kwargs)
 
     # Internal Methods
+    def _set_attr(self, value):
+        """Set the given value with cmds.setAttr."""
+        arguments = self._set_attr_arguments(value)
+        if arguments is None:
+            LOG.warning(
+                "Can't set '{}' to {!r}, unsupported value type.".format(
+                    self.plug, value
+                )
+            )
+            return
+        args, kwargs = arguments
+        cmds.setAttr(self.plug, *args, **kwargs)
+
+    def _set_attr_arguments(self, value):
+        """Return the cmds.setAttr (args, kwargs) setting the given value.
+
+        Returns None when the value type is not supported.
+        """
+        # Simple
+        if isinstance(value, (int, float, bool)):
+            return [value], {}
+        # String/Enum name
+        if isinstance(value, six.string_types):
+            if self.type == "enum":
+                return [self._enum_index(value)], {}
+            return [value], {"type": "string"}
+        if not isinstance(value, (list, tuple)):
+            return None
+        # Array/Compound/Matrix
+        attr_type = self.type
+        if attr_type in ARRAY_DATA_TYPES:
+            return [list(value)], {"type": attr_type}
+        if attr_type in NUMERIC_COMPOUND_TYPES:
+            return list(value), {}
+        if len(value) == 16:  # matrix
+            return list(value), {"type": "matrix"}
+        if len(value) == 3:  # vector
+            return list(value), {"type": "float3"}
+        return None
+
+    def _enum_index(self, name):
+        """Return the value of the given enum field name."""
+        index = 0
+        for field in self.enums or []:
+            field_name, _, field_value = field.partition("=")
+            if field_value:
+                index = int(field_value)
+            if field_name == name:
+                return index
+            index += 1
+        raise ValueError(
+            "'{}' is not a field of '{}', fields : {}".format(
+                name, self.plug, self.enums
+            )
+        )
+
+    def _sync(self):
+        """Execute the edits queued by the current session, if any."""
+        session = pyrig.session.current()
+        if session is not None:
+            session.flush()
+
+    def _get_queued_lock(self):
+        """Return the lock state queued by the current session, if any."""
+        session = pyrig.session.current()
+        if session is None:
+            return None
+        return session.get_lock(self.plug)
+
     def _attribute_query(self, unindexed=True, **kwargs):
-        """"""
+        """Query the attribute, unindexed queries are cached by the schema."""
         attr_name = self.name[-1].unindexed() if unindexed else str(self.name[-1])
-        return cmds.attributeQuery(attr_name, node=str(self.node), **kwargs)
+        def query():
+            # the node name is only resolved when not cached
+            return cmds.attributeQuery(attr_name, node=str(self.node), **kwargs)
+
+        if not unindexed or "exists" in kwargs:
+            return query()
+        return pyrig.schema.SCHEMA.query(
+            self.node, attr_name, tuple(sorted(kwargs.items())), query
+        )
+
+    def _invalidate_schema(self):
+        """Forget the cached metadata after an edit of the attribute."""
+        uuid = getattr(self.node, "uuid", None)
+        if uuid is not None:
+            pyrig.schema.SCHEMA.invalidate(uuid, self.name[-1].unindexed())
 
     def _force_lock(self, store=False, restore=False):
         """"""
@@ -468,27 +768,120 @@ class Attribute(object):
             if self._locked:
                 self.lock = True
 
-    def _move_to_next_index(self, **kwargs):
-        """Recursive."""
-        valid_indices = kwargs.get("valid_indices", None)
-        recursive = kwargs.get("recursive", True)
+    def _shift_elements(self, index, count, **kwargs):
+        """Move the elements from index count indices up, in one pass."""
+        moves = []
+        next_free = index + count
+        for multi_index in self.valid_indices:
+            if multi_index < index:
+                continue
+            if multi_index >= next_free:
+                break
+            moves.append((multi_index, next_free))
+            next_free += 1
+        self._move_elements(moves, **kwargs)
+
+    def _move_elements(self, moves, **kwargs):
+        """Move the elements of the multi, [(old index, new index), ...].
+
+        The inputs, values and lock states of every element are read
+        first, the old elements are removed then written at their new
+        index, so the order of the moves does not matter. The values are
+        kept per child for the partially connected compound elements.
+        Locked elements are only moved with force_lock.
+        """
+        force_lock = kwargs.get("force_lock", FORCE_LOCK)
+        if not moves:
+            return
 
-        next_index = self.name.index + 1
-        next_plug = Attribute(
-            self.node, "{}[{}]".format(
-                self.name.unindexed(), next_index
+        inputs = self._element_inputs()
+        states = []
+        for old_index, new_index in moves:
+            element = self[old_index]
+            locked = element.lock
+            if locked and not force_lock:
+                raise RuntimeError(
+                    "'{}' is locked and can't be moved.".format(element.plug)
+                )
+            element_inputs = inputs.get(old_index, [])
+            values = self._unconnected_values(
+                element, [suffix for suffix, _ in element_inputs]
             )
-        )
+            states.append((new_index, element_inputs, values, locked))
+
+        self.remove([old_index for old_index, _ in moves], force_lock=True)
+
+        session = pyrig.session.current()
+        for new_index, element_inputs, values, locked in states:
+            element = self[new_index]
+            for suffix, value in values:
+                if value is None:
+                    continue
+                if suffix:
+                    self.__class__(
+                        self.node, "{}{}".format(element.attr, suffix)
+                    ).set_value(value)
+                else:
+                    element.set_value(value)
+            for suffix, source in element_inputs:
+                destination = "{}{}".format(element.plug, suffix)
+                if session is not None:
+                    session.connect(source, destination)
+                else:
+                    cmds.connectAttr(source, destination, f=True)
+            if locked:
+                element.lock = True
 
-        if next_index in valid_indices:
-            if recursive:
-                next_plug._move_to_next_index(**kwargs)
+    @staticmethod
+    def _unconnected_values(element, connected):
+        """Return [(path under the element, value), ...] of an element.
 
-        next_plug.set_value(self.value, **kwargs)
-        next_plug.set_input(self.input, **kwargs)
-        next_plug.lock = self.lock
-        
-        self.reset(**kwargs)
+        The whole element is read in one query when nothing under it is
+        connected, otherwise its children are read down to the leaves
+        without input.
+        """
+        if "" in connected:
+            return []
+        if not connected:
+            return [("", element.get_value())]
+        values = []
+        plug = element.plug
+        attributes = list(element.children or [])
+        while attributes:
+            attribute = attributes.pop(0)
+            suffix = attribute.plug[len(plug):]
+            if suffix in connected:
+                continue
+            if not any(
+                each.startswith(suffix + ".") or each.startswith(suffix + "[")
+                for each in connected
+            ):
+                values.append((suffix, attribute.get_value()))
+            else:
+                attributes.extend(attribute.children or [])
+        return values
+
+    def _element_inputs(self):
+        """Return the inputs of the elements in one query.
+
+        {index: [(path under the element, source plug), ...]}
+        """
+        self._sync()
+        connections = cmds.listConnections(
+            self.plug, s=True, d=False, p=True, c=True
+        ) or []
+        depth = self.plug.count("[")
+        inputs = {}
+        for destination, source in zip(connections[::2], connections[1::2]):
+            attr_name = destination.split(".", 1)[-1]
+            matches = list(re.finditer(r"\[(\d+)\]", attr_name))
+            if len(matches) <= depth:
+                continue
+            match = matches[depth]
+            inputs.setdefault(int(match.group(1)), []).append(
+                (attr_name[match.end():], source)
+            )
+        return inputs
 
     def _data_format(self, value, format, loads=False):
         """Supported format : json"""
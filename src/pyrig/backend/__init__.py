@@ -0,0 +1,71 @@
+"""Scene backend used by pyrig.
+
+"maya" binds maya.cmds and maya.api.OpenMaya, "memory" binds the pure
+python scene of pyrig.backend.memory, om is None in that case and the
+OpenMaya only features (handle cache, scene callbacks, edit sessions,
+ApiAttribute) are disabled.
+
+Maya is used when it can be imported, PYRIG_BACKEND forces one.
+"""
+import os
+import sys
+
+MAYA = "maya"
+MEMORY = "memory"
+
+# Modules implementing OpenMaya types, their om global is never rebound.
+NATIVE_MODULES = ("pyrig.dataType", "pyrig.plugins")
+
+
+def _load(backend):
+    """Return the cmds and om objects of the given backend."""
+    if backend == MAYA:
+        from maya import cmds
+        import maya.api.OpenMaya as om
+
+        return cmds, om
+    if backend == MEMORY:
+        from pyrig.backend import memory
+
+        return memory, None
+    raise ValueError("'{}' is not a valid pyrig backend.".format(backend))
+
+
+def _default():
+    """Return the backend forced by PYRIG_BACKEND, else the available one."""
+    backend = os.environ.get("PYRIG_BACKEND", "")
+    if backend:
+        return backend
+    try:
+        import maya.cmds
+        import maya.api.OpenMaya
+    except ImportError:
+        return MEMORY
+    return MAYA
+
+
+BACKEND = _default()
+cmds, om = _load(BACKEND)
+
+
+def use(backend):
+    """Switch the backend of the loaded pyrig modules.
+
+    The cmds and om globals of the pyrig modules imported from this one are
+    rebound, caches holding scene state should be cleared by the caller.
+    """
+    global BACKEND, cmds, om
+
+    new_cmds, new_om = _load(backend)
+    missing = object()
+    for name, module in list(sys.modules.items()):
+        if module is None or not name.startswith("pyrig."):
+            continue
+        if name == __name__ or name.startswith(NATIVE_MODULES):
+            continue
+        if module.__dict__.get("cmds", missing) is cmds:
+            module.cmds = new_cmds
+        if module.__dict__.get("om", missing) is om:
+            module.om = new_om
+
+    BACKEND, cmds, om = backend, new_cmds, new_om
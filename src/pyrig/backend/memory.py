@@ -0,0 +1,1721 @@
+"""Pure python stand-in of the maya.cmds subset used by pyrig.
+
+The scene holds nodes, uuids, the DAG hierarchy, static and dynamic
+attributes, multi indices, connections and containers. Transforms, joints
+and the multMatrix, inverseMatrix, decomposeMatrix and composeMatrix nodes
+are evaluated so matrices read back like in Maya, transform pivots and
+rotate axis are stored but ignored by the evaluation. Commands follow the
+maya.cmds signatures and return values, errors are raised as ValueError
+for unknown objects and RuntimeError for invalid edits.
+
+Other node types can be declared with `add_node_type`.
+"""
+import fnmatch
+import logging
+import re
+import uuid as uuid_module
+
+import numpy as np
+
+from pyrig.constants import RotateOrder
+from pyrig.maths import numpy_backend
+
+LOG = logging.getLogger(__name__)
+
+DIGITS = "1234567890"
+ROTATE_ORDERS = "xyz:yzx:zxy:xzy:yxz:zyx"
+IDENTITY = [
+    1.0, 0.0, 0.0, 0.0,
+    0.0, 1.0, 0.0, 0.0,
+    0.0, 0.0, 1.0, 0.0,
+    0.0, 0.0, 0.0, 1.0,
+]
+
+
+# Node types ---
+class AttributeSpec(object):
+    """Definition of an attribute, shared by the nodes of a type."""
+
+    def __init__(
+        self,
+        name,
+        short=None,
+        type_="double",
+        default=None,
+        children=(),
+        multi=False,
+        keyable=False,
+        enums=None,
+        hidden=False,
+        min=None,
+        max=None,
+        nice=None,
+        typed=False,
+    ):
+        """_summary_
+
+        Parameters
+        ----------
+        name : str
+            Long name.
+        short : str, optional
+            Short name, by default the long name.
+        type_ : str, optional
+            Attribute type as returned by getAttr -type.
+            by default "double"
+        default : object, optional
+            Default value, by default the type default.
+        children : list, optional
+            Child AttributeSpec of compounds.
+            by default ()
+        typed : bool, optional
+            Typed attribute, created with a data type.
+            by default False
+        """
+        self.name = name
+        self.short = short or name
+        self.type = type_
+        self.default = default
+        self.children = list(children)
+        self.multi = multi
+        self.keyable = keyable
+        self.enums = enums
+        self.hidden = hidden
+        self.min = min
+        self.max = max
+        self.nice = nice
+        self.typed = typed
+        self.parent = None
+        for child in self.children:
+            child.parent = self
+
+    def __repr__(self):
+        return "{}('{}')".format(self.__class__.__name__, self.name)
+
+    @property
+    def is_compound(self):
+        """"""
+        return bool(self.children)
+
+    def chain(self):
+        """Return the specs from the root compound to this one."""
+        chain = [self]
+        while chain[0].parent is not None:
+            chain.insert(0, chain[0].parent)
+        return chain
+
+    def walk(self):
+        """Yield this spec and its descendants."""
+        yield self
+        for child in self.children:
+            for spec in child.walk():
+                yield spec
+
+    def get_default(self):
+        """"""
+        if self.is_compound:
+            return tuple(child.get_default() for child in self.children)
+        if self.default is not None:
+            return self.default
+        if self.type == "matrix":
+            return list(IDENTITY)
+        if self.type == "string":
+            return None
+        if self.type == "message":
+            return None
+        if self.type == "bool":
+            return False
+        if self.type in ("long", "short", "byte", "enum"):
+            return 0
+        return 0.0
+
+
+def _vector(name, short, suffixes=("X", "Y", "Z"), short_suffixes=None, **kwargs):
+    """Build a double3 like compound spec."""
+    type_ = kwargs.pop("type_", "double")
+    compound_type = kwargs.pop("compound_type", "double3")
+    default = kwargs.pop("default", 0.0)
+    short_suffixes = short_suffixes or [s.lower() for s in suffixes]
+    children = [
+        AttributeSpec(
+            name + suffix,
+            short + short_suffix,
+            type_,
+            default=default,
+            keyable=kwargs.get("keyable", False),
+        )
+        for suffix, short_suffix in zip(suffixes, short_suffixes)
+    ]
+    return AttributeSpec(name, short, compound_type, children=children, **kwargs)
+
+
+def _matrix(name, short, **kwargs):
+    """"""
+    return AttributeSpec(name, short, "matrix", **kwargs)
+
+
+class NodeType(object):
+    """Node type: inherited types, static attributes and evaluation."""
+
+    def __init__(self, name, inherited, attributes=(), compute=None):
+        """_summary_
+
+        Parameters
+        ----------
+        name : str
+            Node type name.
+        inherited : list
+            Inherited node types, from the root type to this one.
+        attributes : list, optional
+            Static AttributeSpec of the type, parent types' included.
+        compute : callable, optional
+            compute(node, spec, indices) returning the value of an output
+            attribute, NotImplemented for the attributes it does not drive.
+        """
+        self.name = name
+        self.inherited = list(inherited)
+        self.attributes = list(attributes)
+        self.compute = compute
+        self.names = {}
+        for attribute in self.attributes:
+            for spec in attribute.walk():
+                self.names.setdefault(spec.name, spec)
+                self.names.setdefault(spec.short, spec)
+
+    @property
+    def is_dag(self):
+        """"""
+        return "dagNode" in self.inherited
+
+    @property
+    def is_shape(self):
+        """"""
+        return "shape" in self.inherited
+
+
+NODE_TYPES = {}
+
+
+def add_node_type(name, inherited, attributes=(), compute=None):
+    """Declare a node type usable by createNode."""
+    NODE_TYPES[name] = NodeType(name, inherited, attributes, compute)
+    return NODE_TYPES[name]
+
+
+def _node_attributes():
+    return [AttributeSpec("message", "msg", "message")]
+
+
+def _dag_attributes():
+    return _node_attributes() + [
+        AttributeSpec("visibility", "v", "bool", default=True, keyable=True),
+        _matrix("matrix", "m"),
+        _matrix("inverseMatrix", "im"),
+        _matrix("worldMatrix", "wm", multi=True),
+        _matrix("worldInverseMatrix", "wim", multi=True),
+        _matrix("parentMatrix", "pm", multi=True),
+        _matrix("parentInverseMatrix", "pim", multi=True),
+        _matrix("offsetParentMatrix", "opm"),
+    ]
+
+
+def _transform_attributes():
+    return _dag_attributes() + [
+        _vector("translate", "t", type_="doubleLinear", keyable=True),
+        _vector("rotate", "r", type_="doubleAngle", keyable=True),
+        _vector("scale", "s", default=1.0, keyable=True),
+        _vector(
+            "shear",
+            "sh",
+            suffixes=("XY", "XZ", "YZ"),
+            short_suffixes=("xy", "xz", "yz"),
+        ),
+        AttributeSpec("rotateOrder", "ro", "enum", enums=ROTATE_ORDERS),
+        AttributeSpec("inheritsTransform", "it", "bool", default=True),
+        _matrix("xformMatrix", "xm"),
+        # stored but not evaluated
+        _vector("rotatePivot", "rp", type_="doubleLinear"),
+        _vector("scalePivot", "sp", type_="doubleLinear"),
+        _vector("rotateAxis", "ra", type_="doubleAngle"),
+    ]
+
+
+def _joint_attributes():
+    return _transform_attributes() + [
+        _vector("jointOrient", "jo", type_="doubleAngle"),
+        _vector("inverseScale", "is", default=1.0),
+        AttributeSpec("segmentScaleCompensate", "ssc", "bool", default=True),
+        AttributeSpec("radius", "radi", "double", default=1.0, min=0.0),
+    ]
+
+
+def _container_attributes():
+    return _node_attributes() + [
+        AttributeSpec("blackBox", "bbx", "bool"),
+    ]
+
+
+def _compute_transform(node, spec, indices):
+    """Evaluate the matrices of the transform nodes."""
+    name = spec.name
+    if name in ("matrix", "xformMatrix"):
+        return _flat(node.scene.local_matrix(node))
+    if name == "inverseMatrix":
+        return _flat(np.linalg.inv(node.scene.local_matrix(node)))
+    if name == "worldMatrix":
+        return _flat(node.scene.world_matrix(node))
+    if name == "worldInverseMatrix":
+        return _flat(np.linalg.inv(node.scene.world_matrix(node)))
+    if name == "parentMatrix":
+        return _flat(node.scene.parent_matrix(node))
+    if name == "parentInverseMatrix":
+        return _flat(np.linalg.inv(node.scene.parent_matrix(node)))
+    return NotImplemented
+
+
+def _compute_mult_matrix(node, spec, indices):
+    """"""
+    if spec.name != "matrixSum":
+        return NotImplemented
+    result = np.identity(4)
+    for index in node.scene.multi_indices(node, node.type.names["matrixIn"], ()):
+        value = node.scene.get_value(node, node.type.names["matrixIn"], (index,))
+        result = np.matmul(result, _array(value))
+    return _flat(result)
+
+
+def _compute_inverse_matrix(node, spec, indices):
+    """"""
+    if spec.name != "outputMatrix":
+        return NotImplemented
+    value = node.scene.get_value(node, node.type.names["inputMatrix"], ())
+    return _flat(np.linalg.inv(_array(value)))
+
+
+def _compute_decompose_matrix(node, spec, indices):
+    """"""
+    root = spec.chain()[0]
+    if root.name not in (
+        "outputTranslate", "outputRotate", "outputScale", "outputShear", "outputQuat"
+    ):
+        return NotImplemented
+    matrix = _array(node.scene.get_value(node, node.type.names["inputMatrix"], ()))
+    rotate_order = node.scene.get_value(node, node.type.names["inputRotateOrder"], ())
+    translate, rotation, scale, shear = numpy_backend.decompose_arrays(matrix)
+    values = {
+        "outputTranslate": translate,
+        "outputRotate": numpy_backend.from_rotation_matrix(rotation, rotate_order),
+        "outputScale": scale,
+        "outputShear": shear,
+        "outputQuat": numpy_backend.matrix_to_quaternion(rotation),
+    }
+    value = tuple(float(v) for v in values[root.name])
+    if spec is root:
+        return value
+    return value[root.children.index(spec)]
+
+
+def _compute_compose_matrix(node, spec, indices):
+    """"""
+    if spec.name != "outputMatrix":
+        return NotImplemented
+    get = lambda name: node.scene.get_value(node, node.type.names[name], ())
+    if get("useEulerRotation"):
+        rotate = get("inputRotate")
+    else:
+        rotate = get("inputQuat")
+    matrix = numpy_backend.compose_arrays(
+        get("inputTranslate"),
+        rotate,
+        get("inputScale"),
+        get("inputShear"),
+        rotate_order=get("inputRotateOrder"),
+    )
+    return _flat(matrix)
+
+
+add_node_type(
+    "transform",
+    ["containerBase", "entity", "dagNode", "transform"],
+    _transform_attributes(),
+    _compute_transform,
+)
+add_node_type(
+    "joint",
+    ["containerBase", "entity", "dagNode", "transform", "joint"],
+    _joint_attributes(),
+    _compute_transform,
+)
+add_node_type(
+    "dagContainer",
+    ["containerBase", "entity", "dagNode", "transform", "container", "dagContainer"],
+    _transform_attributes() + [AttributeSpec("blackBox", "bbx", "bool")],
+    _compute_transform,
+)
+add_node_type(
+    "container",
+    ["containerBase", "entity", "container"],
+    _container_attributes(),
+)
+add_node_type(
+    "locator",
+    ["containerBase", "entity", "dagNode", "shape", "geometryShape", "locator"],
+    _dag_attributes() + [
+        _vector("localPosition", "lp", type_="doubleLinear"),
+        _vector("localScale", "los", type_="doubleLinear", default=1.0),
+    ],
+    _compute_transform,
+)
+add_node_type(
+    "multMatrix",
+    ["multMatrix"],
+    _node_attributes() + [
+        _matrix("matrixIn", "i", multi=True),
+        _matrix("matrixSum", "o"),
+    ],
+    _compute_mult_matrix,
+)
+add_node_type(
+    "inverseMatrix",
+    ["inverseMatrix"],
+    _node_attributes() + [
+        _matrix("inputMatrix", "imat"),
+        _matrix("outputMatrix", "omat"),
+    ],
+    _compute_inverse_matrix,
+)
+add_node_type(
+    "decomposeMatrix",
+    ["decomposeMatrix"],
+    _node_attributes() + [
+        _matrix("inputMatrix", "imat"),
+        AttributeSpec("inputRotateOrder", "ro", "enum", enums=ROTATE_ORDERS),
+        _vector("outputTranslate", "ot", type_="doubleLinear"),
+        _vector("outputRotate", "or", type_="doubleAngle"),
+        _vector("outputScale", "os"),
+        _vector(
+            "outputShear",
+            "osh",
+            suffixes=("X", "Y", "Z"),
+        ),
+        _vector(
+            "outputQuat",
+            "oq",
+            suffixes=("X", "Y", "Z", "W"),
+            compound_type="double4",
+        ),
+    ],
+    _compute_decompose_matrix,
+)
+add_node_type(
+    "composeMatrix",
+    ["composeMatrix"],
+    _node_attributes() + [
+        _vector("inputTranslate", "it", type_="doubleLinear"),
+        _vector("inputRotate", "ir", type_="doubleAngle"),
+        _vector("inputScale", "is", default=1.0),
+        _vector("inputShear", "ish"),
+        _vector(
+            "inputQuat",
+            "iq",
+            suffixes=("X", "Y", "Z", "W"),
+            compound_type="double4",
+        ),
+        AttributeSpec("inputRotateOrder", "iro", "enum", enums=ROTATE_ORDERS),
+        AttributeSpec("useEulerRotation", "uer", "bool", default=True),
+        _matrix("outputMatrix", "omat"),
+    ],
+    _compute_compose_matrix,
+)
+
+
+# Helpers ---
+def _array(value):
+    """Convert a flat matrix list to a (4, 4) array."""
+    return np.array(value, dtype=np.float64).reshape(4, 4)
+
+
+def _flat(matrix):
+    """Convert a (4, 4) array to a flat list."""
+    return [float(v) for v in np.asarray(matrix).ravel()]
+
+
+def _flag(kwargs, *names, **options):
+    """Return the value of the first given flag found in kwargs."""
+    for name in names:
+        if name in kwargs:
+            return kwargs[name]
+    return options.get("default")
+
+
+def _nice_name(name):
+    """Convert a camelCase attribute name to its nice name."""
+    words = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", name)
+    return words[:1].upper() + words[1:]
+
+
+def _split_token(token):
+    """Split "name[index]" into name and index, index is None if missing."""
+    match = re.match(r"^([^\[\]]+)(?:\[(\d+)\])?$", token)
+    if not match:
+        raise ValueError("No object matches name: {}".format(token))
+    index = match.group(2)
+    return match.group(1), int(index) if index is not None else None
+
+
+# Scene ---
+class Node(object):
+    """Node of the memory scene."""
+
+    def __init__(self, scene, node_type, name):
+        """"""
+        self.scene = scene
+        self.type = node_type
+        self.name = name
+        self.uuid = str(uuid_module.uuid4()).upper()
+        self.parent = None
+        self.children = []
+        self.dynamic = []
+        self.names = {}
+        self.values = {}
+        self.indices = {}
+        self.locks = set()
+        self.keyable = {}
+        self.channel_box = {}
+
+    def __repr__(self):
+        return "{}('{}')".format(self.__class__.__name__, self.name)
+
+    def find(self, name):
+        """Return the spec matching the given long or short name, or None."""
+        spec = self.names.get(name)
+        if spec is None:
+            spec = self.type.names.get(name)
+        return spec
+
+    def is_static(self, spec):
+        """"""
+        return self.type.names.get(spec.name) is spec
+
+    def add(self, spec, parent=None):
+        """Add a dynamic attribute."""
+        if parent is not None:
+            parent.children.append(spec)
+            spec.parent = parent
+        else:
+            self.dynamic.append(spec)
+        for each in spec.walk():
+            self.names[each.name] = each
+            self.names[each.short] = each
+
+    def remove(self, spec):
+        """Remove a dynamic attribute."""
+        if spec.parent is not None:
+            spec.parent.children.remove(spec)
+        else:
+            self.dynamic.remove(spec)
+        for each in spec.walk():
+            self.names.pop(each.name, None)
+            self.names.pop(each.short, None)
+
+
+class Plug(object):
+    """Resolved "node.attribute" string."""
+
+    def __init__(self, node, spec, indices=()):
+        """"""
+        self.node = node
+        self.spec = spec
+        self.indices = tuple(indices)
+
+    def __repr__(self):
+        return "{}('{}')".format(self.__class__.__name__, self.name())
+
+    def __eq__(self, other):
+        return isinstance(other, Plug) and self.key == other.key
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def key(self):
+        """"""
+        return (self.node.uuid, self.spec.name, self.indices)
+
+    @property
+    def is_array(self):
+        """Check if the plug is an unindexed multi attribute."""
+        multi = sum(1 for spec in self.spec.chain() if spec.multi)
+        return multi > len(self.indices)
+
+    @property
+    def parent(self):
+        """Return the compound or array plug holding this one, or None."""
+        if self.spec.multi and not self.is_array:
+            return Plug(self.node, self.spec, self.indices[:-1])
+        if self.spec.parent is None:
+            return None
+        depth = sum(1 for spec in self.spec.parent.chain() if spec.multi)
+        return Plug(self.node, self.spec.parent, self.indices[:depth])
+
+    def child(self, spec):
+        """"""
+        return Plug(self.node, spec, self.indices)
+
+    def element(self, index):
+        """"""
+        return Plug(self.node, self.spec, self.indices + (index,))
+
+    def attribute_name(self, long=True):
+        """Return the attribute path, the leaf only outside of multi compounds."""
+        chain = self.spec.chain()
+        indices = list(self.indices)
+        tokens = []
+        for spec in chain:
+            token = spec.name if long else spec.short
+            if spec.multi and indices:
+                token = "{}[{}]".format(token, indices.pop(0))
+            tokens.append(token)
+        if not any(spec.multi for spec in chain[:-1]):
+            tokens = tokens[-1:]
+        return ".".join(tokens)
+
+    def name(self, long=True):
+        """"""
+        return "{}.{}".format(self.node.name, self.attribute_name(long=long))
+
+
+class Scene(object):
+    """In-memory scene."""
+
+    def __init__(self):
+        """"""
+        self.clear()
+
+    def clear(self):
+        """Empty the scene."""
+        self.nodes = {}
+        self.by_name = {}
+        self.inputs = {}
+        self.outputs = {}
+        self.containers = {}
+        self.current_container = None
+        self.selection = []
+        # prefix: lowest suffix that may be free, see `unique_name`
+        self.suffixes = {}
+        # node uuid: {key: None} of its connected plugs, in connection order
+        self.connected = {}
+
+    # Nodes
+    def node(self, name):
+        """Return the node matching the given name, path or uuid, or None."""
+        name = str(name)
+        if "|" in name:
+            name = name.rstrip("|").split("|")[-1]
+        node = self.by_name.get(name)
+        if node is None:
+            node = self.nodes.get(name)
+        return node
+
+    def get_node(self, name):
+        """Return the node matching the given name, raise if it does not exist."""
+        node = self.node(name)
+        if node is None:
+            raise ValueError("No object matches name: {}".format(name))
+        return node
+
+    def unique_name(self, name, node_type):
+        """Return the given name, or an indexed version of it if it is taken."""
+        if not name:
+            name = "{}1".format(node_type)
+        name = str(name).replace("#", "1")
+        if name not in self.by_name:
+            return name
+        prefix = name.rstrip(DIGITS) or node_type
+        index = self.suffixes.get(prefix, 1)
+        while "{}{}".format(prefix, index) in self.by_name:
+            index += 1
+        # every suffix below the returned one is taken
+        self.suffixes[prefix] = index + 1
+        return "{}{}".format(prefix, index)
+
+    def _release_name(self, name):
+        """Let `unique_name` reuse the suffix of a name that is freed."""
+        prefix = name.rstrip(DIGITS)
+        digits = name[len(prefix):]
+        if not prefix or not digits or digits.startswith("0"):
+            return
+        if int(digits) < self.suffixes.get(prefix, 1):
+            self.suffixes[prefix] = int(digits)
+
+    def create(self, node_type, name=None, parent=None):
+        """"""
+        if node_type not in NODE_TYPES:
+            raise RuntimeError("Unknown object type: {}".format(node_type))
+        node_type = NODE_TYPES[node_type]
+        if parent is not None and not node_type.is_dag:
+            raise RuntimeError(
+                "'{}' is not a DAG node type, it can't be parented.".format(
+                    node_type.name
+                )
+            )
+
+        if node_type.is_shape and parent is None:
+            parent = self.create("transform", "{}1".format(node_type.name))
+
+        node = Node(self, node_type, self.unique_name(name, node_type.name))
+        self.nodes[node.uuid] = node
+        self.by_name[node.name] = node
+        if parent is not None:
+            if not isinstance(parent, Node):
+                parent = self.get_node(parent)
+            self.reparent(node, parent)
+        if self.current_container is not None and node is not self.current_container:
+            self.containers[self.current_container.uuid].append(node)
+        return node
+
+    def rename(self, node, name):
+        """"""
+        del self.by_name[node.name]
+        self._release_name(node.name)
+        node.name = self.unique_name(name, node.type.name)
+        self.by_name[node.name] = node
+        return node.name
+
+    def delete(self, node):
+        """Delete the node and its DAG children."""
+        if node.uuid not in self.nodes:
+            return
+        for child in list(node.children):
+            self.delete(child)
+        if node.parent is not None:
+            node.parent.children.remove(node)
+
+        for key in list(self.connected.get(node.uuid, ())):
+            if key in self.inputs:
+                self.disconnect(self.inputs[key], self._plug_from_key(key))
+            for destination in list(self.outputs.get(key, ())):
+                self.disconnect(self._plug_from_key(key), destination)
+        self.connected.pop(node.uuid, None)
+        for members in self.containers.values():
+            if node in members:
+                members.remove(node)
+        self.containers.pop(node.uuid, None)
+        if self.current_container is node:
+            self.current_container = None
+        if node in self.selection:
+            self.selection.remove(node)
+
+        del self.nodes[node.uuid]
+        del self.by_name[node.name]
+        self._release_name(node.name)
+
+    def reparent(self, node, parent):
+        """"""
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        node.parent = parent
+        if parent is not None:
+            parent.children.append(node)
+
+    def descendants(self, node):
+        """"""
+        result = []
+        for child in node.children:
+            result.append(child)
+            result.extend(self.descendants(child))
+        return result
+
+    # Plugs
+    def plug(self, name):
+        """Resolve the given "node.attribute" string, raise if it does not exist."""
+        name = str(name)
+        node_name, _, attr = name.partition(".")
+        node = self.get_node(node_name)
+        if not attr:
+            raise ValueError("No object matches name: {}".format(name))
+
+        spec = None
+        indices = []
+        for token in attr.split("."):
+            attr_name, index = _split_token(token)
+            if spec is None:
+                child = node.find(attr_name)
+            else:
+                child = next(
+                    (
+                        each for each in spec.children
+                        if attr_name in (each.name, each.short)
+                    ),
+                    None,
+                )
+            if child is None:
+                raise ValueError("No object matches name: {}".format(name))
+            spec = child
+            if index is not None:
+                if not spec.multi:
+                    raise ValueError("No object matches name: {}".format(name))
+                indices.append(index)
+        return Plug(node, spec, indices)
+
+    def find_plug(self, name):
+        """Same as `plug`, returns None if the plug does not exist."""
+        try:
+            return self.plug(name)
+        except ValueError:
+            return None
+
+    def _plug_from_key(self, key):
+        """"""
+        node = self.nodes[key[0]]
+        return Plug(node, node.find(key[1]), key[2])
+
+    def multi_indices(self, node, spec, indices):
+        """Return the existing indices of the given array."""
+        return sorted(node.indices.get((spec.name, tuple(indices)), ()))
+
+    def _touch(self, plug):
+        """Register the multi indices of the given plug."""
+        depth = 0
+        for spec in plug.spec.chain():
+            if spec.multi and depth < len(plug.indices):
+                key = (spec.name, plug.indices[:depth])
+                plug.node.indices.setdefault(key, set()).add(plug.indices[depth])
+                depth += 1
+
+    # Values
+    def get_value(self, node, spec, indices):
+        """Return the evaluated value of the given plug."""
+        plug = Plug(node, spec, indices)
+        source = self.inputs.get(plug.key)
+        if source is not None:
+            return self.get_value(source.node, source.spec, source.indices)
+
+        parent = plug.parent
+        while parent is not None:
+            source = self.inputs.get(parent.key)
+            if source is not None:
+                value = self.get_value(source.node, source.spec, source.indices)
+                return self._pick(value, parent.spec, plug)
+            parent = parent.parent
+
+        if node.type.compute is not None:
+            value = node.type.compute(node, spec, indices)
+            if value is not NotImplemented:
+                return value
+
+        if plug.is_array:
+            return [
+                self.get_value(node, spec, plug.indices + (index,))
+                for index in self.multi_indices(node, spec, plug.indices)
+            ]
+        if spec.is_compound:
+            return tuple(
+                self.get_value(node, child, indices) for child in spec.children
+            )
+        return node.values.get(plug.key, spec.get_default())
+
+    def _pick(self, value, parent_spec, plug):
+        """Extract the value of plug from the value of one of its parents."""
+        chain = plug.spec.chain()
+        for spec in chain[chain.index(parent_spec) + 1:]:
+            if not isinstance(value, (list, tuple)):
+                return value
+            value = value[spec.parent.children.index(spec)]
+        return value
+
+    def set_value(self, plug, value):
+        """"""
+        if plug.spec.is_compound:
+            if not isinstance(value, (list, tuple)):
+                value = [value] * len(plug.spec.children)
+            for child, child_value in zip(plug.spec.children, value):
+                self.set_value(plug.child(child), child_value)
+            return
+        if plug.spec.type in ("double", "doubleLinear", "doubleAngle", "float"):
+            value = float(value)
+        elif plug.spec.type in ("long", "short", "byte", "enum"):
+            value = int(value)
+        elif plug.spec.type == "bool":
+            value = bool(value)
+        elif plug.spec.type == "matrix":
+            value = [float(v) for v in value]
+        plug.node.values[plug.key] = value
+        self._touch(plug)
+
+    # Connections
+    def connect(self, source, destination):
+        """"""
+        self.inputs[destination.key] = source
+        self.outputs.setdefault(source.key, []).append(destination)
+        self.connected.setdefault(source.node.uuid, {})[source.key] = None
+        self.connected.setdefault(destination.node.uuid, {})[destination.key] = None
+        self._touch(source)
+        self._touch(destination)
+
+    def disconnect(self, source, destination):
+        """"""
+        if self.inputs.get(destination.key) != source:
+            raise RuntimeError(
+                "There is no connection from '{}' to '{}' to disconnect.".format(
+                    source.name(), destination.name()
+                )
+            )
+        del self.inputs[destination.key]
+        self._unindex(destination.key)
+        self.outputs[source.key].remove(destination)
+        if not self.outputs[source.key]:
+            del self.outputs[source.key]
+            self._unindex(source.key)
+
+    def _unindex(self, key):
+        """Drop a plug key from the connected keys, unless still connected."""
+        if key in self.inputs or key in self.outputs:
+            return
+        self.connected.get(key[0], {}).pop(key, None)
+
+    def sub_plugs(self, plug):
+        """Return the connected plugs under the given array plug."""
+        specs = list(plug.spec.walk())
+        depth = len(plug.indices)
+        plugs = set()
+        for key in self.connected.get(plug.node.uuid, ()):
+            if len(key[2]) <= depth:
+                continue
+            if key[2][:depth] != plug.indices:
+                continue
+            candidate = self._plug_from_key(key)
+            if candidate.spec in specs:
+                plugs.add(candidate)
+        return sorted(plugs, key=lambda each: (each.indices, each.spec.name))
+
+    def remove_element(self, plug, break_connections=False):
+        """Remove the given element of an array and its values."""
+        node = plug.node
+        specs = list(plug.spec.walk())
+        depth = len(plug.indices)
+
+        def is_under(key):
+            if key[0] != node.uuid or key[2][:depth] != plug.indices:
+                return False
+            return node.find(key[1]) in specs
+
+        for key, source in list(self.inputs.items()):
+            destination = self._plug_from_key(key)
+            if is_under(key):
+                if not break_connections:
+                    raise RuntimeError(
+                        "'{}' is connected, use the break flag.".format(plug.name())
+                    )
+                self.disconnect(source, destination)
+        for key, destinations in list(self.outputs.items()):
+            if is_under(key):
+                if not break_connections:
+                    raise RuntimeError(
+                        "'{}' is connected, use the break flag.".format(plug.name())
+                    )
+                for destination in list(destinations):
+                    self.disconnect(self._plug_from_key(key), destination)
+
+        for key in [key for key in node.values if is_under(key)]:
+            del node.values[key]
+        node.locks = set(key for key in node.locks if not is_under(key))
+        for name, indices in list(node.indices):
+            spec = node.find(name)
+            if spec not in specs:
+                continue
+            if indices == plug.indices[:-1] and spec is plug.spec:
+                node.indices[(name, indices)].discard(plug.indices[-1])
+            elif indices[:depth] == plug.indices:
+                del node.indices[(name, indices)]
+
+    def node_plugs(self, node):
+        """Return the connected plugs of the given node."""
+        keys = self.connected.get(node.uuid, ())
+        plugs = [self._plug_from_key(key) for key in keys if key in self.inputs]
+        plugs += [self._plug_from_key(key) for key in keys if key in self.outputs]
+        return plugs
+
+    # Transforms
+    def local_matrix(self, node):
+        """Return the local matrix of the given DAG node."""
+        if "transform" not in node.type.inherited:
+            return np.identity(4)
+        get = lambda name: self.get_value(node, node.type.names[name], ())
+        scale = np.array(get("scale"))
+        rotation = numpy_backend.to_rotation_matrix(
+            get("rotate"), get("rotateOrder")
+        )
+        upper = numpy_backend.compose_rotation_arrays(
+            (0, 0, 0), rotation, scale, get("shear")
+        )[:3, :3]
+
+        if node.type.name == "joint":
+            upper = np.matmul(
+                upper, numpy_backend.to_rotation_matrix(get("jointOrient"))
+            )
+            if get("segmentScaleCompensate"):
+                inverse_scale = np.array(get("inverseScale"))
+                upper = np.matmul(
+                    upper, np.diag(1.0 / np.where(inverse_scale, inverse_scale, 1.0))
+                )
+
+        matrix = np.identity(4)
+        matrix[:3, :3] = upper
+        matrix[3, :3] = get("translate")
+        return matrix
+
+    def parent_matrix(self, node):
+        """Return the world matrix of the parent of the given DAG node."""
+        if node.parent is None:
+            return np.identity(4)
+        return self.world_matrix(node.parent)
+
+    def world_matrix(self, node):
+        """"""
+        matrix = self.local_matrix(node)
+        offset = node.type.names.get("offsetParentMatrix")
+        if offset is not None:
+            matrix = np.matmul(matrix, _array(self.get_value(node, offset, ())))
+        inherits = node.type.names.get("inheritsTransform")
+        if inherits is None or self.get_value(node, inherits, ()):
+            matrix = np.matmul(matrix, self.parent_matrix(node))
+        return matrix
+
+    def set_world_matrix(self, node, matrix):
+        """Set the transform channels so the node matches the given matrix."""
+        parent = np.identity(4)
+        offset = node.type.names.get("offsetParentMatrix")
+        if offset is not None:
+            parent = _array(self.get_value(node, offset, ()))
+        inherits = node.type.names.get("inheritsTransform")
+        if inherits is None or self.get_value(node, inherits, ()):
+            parent = np.matmul(parent, self.parent_matrix(node))
+        self.set_local_matrix(node, np.matmul(_array(matrix), np.linalg.inv(parent)))
+
+    def set_local_matrix(self, node, matrix):
+        """"""
+        if "transform" not in node.type.inherited:
+            return
+        get = lambda name: self.get_value(node, node.type.names[name], ())
+        matrix = np.array(_array(matrix))
+        if node.type.name == "joint":
+            if get("segmentScaleCompensate"):
+                matrix[:3, :3] = np.matmul(matrix[:3, :3], np.diag(get("inverseScale")))
+            orient = numpy_backend.to_rotation_matrix(get("jointOrient"))
+            matrix[:3, :3] = np.matmul(matrix[:3, :3], orient.T)
+
+        translate, rotation, scale, shear = numpy_backend.decompose_arrays(matrix)
+        rotate = numpy_backend.from_rotation_matrix(rotation, get("rotateOrder"))
+        for name, value in (
+            ("translate", translate),
+            ("rotate", rotate),
+            ("scale", scale),
+            ("shear", shear),
+        ):
+            if np.allclose(get(name), value, atol=1e-9):
+                continue
+            plug = Plug(node, node.type.names[name])
+            self._check_editable(plug)
+            self.set_value(plug, [float(v) for v in value])
+
+    def _check_editable(self, plug):
+        """Raise if the given plug or one of its children is locked or connected."""
+        for spec in plug.spec.walk():
+            key = (plug.node.uuid, spec.name, plug.indices)
+            if key in plug.node.locks:
+                raise RuntimeError(
+                    "The attribute '{}' is locked.".format(plug.child(spec).name())
+                )
+            if key in self.inputs:
+                raise RuntimeError(
+                    "The attribute '{}' is connected.".format(plug.child(spec).name())
+                )
+
+
+SCENE = Scene()
+
+
+def new_scene():
+    """Empty the scene, like cmds.file(new=True, force=True)."""
+    SCENE.clear()
+
+
+# Commands ---
+def createNode(node_type, name=None, parent=None, skipSelect=False, **kwargs):
+    """"""
+    name = _flag(kwargs, "n", default=name)
+    parent = _flag(kwargs, "p", default=parent)
+    node = SCENE.create(node_type, name, parent)
+    if not skipSelect and not kwargs.get("ss"):
+        SCENE.selection = [node]
+    return node.name
+
+
+def objExists(name):
+    """"""
+    name = str(name)
+    if "." in name:
+        return SCENE.find_plug(name) is not None
+    return SCENE.node(name) is not None
+
+
+def ls(*args, **kwargs):
+    """"""
+    uuid = _flag(kwargs, "uuid", "uid", default=False)
+    type_ = _flag(kwargs, "type", "typ")
+    if type_ and not isinstance(type_, (list, tuple)):
+        type_ = [type_]
+
+    if kwargs.get("selection") or kwargs.get("sl"):
+        nodes = list(SCENE.selection)
+    elif not args:
+        nodes = list(SCENE.nodes.values())
+    else:
+        nodes = []
+        patterns = []
+        for arg in args:
+            patterns.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+        result = []
+        for pattern in patterns:
+            pattern = str(pattern)
+            if "." in pattern:
+                plug = SCENE.find_plug(pattern)
+                if plug is not None and not uuid:
+                    result.append(pattern.split("|")[-1])
+                continue
+            if any(char in pattern for char in "*?["):
+                leaf = pattern.split("|")[-1]
+                nodes.extend(
+                    node for name, node in SCENE.by_name.items()
+                    if fnmatch.fnmatchcase(name, leaf)
+                )
+                continue
+            node = SCENE.node(pattern)
+            if node is not None:
+                nodes.append(node)
+        if result:
+            return result
+
+    if type_:
+        nodes = [
+            node for node in nodes
+            if any(each in node.type.inherited for each in type_)
+        ]
+    seen = set()
+    unique = [node for node in nodes if not (node in seen or seen.add(node))]
+    if uuid:
+        names = [node.uuid for node in unique]
+    elif _flag(kwargs, "long", "l", default=False):
+        names = [_path(node) for node in unique]
+    else:
+        names = [node.name for node in unique]
+    if _flag(kwargs, "showType", "st", default=False):
+        return [
+            each for name, node in zip(names, unique)
+            for each in (name, node.type.name)
+        ]
+    return names
+
+
+def _path(node):
+    """Return the full path of the given node, its name for DG nodes."""
+    if not node.type.is_dag:
+        return node.name
+    names = []
+    while node is not None:
+        names.append(node.name)
+        node = node.parent
+    return "|" + "|".join(reversed(names))
+
+
+def nodeType(name, inherited=False, isTypeName=False, **kwargs):
+    """"""
+    inherited = _flag(kwargs, "i", default=inherited)
+    isTypeName = _flag(kwargs, "itn", default=isTypeName)
+    if isTypeName:
+        node_type = NODE_TYPES.get(str(name))
+        if node_type is None:
+            return None
+    else:
+        node_type = SCENE.get_node(name).type
+    if inherited:
+        return list(node_type.inherited)
+    return node_type.name
+
+
+def rename(name, new_name, **kwargs):
+    """"""
+    return SCENE.rename(SCENE.get_node(name), new_name)
+
+
+def delete(*args, **kwargs):
+    """"""
+    for arg in args:
+        names = arg if isinstance(arg, (list, tuple, set)) else [arg]
+        for name in names:
+            SCENE.delete(SCENE.get_node(name))
+
+
+def parent(*args, **kwargs):
+    """"""
+    world = _flag(kwargs, "world", "w", default=False)
+    relative = _flag(kwargs, "relative", "r", default=False)
+    names = [str(arg) for arg in args]
+    if world:
+        new_parent, children = None, names
+    else:
+        new_parent, children = SCENE.get_node(names[-1]), names[:-1]
+
+    result = []
+    for name in children:
+        node = SCENE.get_node(name)
+        if node.parent is new_parent:
+            raise RuntimeError(
+                "Object '{}' is already a child of '{}'.".format(
+                    node.name, new_parent.name if new_parent else "world"
+                )
+            )
+        if new_parent is not None and (
+            new_parent is node or new_parent in SCENE.descendants(node)
+        ):
+            raise RuntimeError(
+                "Cannot parent '{}' to one of its children.".format(node.name)
+            )
+        world_matrix = SCENE.world_matrix(node)
+        SCENE.reparent(node, new_parent)
+        if not relative:
+            SCENE.set_world_matrix(node, world_matrix)
+        result.append(node.name)
+    return result
+
+
+def listRelatives(*args, **kwargs):
+    """"""
+    parent_ = _flag(kwargs, "parent", "p", default=False)
+    shapes = _flag(kwargs, "shapes", "s", default=False)
+    all_descendents = _flag(kwargs, "allDescendents", "ad", default=False)
+    type_ = _flag(kwargs, "type", "typ")
+    if type_ and not isinstance(type_, (list, tuple)):
+        type_ = [type_]
+
+    names = []
+    for arg in args:
+        names.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+    if not names:
+        names = [node.name for node in SCENE.selection]
+
+    result = []
+    for name in names:
+        node = SCENE.get_node(name)
+        if parent_:
+            nodes = [node.parent] if node.parent is not None else []
+        elif all_descendents:
+            nodes = list(reversed(SCENE.descendants(node)))
+        else:
+            nodes = list(node.children)
+        if shapes:
+            nodes = [each for each in nodes if each.type.is_shape]
+        if type_:
+            nodes = [
+                each for each in nodes
+                if any(t in each.type.inherited for t in type_)
+            ]
+        result.extend(each.name for each in nodes)
+    return result or None
+
+
+def select(*args, **kwargs):
+    """"""
+    if _flag(kwargs, "clear", "cl", default=False):
+        SCENE.selection = []
+        return
+    nodes = []
+    for arg in args:
+        names = arg if isinstance(arg, (list, tuple)) else [arg]
+        nodes.extend(SCENE.get_node(name) for name in names)
+    if _flag(kwargs, "add", default=False):
+        SCENE.selection.extend(node for node in nodes if node not in SCENE.selection)
+    else:
+        SCENE.selection = nodes
+
+
+def addAttr(*args, **kwargs):
+    """"""
+    edit = _flag(kwargs, "edit", "e", default=False)
+    if edit:
+        plug = SCENE.plug(args[0])
+        if plug.node.is_static(plug.spec):
+            raise RuntimeError(
+                "'{}' is not a dynamic attribute.".format(plug.name())
+            )
+        _edit_spec(plug.spec, kwargs)
+        return
+
+    node = SCENE.get_node(args[0] if args else SCENE.selection[-1].name)
+    long_name = _flag(kwargs, "longName", "ln")
+    short_name = _flag(kwargs, "shortName", "sn", default=long_name)
+    if not long_name:
+        raise RuntimeError("A long name must be specified.")
+    if node.find(long_name) is not None or node.find(short_name) is not None:
+        raise RuntimeError(
+            "Found a conflict with an existing attribute name '{}' on node '{}'.".format(
+                long_name, node.name
+            )
+        )
+
+    attribute_type = _flag(kwargs, "attributeType", "at")
+    data_type = _flag(kwargs, "dataType", "dt")
+    type_ = attribute_type or data_type or "double"
+    spec = AttributeSpec(
+        long_name,
+        short_name,
+        type_,
+        multi=_flag(kwargs, "multi", "m", default=False),
+        hidden=_flag(kwargs, "hidden", "h", default=False),
+        nice=_flag(kwargs, "niceName", "nn"),
+        typed=not attribute_type and bool(data_type),
+    )
+    _edit_spec(spec, kwargs)
+
+    parent_name = _flag(kwargs, "parent", "p")
+    parent_spec = None
+    if parent_name:
+        parent_spec = node.find(parent_name)
+        if parent_spec is None:
+            raise RuntimeError(
+                "No attribute named '{}' on node '{}'.".format(parent_name, node.name)
+            )
+    node.add(spec, parent_spec)
+
+
+def _edit_spec(spec, kwargs):
+    """Apply the addAttr edit flags to the given spec."""
+    default = _flag(kwargs, "defaultValue", "dv")
+    if default is not None:
+        spec.default = default
+    for names, key in (
+        (("minValue", "min"), "min"),
+        (("maxValue", "max"), "max"),
+        (("keyable", "k"), "keyable"),
+        (("hidden", "h"), "hidden"),
+        (("niceName", "nn"), "nice"),
+    ):
+        value = _flag(kwargs, *names)
+        if value is not None:
+            setattr(spec, key, value)
+    enums = _flag(kwargs, "enumName", "en")
+    if enums is not None:
+        spec.enums = ":".join(enums) if isinstance(enums, (list, tuple)) else enums
+
+
+def deleteAttr(*args, **kwargs):
+    """"""
+    plug = SCENE.plug(args[0] if "." in str(args[0]) else "{}.{}".format(
+        args[0], _flag(kwargs, "attribute", "at")
+    ))
+    if plug.node.is_static(plug.spec):
+        raise RuntimeError("'{}' is not a dynamic attribute.".format(plug.name()))
+    for key, source in list(SCENE.inputs.items()):
+        destination = SCENE._plug_from_key(key)
+        if destination.node is plug.node and destination.spec in list(plug.spec.walk()):
+            SCENE.disconnect(source, destination)
+        elif source.node is plug.node and source.spec in list(plug.spec.walk()):
+            SCENE.disconnect(source, destination)
+    plug.node.remove(plug.spec)
+
+
+def attributeQuery(attr, node=None, type=None, **kwargs):
+    """"""
+    attr_name, _ = _split_token(str(attr).split(".")[-1])
+    if type is not None:
+        node_type = NODE_TYPES.get(type)
+        if node_type is None:
+            raise RuntimeError("Unknown node type: {}".format(type))
+        spec = node_type.names.get(attr_name)
+    else:
+        spec = SCENE.get_node(node).find(attr_name)
+
+    if _flag(kwargs, "exists", "ex", default=False):
+        return spec is not None
+    if spec is None:
+        raise RuntimeError(
+            "No attribute named '{}' on {}.".format(attr, node or type)
+        )
+
+    if _flag(kwargs, "listDefault", "ld"):
+        value = spec.get_default()
+        if value is None or spec.type in ("matrix", "message"):
+            return None
+        return list(value) if isinstance(value, tuple) else [value]
+    if _flag(kwargs, "minExists", "mne"):
+        return spec.min is not None
+    if _flag(kwargs, "min", "min"):
+        return [spec.min]
+    if _flag(kwargs, "maxExists", "mxe"):
+        return spec.max is not None
+    if _flag(kwargs, "max", "max"):
+        return [spec.max]
+    if _flag(kwargs, "listEnum", "le"):
+        return [spec.enums] if spec.enums else None
+    if _flag(kwargs, "listParent", "lp"):
+        return [spec.parent.name] if spec.parent is not None else None
+    if _flag(kwargs, "listChildren", "lc"):
+        return [child.name for child in spec.children] or None
+    if _flag(kwargs, "multi", "m"):
+        return spec.multi
+    if _flag(kwargs, "hidden", "h"):
+        return spec.hidden
+    if _flag(kwargs, "keyable", "k"):
+        return spec.keyable
+    if _flag(kwargs, "niceName", "nn"):
+        return spec.nice or _nice_name(spec.name)
+    if _flag(kwargs, "shortName", "sn"):
+        return spec.short
+    if _flag(kwargs, "longName", "ln"):
+        return spec.name
+    if _flag(kwargs, "attributeType", "at"):
+        return "typed" if spec.typed else spec.type
+    raise RuntimeError("attributeQuery: no supported query flag given.")
+
+
+def listAttr(name, **kwargs):
+    """Only supports the userDefined, multi and keyable filters."""
+    node = SCENE.get_node(name)
+    specs = []
+    for attribute in node.type.attributes + node.dynamic:
+        specs.extend(attribute.walk())
+    if _flag(kwargs, "userDefined", "ud", default=False):
+        specs = [spec for spec in specs if not node.is_static(spec)]
+    if _flag(kwargs, "multi", "m", default=False):
+        specs = [spec for spec in specs if spec.multi]
+    if _flag(kwargs, "keyable", "k", default=False):
+        specs = [spec for spec in specs if spec.keyable]
+    return [spec.name for spec in specs] or None
+
+
+def attributeName(plug, **kwargs):
+    """"""
+    plug = SCENE.plug(plug)
+    leaf = _flag(kwargs, "leaf", "lf", default=False)
+    if _flag(kwargs, "nice", "n", default=False):
+        names = [spec.nice or _nice_name(spec.name) for spec in plug.spec.chain()]
+        return names[-1] if leaf else " ".join(names)
+    long = not _flag(kwargs, "short", "s", default=False)
+    if leaf:
+        return plug.spec.name if long else plug.spec.short
+    return plug.attribute_name(long=long)
+
+
+def getAttr(plug, **kwargs):
+    """"""
+    plug = SCENE.plug(plug)
+    spec = plug.spec
+
+    if _flag(kwargs, "type", "typ"):
+        if plug.is_array:
+            return "TdataCompound"
+        return spec.type
+    if _flag(kwargs, "lock", "l"):
+        return plug.key in plug.node.locks
+    if _flag(kwargs, "keyable", "k"):
+        return plug.node.keyable.get(plug.key, spec.keyable)
+    if _flag(kwargs, "channelBox", "cb"):
+        return plug.node.channel_box.get(plug.key, False)
+    if _flag(kwargs, "multiIndices", "mi"):
+        if not plug.is_array:
+            raise RuntimeError("'{}' is not a multi attribute.".format(plug.name()))
+        return SCENE.multi_indices(plug.node, spec, plug.indices) or None
+    if _flag(kwargs, "size", "s"):
+        return len(SCENE.multi_indices(plug.node, spec, plug.indices))
+
+    value = SCENE.get_value(plug.node, spec, plug.indices)
+    if plug.is_array:
+        return value or None
+    if spec.is_compound:
+        return [tuple(value)]
+    if spec.type == "matrix":
+        return list(value)
+    return value
+
+
+def setAttr(plug, *args, **kwargs):
+    """"""
+    plug = SCENE.plug(plug)
+    lock = _flag(kwargs, "lock", "l")
+    keyable = _flag(kwargs, "keyable", "k")
+    channel_box = _flag(kwargs, "channelBox", "cb")
+
+    if lock is not None:
+        SCENE._touch(plug)
+        if lock:
+            plug.node.locks.add(plug.key)
+        else:
+            plug.node.locks.discard(plug.key)
+    if keyable is not None:
+        plug.node.keyable[plug.key] = bool(keyable)
+        if keyable:
+            plug.node.channel_box[plug.key] = False
+    if channel_box is not None:
+        plug.node.channel_box[plug.key] = bool(channel_box)
+    if not args:
+        return
+
+    if plug.key in plug.node.locks:
+        raise RuntimeError(
+            "The attribute '{}' is locked or connected and cannot be modified.".format(
+                plug.name()
+            )
+        )
+    if plug.key in SCENE.inputs:
+        raise RuntimeError(
+            "setAttr: '{}' is connected and cannot be modified.".format(plug.name())
+        )
+    value = args[0] if len(args) == 1 else list(args)
+    if isinstance(value, (list, tuple)) and plug.spec.type == "matrix":
+        if len(value) != 16:
+            raise RuntimeError("A matrix needs 16 values.")
+    SCENE.set_value(plug, value)
+
+
+def connectAttr(source, destination, force=False, **kwargs):
+    """"""
+    force = _flag(kwargs, "f", default=force)
+    source = SCENE.plug(source)
+    destination = SCENE.plug(destination)
+
+    if destination.key in destination.node.locks:
+        raise RuntimeError(
+            "The destination attribute '{}' is locked.".format(destination.name())
+        )
+    existing = SCENE.inputs.get(destination.key)
+    if existing is not None:
+        if existing == source:
+            LOG.warning(
+                "'{}' is already connected to '{}'.".format(
+                    source.name(), destination.name()
+                )
+            )
+            return
+        if not force:
+            raise RuntimeError(
+                "The destination attribute '{}' is already connected.".format(
+                    destination.name()
+                )
+            )
+        SCENE.disconnect(existing, destination)
+    SCENE.connect(source, destination)
+    return "Connected {} to {}.".format(source.name(), destination.name())
+
+
+def disconnectAttr(source, destination, **kwargs):
+    """"""
+    SCENE.disconnect(SCENE.plug(source), SCENE.plug(destination))
+
+
+def removeMultiInstance(plug, b=False, **kwargs):
+    """"""
+    plug = SCENE.plug(plug)
+    if plug.is_array or not plug.indices:
+        raise RuntimeError("'{}' is not an array element.".format(plug.name()))
+    if plug.key in plug.node.locks:
+        raise RuntimeError("The attribute '{}' is locked.".format(plug.name()))
+    SCENE.remove_element(plug, break_connections=_flag(kwargs, "break", default=b))
+
+
+def isConnected(source, destination, **kwargs):
+    """"""
+    return SCENE.inputs.get(SCENE.plug(destination).key) == SCENE.plug(source)
+
+
+def listConnections(name=None, source=True, destination=True, plugs=False, **kwargs):
+    """"""
+    source = _flag(kwargs, "s", default=source)
+    destination = _flag(kwargs, "d", default=destination)
+    plugs = _flag(kwargs, "p", default=plugs)
+    type_ = _flag(kwargs, "type", "t")
+
+    connections = _flag(kwargs, "connections", "c", default=False)
+
+    queried = []
+    for name in name if isinstance(name, (list, tuple)) else [name]:
+        name = str(name)
+        if "." not in name:
+            queried += SCENE.node_plugs(SCENE.get_node(name))
+            continue
+        plug = SCENE.plug(name)
+        if plug.is_array:
+            # the connections of the elements
+            queried += SCENE.sub_plugs(plug)
+        else:
+            queried.append(plug)
+
+    result = []
+    for plug in queried:
+        if source and plug.key in SCENE.inputs:
+            result.append((plug, SCENE.inputs[plug.key]))
+        if destination:
+            result.extend((plug, other) for other in SCENE.outputs.get(plug.key, []))
+
+    if type_:
+        result = [
+            (plug, other) for plug, other in result
+            if type_ in other.node.type.inherited
+        ]
+    if connections:
+        names = []
+        for plug, other in result:
+            names.append(plug.name())
+            names.append(other.name() if plugs else other.node.name)
+        return names or None
+    if plugs:
+        names = [other.name() for _, other in result]
+    else:
+        names = [other.node.name for _, other in result]
+    seen = set()
+    names = [each for each in names if not (each in seen or seen.add(each))]
+    return names or None
+
+
+def container(*args, **kwargs):
+    """"""
+    query = _flag(kwargs, "query", "q", default=False)
+    edit = _flag(kwargs, "edit", "e", default=False)
+
+    if query:
+        if _flag(kwargs, "current", "c"):
+            node = SCENE.current_container
+            return node.name if node is not None else None
+        node = SCENE.get_node(args[0])
+        if _flag(kwargs, "nodeList", "nl"):
+            return [member.name for member in SCENE.containers.get(node.uuid, [])]
+        raise RuntimeError("container: no supported query flag given.")
+
+    if edit:
+        node = SCENE.get_node(args[0])
+        members = SCENE.containers.setdefault(node.uuid, [])
+        current = _flag(kwargs, "current", "c")
+        if current is not None:
+            SCENE.current_container = node if current else None
+        add = _flag(kwargs, "addNode", "an")
+        if add:
+            for each in add if isinstance(add, (list, tuple, set)) else [add]:
+                member = SCENE.get_node(each)
+                for other in SCENE.containers.values():
+                    if member in other:
+                        other.remove(member)
+                members.append(member)
+        remove = _flag(kwargs, "removeNode", "rn")
+        if remove:
+            for each in remove if isinstance(remove, (list, tuple, set)) else [remove]:
+                member = SCENE.get_node(each)
+                if member in members:
+                    members.remove(member)
+        if _flag(kwargs, "removeContainer", "rc"):
+            SCENE.containers.pop(node.uuid, None)
+            for child in list(node.children):
+                SCENE.reparent(child, node.parent)
+            SCENE.delete(node)
+        return
+
+    node_type = _flag(kwargs, "type", "typ", default="container")
+    node = SCENE.create(node_type, _flag(kwargs, "name", "n"))
+    add = _flag(kwargs, "addNode", "an")
+    if add:
+        container(node.name, edit=True, addNode=add)
+    SCENE.containers.setdefault(node.uuid, [])
+    return node.name
+
+
+def xform(name, **kwargs):
+    """"""
+    node = SCENE.get_node(name)
+    query = _flag(kwargs, "query", "q", default=False)
+    world_space = _flag(kwargs, "worldSpace", "ws", default=False)
+    matrix = _flag(kwargs, "matrix", "m")
+    translation = _flag(kwargs, "translation", "t")
+    rotation = _flag(kwargs, "rotation", "ro")
+
+    if query:
+        current = (
+            SCENE.world_matrix(node) if world_space else SCENE.local_matrix(node)
+        )
+        if matrix:
+            return _flat(current)
+        if translation:
+            return [float(v) for v in current[3, :3]]
+        if rotation:
+            return list(SCENE.get_value(node, node.type.names["rotate"], ()))
+        raise RuntimeError("xform: no supported query flag given.")
+
+    if matrix is not None:
+        if world_space:
+            SCENE.set_world_matrix(node, matrix)
+        else:
+            SCENE.set_local_matrix(node, matrix)
+    if translation is not None:
+        current = SCENE.world_matrix(node) if world_space else SCENE.local_matrix(node)
+        current[3, :3] = translation
+        if world_space:
+            SCENE.set_world_matrix(node, _flat(current))
+        else:
+            SCENE.set_local_matrix(node, _flat(current))
+    if rotation is not None:
+        SCENE.set_value(Plug(node, node.type.names["rotate"]), rotation)
+
+
+def matchTransform(*args, **kwargs):
+    """"""
+    names = [str(arg) for arg in args]
+    target = SCENE.world_matrix(SCENE.get_node(names[-1]))
+    flags = {
+        "position": _flag(kwargs, "position", "pos", default=False),
+        "rotation": _flag(kwargs, "rotation", "rot", default=False),
+        "scale": _flag(kwargs, "scale", "scl", default=False),
+    }
+    if not any(flags.values()):
+        flags = dict.fromkeys(flags, True)
+
+    for name in names[:-1]:
+        node = SCENE.get_node(name)
+        current = SCENE.world_matrix(node)
+        t0, r0, s0, sh0 = numpy_backend.decompose_arrays(current)
+        t1, r1, s1, sh1 = numpy_backend.decompose_arrays(target)
+        translate = t1 if flags["position"] else t0
+        rotation = r1 if flags["rotation"] else r0
+        scale, shear = (s1, sh1) if flags["scale"] else (s0, sh0)
+        SCENE.set_world_matrix(
+            node,
+            _flat(
+                numpy_backend.compose_rotation_arrays(
+                    translate, rotation, scale, shear
+                )
+            ),
+        )
+
+
+def undoInfo(*args, **kwargs):
+    """Undo is not recorded by the memory scene."""
+    if _flag(kwargs, "query", "q", default=False):
+        return False
+
+
+def pluginInfo(*args, **kwargs):
+    """Plugins can't be loaded in the memory scene."""
+    return False
+
+
+def loadPlugin(*args, **kwargs):
+    """"""
+    raise RuntimeError("Plugins can't be loaded in the memory scene.")
+
+
+def file(*args, **kwargs):
+    """Only supports new=True."""
+    if _flag(kwargs, "new", "n", default=False):
+        new_scene()
+        return
+    raise RuntimeError("file: only new=True is supported by the memory scene.")
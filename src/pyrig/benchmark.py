@@ -0,0 +1,600 @@
+"""Rig build benchmarks with scene-call budgets.
+
+Each workload builds a representative piece of rig through the public
+API and is measured three times on a new scene: wall time, allocations
+(tracemalloc) and scene calls (pyrig.profiler). The call counts are
+compared to the budgets stored in ressources/benchmark_budgets.json,
+per backend, and any excess fails the run.
+
+The import of IMPORT_MODULES is measured too, in fresh interpreters: the
+number of pyrig modules it loads and its best wall time are compared to
+their budgets. Third-party modules are not counted, their number depends
+on the environment. The time budget keeps IMPORT_TIME_MARGIN of headroom
+and is checked with IMPORT_TIME_TOLERANCE seconds of tolerance.
+
+Usage::
+
+    python -m pyrig.benchmark --json results.json
+    python -m pyrig.benchmark --workload controls --scale 10
+    python -m pyrig.benchmark --update-budgets
+"""
+import argparse
+import datetime
+import gc
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pyrig.backend
+from pyrig.backend import cmds
+
+import pyrig.core as pr
+import pyrig.attribute
+import pyrig.control
+import pyrig.joint
+import pyrig.maths.matrix
+import pyrig.maths.matrix_array
+import pyrig.node
+import pyrig.profiler
+
+LOG = logging.getLogger(__name__)
+
+FILE_PATH = os.path.dirname(os.path.realpath(__file__))
+BUDGETS_FILE = os.path.join(FILE_PATH, "ressources", "benchmark_budgets.json")
+
+# name: (function, default size)
+WORKLOADS = {}
+
+# Modules whose import is measured, in fresh interpreters.
+IMPORT_MODULES = ("pyrig", "pyrig.core", "pyrig.node", "pyrig.control")
+IMPORT_REPEAT = 5
+IMPORT_TIME_MARGIN = 2.0
+IMPORT_TIME_TOLERANCE = 0.05
+
+_IMPORT_SCRIPT = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+loaded = set(sys.modules) - before
+print(seconds, len([name for name in loaded if name.split(".")[0] == "pyrig"]))
+"""
+
+
+def workload(name, size):
+    """Register the decorated function as a workload.
+
+    The function receives the size and builds the workload, it returns a
+    callable doing the measured operations, the setup is not measured.
+    """
+
+    def register(function):
+        WORKLOADS[name] = (function, size)
+        return function
+
+    return register
+
+
+def new_scene():
+    """Open a new scene and reset the caches holding scene state."""
+    cmds.file(new=True, force=True)
+    if pyrig.backend.om is None:
+        # no scene callbacks outside of Maya
+        pyrig.node._on_scene_changed()
+
+
+# Workloads ---
+@workload("controls", 200)
+def controls(size):
+    """Controls with a canceled transform."""
+
+    def run():
+        for i in range(size):
+            control = pyrig.control.Control(name="ctl{}".format(i), create=True)
+            control.canceled_transform()
+
+    return run
+
+
+@workload("controls_batch", 200)
+def controls_batch(size):
+    """The controls of the controls workload built by Control.create_many."""
+    names = ["ctl{}".format(i) for i in range(size)]
+
+    def run():
+        pyrig.control.Control.create_many(names)
+
+    return run
+
+
+@workload("joint_chain", 100)
+def joint_chain(size):
+    """A long chain of joints reparented one under the other."""
+    joints = []
+    for i in range(size):
+        joint = pr.create("joint", name="jnt{}".format(i))
+        joint["translate"].value = (1.0, 0.0, 0.0)
+        joints.append(joint)
+
+    def run():
+        for parent, child in zip(joints, joints[1:]):
+            child.parent = parent
+
+    return run
+
+
+@workload("joint_chain_batch", 100)
+def joint_chain_batch(size):
+    """The joint_chain workload reparented with pr.reparent_many."""
+    joints = []
+    for i in range(size):
+        joint = pr.create("joint", name="jnt{}".format(i))
+        joint["translate"].value = (1.0, 0.0, 0.0)
+        joints.append(joint)
+
+    def run():
+        pr.reparent_many(zip(joints[1:], joints))
+
+    return run
+
+
+@workload("create_chain", 200)
+def create_chain(size):
+    """A spine like joint chain built by pr.create_chain."""
+    positions = [(0.0, float(i), 0.1 * (i % 2)) for i in range(size)]
+
+    def run():
+        pr.create_chain(positions, name="spine", up_vector=(0, 0, 1))
+
+    return run
+
+
+@workload("get_nodes", 200)
+def get_nodes(size):
+    """pr.get of nodes and plugs not retrieved yet, as for a connection."""
+    names = [
+        cmds.createNode("transform", name="got{}".format(i), skipSelect=True)
+        for i in range(size)
+    ]
+
+    def run():
+        nodes = [pr.get(name) for name in names]
+        plugs = [pr.get("{}.translate".format(name)) for name in names]
+        return nodes, plugs
+
+    return run
+
+
+@workload("get_many", 200)
+def get_many(size):
+    """The nodes and plugs of the get_nodes workload with pr.get_many."""
+    names = [
+        cmds.createNode("transform", name="got{}".format(i), skipSelect=True)
+        for i in range(size)
+    ]
+
+    def run():
+        return pr.get_many(
+            names + ["{}.translate".format(name) for name in names]
+        )
+
+    return run
+
+
+def _transforms(size):
+    """Return size translate, rotate, scale and shear tuples."""
+    return [
+        (
+            (float(i), 1.0, -2.0),
+            (i % 90, 2.0 * (i % 45), -30.0),
+            (1.0, 1.0 + 0.01 * (i % 10), 1.0),
+            (0.0, 0.0, 0.0),
+        )
+        for i in range(size)
+    ]
+
+
+@workload("compose_per_matrix", 1000)
+def compose_per_matrix(size):
+    """Compose then decompose matrices one by one, see compose_batch."""
+    transforms = _transforms(size)
+
+    def run():
+        for translate, rotate, scale, shear in transforms:
+            pyrig.maths.matrix.compose(translate, rotate, scale, shear).decompose()
+
+    return run
+
+
+@workload("compose_batch", 1000)
+def compose_batch(size):
+    """The compose_per_matrix workload done by Mat44Array at once."""
+    translate, rotate, scale, shear = zip(*_transforms(size))
+
+    def run():
+        pyrig.maths.matrix_array.Mat44Array.compose_many(
+            translate, rotate, scale, shear
+        ).decompose_many()
+
+    return run
+
+
+@workload("name_access", 200)
+def name_access(size):
+    """Repeated str(node), node.name and node + str on living nodes.
+
+    The scene calls per access are the calls divided by 10 * 3 * size,
+    the resolved handles of pyrig.node bring them to 0 with OpenMaya.
+    """
+    nodes = [pr.create("transform", name="named{}".format(i)) for i in range(size)]
+
+    def run():
+        for _ in range(10):
+            for node in nodes:
+                str(node)
+                node.name
+                node + ".translate"
+
+    return run
+
+
+@workload("link_fan_out", 100)
+def link_fan_out(size):
+    """Many transforms linked to one driver with maintain_offset."""
+    driver = pr.create("transform", name="driver")
+    driver["translate"].value = (1.0, 2.0, 3.0)
+    driven = []
+    for i in range(size):
+        node = pr.create("transform", name="driven{}".format(i))
+        node["translate"].value = (float(i), 0.0, 0.0)
+        driven.append(node)
+
+    def run():
+        for node in driven:
+            node.link_to(driver["worldMatrix"][0], maintain_offset=True)
+
+    return run
+
+
+@workload("multi_insert", 100)
+def multi_insert(size):
+    """Attribute.insert at the head of a large matrixIn multi."""
+    mmx = pr.create("multMatrix", name="sum")
+    sources = []
+    for i in range(size):
+        node = pr.create("transform", name="src{}".format(i))
+        node["worldMatrix"][0] >> mmx["matrixIn"][i]
+        sources.append(node)
+    inserted = pr.create("transform", name="inserted")
+
+    def run():
+        inserted["worldMatrix"][0] >= mmx["matrixIn"][0]
+
+    return run
+
+
+@workload("attribute_properties", 20)
+def attribute_properties(size):
+    """AttributeProperties.retrieve across all attributes of nodes."""
+    nodes = []
+    for i in range(size):
+        node = pr.create("transform", name="props{}".format(i))
+        node.add_attr("weight", attributeType="double", min=0, max=1)
+        nodes.append(node)
+    attributes = [
+        attr for attr in cmds.listAttr(str(nodes[0]))
+        if "." not in attr
+    ]
+
+    def run():
+        for node in nodes:
+            for attr in attributes:
+                pyrig.attribute.AttributeProperties.retrieve(node[attr])
+
+    return run
+
+
+@workload("move_hierarchy", 100)
+def move_hierarchy(size):
+    """pr.move_many of a chain of transforms, children listed first."""
+    matrices = {}
+    parent = None
+    for i in range(size):
+        node = pr.create("transform", name="moved{}".format(i))
+        if parent is not None:
+            node.parent = parent
+        parent = node
+        matrices[node] = pr.Types.Mat44(
+            (float(i), 1.0, 0.0), (0.0, 10.0 * i, 0.0), (1.0, 1.0, 1.0)
+        )
+    matrices = dict(reversed(list(matrices.items())))
+
+    def run():
+        pr.move_many(matrices)
+
+    return run
+
+
+@workload("pose_restore", 100)
+def pose_restore(size):
+    """pr.set_values of a stored pose on locked transforms."""
+    pose = {}
+    for i in range(size):
+        node = pr.create("transform", name="posed{}".format(i))
+        node["translate"].lock = True
+        pose[node["translate"]] = (float(i), 1.0, 0.0)
+        pose[node["rotate"]] = (0.0, 45.0, 0.0)
+        pose[node["scale"]] = (1.0, 1.0, 2.0)
+        pose[node["rotateOrder"]] = "zxy"
+
+    def run():
+        pr.set_values(pose, force_lock=True)
+
+    return run
+
+
+# Measure ---
+def _prepare(name, size):
+    """Build the workload on a new scene and return its measured callable.
+
+    The garbage collector is disabled until `_finish` so the identity map
+    of pyrig.node, and so the call counts, do not depend on its timing.
+    """
+    new_scene()
+    run = WORKLOADS[name][0](size)
+    gc.collect()
+    gc.disable()
+    return run
+
+
+def _finish():
+    """"""
+    gc.enable()
+
+
+def _measure(name, size):
+    """Return the wall time, allocations and scene calls of a workload."""
+    run = _prepare(name, size)
+    try:
+        start = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - start
+    finally:
+        _finish()
+
+    run = _prepare(name, size)
+    tracemalloc.start()
+    try:
+        run()
+        allocated, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        _finish()
+
+    run = _prepare(name, size)
+    try:
+        with pyrig.profiler.Profiler() as profiler:
+            run()
+    finally:
+        _finish()
+    calls = {}
+    for row in profiler.summary():
+        calls[row["call"]] = calls.get(row["call"], 0) + row["count"]
+
+    return {
+        "size": size,
+        "seconds": seconds,
+        "allocated_bytes": allocated,
+        "peak_bytes": peak,
+        "calls": sum(calls.values()),
+        "calls_per_command": calls,
+    }
+
+
+def measure_import(module, repeat=IMPORT_REPEAT):
+    """Return the best import time and the pyrig modules loaded by module."""
+    env = dict(os.environ)
+    paths = [os.path.dirname(FILE_PATH)] + env.get("PYTHONPATH", "").split(os.pathsep)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in paths if path)
+    env["PYRIG_BACKEND"] = pyrig.backend.BACKEND
+    seconds, modules = [], None
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _IMPORT_SCRIPT.format(module=module)], env=env
+        )
+        elapsed, modules = output.decode().split()
+        seconds.append(float(elapsed))
+    return {"seconds": min(seconds), "modules": int(modules)}
+
+
+def _commit():
+    """Return the current git commit, None if not available."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=FILE_PATH,
+            stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names=None, scale=1, imports=True):
+    """Measure the given workloads, every workload by default.
+
+    The imports of IMPORT_MODULES are measured too if imports is True.
+    """
+    results = {}
+    for name in names or sorted(WORKLOADS):
+        size = max(1, int(WORKLOADS[name][1] * scale))
+        LOG.info("Benchmarking '{}' (size {})".format(name, size))
+        results[name] = _measure(name, size)
+
+    import_results = {}
+    for module in IMPORT_MODULES if imports else ():
+        LOG.info("Benchmarking 'import {}'".format(module))
+        import_results[module] = measure_import(module)
+
+    return {
+        "backend": pyrig.backend.BACKEND,
+        "commit": _commit(),
+        "date": datetime.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "workloads": results,
+        "imports": import_results,
+    }
+
+
+# Budgets ---
+def load_budgets(file_path=BUDGETS_FILE):
+    """"""
+    if not os.path.exists(file_path):
+        return {}
+    with open(file_path, "r") as stream:
+        return json.load(stream)
+
+
+def save_budgets(results, file_path=BUDGETS_FILE):
+    """Store the call counts of the given results as the new budgets."""
+    budgets = load_budgets(file_path)
+    backend_budgets = budgets.setdefault(results["backend"], {})
+    for name, result in results["workloads"].items():
+        backend_budgets[name] = {"size": result["size"], "calls": result["calls"]}
+    import_budgets = backend_budgets.setdefault("imports", {})
+    for module, result in results.get("imports", {}).items():
+        import_budgets[module] = {
+            "modules": result["modules"],
+            "seconds": round(result["seconds"] * IMPORT_TIME_MARGIN, 4),
+        }
+    with open(file_path, "w") as stream:
+        json.dump(budgets, stream, indent=4, sort_keys=True)
+        stream.write("\n")
+
+
+def check_budgets(results, budgets=None):
+    """Return the failure messages of the results exceeding their budget.
+
+    Budgets are only checked for the workloads measured at their budget
+    size, the optional "seconds" budget is checked too when stored.
+    """
+    if budgets is None:
+        budgets = load_budgets()
+    backend_budgets = budgets.get(results["backend"], {})
+
+    failures = []
+    import_budgets = backend_budgets.get("imports", {})
+    for module, result in sorted(results.get("imports", {}).items()):
+        budget = import_budgets.get(module)
+        if not budget:
+            continue
+        if result["modules"] > budget["modules"]:
+            failures.append(
+                "'import {}' loaded {} modules, budget is {}.".format(
+                    module, result["modules"], budget["modules"]
+                )
+            )
+        if result["seconds"] > budget["seconds"] + IMPORT_TIME_TOLERANCE:
+            failures.append(
+                "'import {}' took {:.3f}s, budget is {:.3f}s.".format(
+                    module, result["seconds"], budget["seconds"]
+                )
+            )
+
+    for name, result in sorted(results["workloads"].items()):
+        budget = backend_budgets.get(name)
+        if not budget or budget.get("size") != result["size"]:
+            continue
+        if result["calls"] > budget["calls"]:
+            failures.append(
+                "'{}' made {} scene calls, budget is {}.".format(
+                    name, result["calls"], budget["calls"]
+                )
+            )
+        if "seconds" in budget and result["seconds"] > budget["seconds"]:
+            failures.append(
+                "'{}' took {:.3f}s, budget is {:.3f}s.".format(
+                    name, result["seconds"], budget["seconds"]
+                )
+            )
+    return failures
+
+
+def table(results):
+    """Return the results as a text table."""
+    lines = [
+        "{:<24} {:>8} {:>12} {:>14} {:>10}".format(
+            "workload", "size", "time (ms)", "peak (KiB)", "calls"
+        )
+    ]
+    for name, result in sorted(results["workloads"].items()):
+        lines.append(
+            "{:<24} {:>8} {:>12.2f} {:>14.1f} {:>10}".format(
+                name,
+                result["size"],
+                result["seconds"] * 1e3,
+                result["peak_bytes"] / 1024.0,
+                result["calls"],
+            )
+        )
+    if results.get("imports"):
+        lines.append("")
+        lines.append(
+            "{:<24} {:>8} {:>12}".format("import", "modules", "time (ms)")
+        )
+        for module, result in sorted(results["imports"].items()):
+            lines.append(
+                "{:<24} {:>8} {:>12.2f}".format(
+                    module, result["modules"], result["seconds"] * 1e3
+                )
+            )
+    return "\n".join(lines)
+
+
+def main(args=None):
+    """Command line entry point, returns 1 when a budget is exceeded."""
+    parser = argparse.ArgumentParser(prog="python -m pyrig.benchmark")
+    parser.add_argument(
+        "--workload", action="append", choices=sorted(WORKLOADS),
+        help="Workload to run, every workload by default.",
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0,
+        help="Size multiplier, budgets are only checked at scale 1.",
+    )
+    parser.add_argument(
+        "--skip-imports", action="store_true",
+        help="Do not measure the import of IMPORT_MODULES.",
+    )
+    parser.add_argument("--json", help="Write the results to this file.")
+    parser.add_argument(
+        "--update-budgets", action="store_true",
+        help="Store the measured call counts as the new budgets.",
+    )
+    options = parser.parse_args(args)
+
+    results = run(
+        options.workload, options.scale, imports=not options.skip_imports
+    )
+    print(table(results))
+    if options.json:
+        with open(options.json, "w") as stream:
+            json.dump(results, stream, indent=4, sort_keys=True)
+
+    if options.update_budgets:
+        save_budgets(results)
+        return 0
+
+    failures = check_budgets(results)
+    for failure in failures:
+        print("FAILED: {}".format(failure))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,122 @@
+import collections
 import six
 import logging
 
-from maya import cmds
+from pyrig.backend import cmds
+from pyrig.constants import MayaType
 
 import pyrig.core as pr
 import pyrig.node
+import pyrig.transform
 
 LOG = logging.getLogger(__name__)
 
+USE_MEMBER_CACHE = True
+
+
+class MemberCache(object):
+    """Member uuids of the containers.
+
+    The members of a container are queried once, then kept up to date by
+    the pyrig edits, edits made with cmds.container directly are not seen.
+    Undo and redo clear it, see `pyrig.node.install_callbacks`.
+    """
+
+    def __init__(self):
+        """"""
+        self._members = {}
+        self._owners = {}
+
+    def clear(self):
+        """Forget every container."""
+        self._members.clear()
+        self._owners.clear()
+
+    def forget(self, uuid):
+        """Forget the given node, as a container and as a member."""
+        for member in self._members.pop(uuid, ()):
+            self._owners.pop(member, None)
+        owner = self._owners.pop(uuid, None)
+        if owner in self._members:
+            self._members[owner].pop(uuid, None)
+
+    def get(self, uuid):
+        """Return the member uuids of the given container, None if unknown."""
+        if not USE_MEMBER_CACHE or uuid not in self._members:
+            return None
+        return list(self._members[uuid])
+
+    def set(self, uuid, members):
+        """Store the member uuids of the given container."""
+        self.forget_members(uuid)
+        self._members[uuid] = collections.OrderedDict()
+        self.add(uuid, members)
+
+    def forget_members(self, uuid):
+        """Forget the members of the given container only."""
+        for member in self._members.pop(uuid, ()):
+            self._owners.pop(member, None)
+
+    def contains(self, uuid, member):
+        """Check if member is known to be in the given container."""
+        return member in self._members.get(uuid, ())
+
+    def add(self, uuid, members):
+        """Add member uuids, a node belongs to a single container."""
+        for member in members:
+            owner = self._owners.get(member)
+            if owner is not None and owner in self._members:
+                self._members[owner].pop(member, None)
+            self._owners[member] = uuid
+            if uuid in self._members:
+                self._members[uuid][member] = None
+
+    def remove(self, uuid, members):
+        """Remove member uuids."""
+        for member in members:
+            if self._owners.get(member) == uuid:
+                del self._owners[member]
+            if uuid in self._members:
+                self._members[uuid].pop(member, None)
+
+
+MEMBERS = MemberCache()
+
+
+def _resolve(nodes):
+    """Return the (name, uuid) of the given nodes/names, without duplicates.
+
+    The names are resolved by a single query, or one by one when some of
+    them are missing, duplicated or ambiguous.
+    """
+    if isinstance(nodes, (six.string_types, pyrig.node.Node)):
+        nodes = [nodes]
+    nodes = list(nodes)
+    names = [str(node) for node in nodes if not isinstance(node, pyrig.node.Node)]
+    uuids = cmds.ls(names, uuid=True) or [] if names else []
+    if len(uuids) != len(names):
+        uuids = [_resolve_name(name) for name in names]
+
+    uuids = iter(uuids)
+    resolved = collections.OrderedDict()
+    for node in nodes:
+        if isinstance(node, pyrig.node.Node):
+            resolved.setdefault(node.uuid, node.node)
+        else:
+            resolved.setdefault(next(uuids), str(node))
+    return [(name, uuid) for uuid, name in resolved.items()]
+
+
+def _resolve_name(name):
+    """Return the uuid of the given name, raise if it is not a single node."""
+    uuids = cmds.ls(name, uuid=True) or []
+    if not uuids:
+        raise TypeError("'{}' does not exist in the graph.".format(name))
+    if len(uuids) > 1:
+        raise TypeError("More than one object named '{}'.".format(name))
+    return uuids[0]
+
+
 class Container(pyrig.node.Node):
     """"""
 
@@ -27,24 +136,81 @@ class Container(pyrig.node.Node):
 
     @property
     def members(self):
-        return [pr.get(n) for n in cmds.container(self.node, q=True, nodeList=True)]
+        uuids = self._get_member_uuids()
+        nodes = {}
+        for uuid in uuids:
+            node = pyrig.node.get_registered(uuid)
+            if node is not None:
+                nodes[uuid] = node
+        missing = [uuid for uuid in uuids if uuid not in nodes]
+        if missing:
+            for node in pr.get_many(cmds.ls(missing)):
+                nodes[node.uuid] = node
+        return [nodes[uuid] for uuid in uuids if uuid in nodes]
     
     @members.setter
     def members(self, val):
-        if isinstance(val, six.string_types):
-            val = [val]
-        cmds.container(self.node, edit=True, addNode=val)
-        diff = set(self.members).difference(val)
-        cmds.container(self.node, edit=True, removeNode=diff)
+        resolved = _resolve(val)
+        uuids = set(uuid for _, uuid in resolved)
+        self.remove_members([
+            self._get_member(uuid) for uuid in self._get_member_uuids()
+            if uuid not in uuids
+        ])
+        self.add_members([node for node, uuid in resolved])
+
+    # Methods ---
+    def add_members(self, nodes):
+        """Add the given nodes/names, the members already known are skipped."""
+        resolved = [
+            (name, uuid) for name, uuid in _resolve(nodes)
+            if not MEMBERS.contains(self.uuid, uuid)
+        ]
+        if not resolved:
+            return
+        cmds.container(
+            self.node, edit=True, addNode=[name for name, _ in resolved]
+        )
+        MEMBERS.add(self.uuid, [uuid for _, uuid in resolved])
+
+    def remove_members(self, nodes):
+        """Remove the given nodes/names from the container."""
+        resolved = _resolve(nodes)
+        if not resolved:
+            return
+        cmds.container(
+            self.node, edit=True, removeNode=[name for name, _ in resolved]
+        )
+        MEMBERS.remove(self.uuid, [uuid for _, uuid in resolved])
+
+    def _get_member_uuids(self):
+        """Return the member uuids, queried once then cached."""
+        uuids = MEMBERS.get(self.uuid)
+        if uuids is None:
+            names = cmds.container(self.node, q=True, nodeList=True) or []
+            uuids = cmds.ls(names, uuid=True) or [] if names else []
+            MEMBERS.set(self.uuid, uuids)
+        return uuids
+
+    def _get_member(self, uuid):
+        """Return the pyrig node of the given member uuid."""
+        node = pyrig.node.get_registered(uuid)
+        if node is None:
+            node = pr.get(cmds.ls(uuid)[0])
+        return node
 
     # Methods - overide
     def delete(self):
         """"""
         cmds.container(self.node, edit=True, removeContainer=True)
+        MEMBERS.forget(self.uuid)
 
 class DagContainer(Container, pyrig.transform.Transform):
     """"""
 
     def __init__(self, *args, **kwargs):
         """"""
-        super(Container, self).__init__(*args, **kwargs)
\ No newline at end of file
+        super(Container, self).__init__(*args, **kwargs)
+
+
+pyrig.node.register_class(MayaType.container, Container)
+pyrig.node.register_class(MayaType.dagContainer, DagContainer)
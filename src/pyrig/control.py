@@ -1,7 +1,12 @@
 import logging
 
+from pyrig.backend import cmds, om
+
 import pyrig.core as pr
+import pyrig.attribute
 import pyrig.container
+import pyrig.name
+import pyrig.node
 
 LOG = logging.getLogger(__name__)
 
@@ -20,18 +25,96 @@ class Control(pyrig.container.DagContainer):
             self._create_network()
 
             # Set Properties
-            self["inheritTransform"].value = False
+            self["inheritsTransform"].value = False
 
             # Configure Existing Attributes.
             self["visibility"].keyable = False
             self["visibility"].visible = False
             self["rotateOrder"].visible = True
 
+    @classmethod
+    def create_many(cls, specs):
+        """Create many controls and their network in one pass.
+
+        The containers and multMatrix nodes are created by batches, the
+        connections, values and attribute flags are made in one edit
+        session and the multMatrix nodes are added to their container at
+        the end.
+
+        Parameters
+        ----------
+        specs : list
+            Names, or {"name": str, "parent": str/Node} dicts.
+        """
+        specs = [spec if isinstance(spec, dict) else {"name": spec} for spec in specs]
+        if not specs:
+            return []
+        names = cls._reserve_names([spec.get("name") for spec in specs])
+        controls = pyrig.node.create_nodes(
+            "dagContainer",
+            [name for name, _ in names],
+            [spec.get("parent") for spec in specs],
+            cls=cls,
+        )
+        mmxs = pyrig.node.create_nodes(
+            "multMatrix", [mmx_name for _, mmx_name in names]
+        )
+
+        if om is not None:
+            with pr.edit_session("pyrig_create_controls"):
+                cls._setup_many(controls, mmxs)
+        else:
+            cls._setup_many(controls, mmxs)
+
+        for control, mmx in zip(controls, mmxs):
+            control.add_members([mmx])
+        return controls
+
+    @staticmethod
+    def _reserve_names(names):
+        """Return the (control, multMatrix) names N `Control` calls give.
+
+        A control is named before its multMatrix, which takes the name of
+        the control and gets an indexed one from createNode. The clashes
+        are resolved in that order before the batches create the nodes.
+        """
+        names = [
+            str(pyrig.name.validate_name(name, "dagContainer")) for name in names
+        ]
+        taken = set(name.split("|")[-1] for name in cmds.ls(names) or [])
+        reserved = []
+        for name in names:
+            while name in taken:
+                name = pyrig.name.find_next_available_name(name, indexed=True)
+            taken.add(name)
+            mmx_name = name
+            while mmx_name in taken:
+                mmx_name = pyrig.name.find_next_available_name(name, indexed=True)
+            taken.add(mmx_name)
+            reserved.append((name, mmx_name))
+        return reserved
+
+    @staticmethod
+    def _setup_many(controls, mmxs):
+        """Connect and configure the controls built by `create_many`."""
+        connections = []
+        values = {}
+        for control, mmx in zip(controls, mmxs):
+            connections.append((mmx["matrixSum"], control["offsetParentMatrix"]))
+            values[control["inheritsTransform"]] = False
+        pyrig.attribute.connect_all(connections)
+        pr.set_values(values)
+        for control in controls:
+            pyrig.attribute.set_flags(
+                control["visibility"], keyable=False, channelBox=False
+            )
+            pyrig.attribute.set_flags(control["rotateOrder"], channelBox=True)
+
     def _create_network(self):
         """"""
         mmx = pr.create("multMatrix", name=self.name.copy())
         mmx["matrixSum"] >> self["offsetParentMatrix"]
-        self.members += [mmx]
+        self.add_members([mmx])
 
     def canceled_transform(self):
         """"""
@@ -39,4 +122,4 @@ class Control(pyrig.container.DagContainer):
         self["offsetParentMatrix"].input >> mmx["matrixIn"][1]
         self["inverseMatrix"] >> mmx["matrixIn"][0]
         mmx["matrixSum"] >> self["offsetParentMatrix"]
-        self.members += [mmx]
\ No newline at end of file
+        self.add_members([mmx])
\ No newline at end of file
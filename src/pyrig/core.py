@@ -1,42 +1,33 @@
+import importlib
 import logging
 
-from maya import cmds
+from pyrig.backend import cmds, om
 
-from pyrig.constants import *
+# Not used here, re-exported so that pr.MayaType, pr.RotateOrder, etc. keep
+# working as they did with the former star import.
+from pyrig.constants import Format, MayaType, RotateOrder, RotationFormalism, Unit  # noqa: F401
+import pyrig
+import pyrig.maths
 
 LOG = logging.getLogger(__name__)
 
 
 def create(type_, name="", **kwargs):
     """"""
-    # define a mapping table for node_types
-    import pyrig.name
-    import pyrig.node
-    import pyrig.transform
-    import pyrig.joint
-
-    node_type_remap = {
-        "node": pyrig.node.Node,
-        "helper": pyrig.transform.Helper,
-        "joint": pyrig.joint.Joint
-    }
-
-    # create kwargs
     kwargs["name"] = pyrig.name.validate_name(name, type_)
-    cls = node_type_remap.get(type_, pyrig.node.Node)
-
-    if type_ not in node_type_remap:
+    if type_ == "node":
+        cls = pyrig.node.Node
+    elif type_ == "helper":
+        cls = pyrig.transform.Helper
+    else:
         kwargs["node_type"] = type_
-        inherited_types = cmds.nodeType(type_, isTypeName=True, inherited=True)
-        cls = _find_cls_from_types(inherited_types)
+        cls = _find_cls_from_types(pyrig.node.get_type_hierarchy(type_))
 
     return cls(**kwargs)
 
 
 def get(name):
     """"""
-    import pyrig.node
-
     if name is None:
         return None
     
@@ -44,8 +35,13 @@ def get(name):
     if isinstance(name, pyrig.node.Node):
         return name
 
-    # Check existence.
-    retrived = cmds.ls(name)
+    # check if it is a plug
+    node_name, attr_name = name, None
+    if "." in name:
+        node_name, attr_name = name.split(".", 1)
+
+    # Check existence, nodes get their uuid in the same query.
+    retrived = cmds.ls(name, uuid=not attr_name)
     if len(retrived) == 0:
         msg = "'{}' does not exist in the graph.".format(name)
         LOG.debug(msg)
@@ -54,22 +50,196 @@ def get(name):
         raise TypeError(
             "More than one object named '{}'.".format(name)
         )
+    uuid = cmds.ls(node_name, uuid=True)[0] if attr_name else retrived[0]
 
-    # check if it is a plug
-    attr_name = None
-    if "." in name:
-        name, attr_name = name.split(".", 1)
-
-    # determine proper class
-    inherited_types = cmds.nodeType(name, inherited=True)
-    cls = _find_cls_from_types(inherited_types)
-    pyrig_node = cls.retrieve(name)
+    pyrig_node = _get_registered(uuid)
+    if pyrig_node is None:
+        # determine proper class, the node is seeded with what is known
+        inherited_types = cmds.nodeType(node_name, inherited=True)
+        cls = _find_cls_from_types(inherited_types)
+        pyrig_node = cls._from_scene(node_name, uuid, inherited_types)
 
     if attr_name:
         return pyrig_node[attr_name]
     return pyrig_node
 
 
+def get_many(names):
+    """Return the pyrig nodes/attributes of the given names, in order.
+
+    Existence, uniqueness, uuids and node types are resolved for the whole
+    list at once: a single MSelectionList with OpenMaya, otherwise one
+    `cmds.ls(showType=True)` and one `cmds.ls(uuid=True)`. Names that do
+    not exist give None like `get`.
+    """
+    # attributes and other objects are resolved from their string
+    names = [
+        name if name is None or isinstance(name, pyrig.node.Node) else str(name)
+        for name in names
+    ]
+    strings = [name for name in names if isinstance(name, str)]
+    found = _find_many(strings) if strings else {}
+    if found is None:
+        # missing or ambiguous names, resolve them one by one
+        return [get(name) for name in names]
+
+    result = []
+    for name in names:
+        if name is None or isinstance(name, pyrig.node.Node):
+            result.append(name)
+            continue
+        node_name, uuid, node_type = found[name]
+        pyrig_node = _get_registered(uuid)
+        if pyrig_node is None:
+            inherited_types = pyrig.node.get_type_hierarchy(node_type)
+            cls = _find_cls_from_types(inherited_types)
+            pyrig_node = cls._from_scene(node_name, uuid, inherited_types)
+        if "." in name:
+            result.append(pyrig_node[name.split(".", 1)[1]])
+        else:
+            result.append(pyrig_node)
+    return result
+
+
+def _get_registered(uuid):
+    """Return the living node of the given uuid, if any.
+
+    The identity map returns the object that was created or retrieved
+    before, a Control stays a Control. It is only reused if it is an
+    instance of the class `_find_cls_from_types` picks for its node, so a
+    plain Node or a class since replaced by `register_class` is not.
+    """
+    pyrig_node = pyrig.node.get_registered(uuid)
+    if pyrig_node is None:
+        return None
+    cls = _find_cls_from_types(pyrig_node._get_inherited_types())
+    if not isinstance(pyrig_node, cls):
+        return None
+    return pyrig_node
+
+
+def _find_many(names):
+    """Return {name: (node name, uuid, node type)} for `get_many`.
+
+    Returns None if any of the names does not exist, is not unique or is
+    not named the way `cmds.ls` returns it.
+    """
+    if om is not None:
+        selection = om.MSelectionList()
+        found = {}
+        for name in names:
+            if name in found:
+                continue
+            length = selection.length()
+            try:
+                selection.add(name)
+            except RuntimeError:
+                return None
+            if selection.length() != length + 1:
+                return None
+            if "." in name:
+                mobject = selection.getPlug(length).node()
+            else:
+                mobject = selection.getDependNode(length)
+            fn_node = om.MFnDependencyNode(mobject)
+            found[name] = (
+                name.split(".", 1)[0], fn_node.uuid().asString(), fn_node.typeName
+            )
+        return found
+
+    unique = list(dict.fromkeys(names))
+    plugs = [name for name in unique if "." in name]
+    if plugs and len(cmds.ls(plugs)) != len(plugs):
+        return None
+
+    node_names = list(dict.fromkeys(name.split(".", 1)[0] for name in unique))
+    typed = cmds.ls(node_names, showType=True)
+    uuids = cmds.ls(node_names, uuid=True)
+    if len(typed) != 2 * len(node_names) or len(uuids) != len(node_names):
+        return None
+    # ls returns the nodes in scene order and names them its own way (short
+    # names, normalized paths), key them by the names it returned
+    nodes = dict(zip(typed[0::2], zip(uuids, typed[1::2])))
+    if not all(node_name in nodes for node_name in node_names):
+        return None
+
+    found = {}
+    for name in unique:
+        node_name = name.split(".", 1)[0]
+        found[name] = (node_name,) + nodes[node_name]
+    return found
+
+
+def get_values(attributes, as_array=False):
+    """Read the values of many plugs in one pass.
+
+    Returns a {plug: value} dict, values formatted like
+    `Attribute.get_value`, or an (N, size) float64 array of the flattened
+    values if as_array is True.
+    """
+    attributes = list(attributes)
+    values = pyrig.apiAttribute.read_values(attributes)
+    if as_array:
+        return pyrig.maths.matrix_array.values_to_array(values)
+    return dict(zip([str(attribute) for attribute in attributes], values))
+
+
+def set_values(values, **kwargs):
+    """Set the values of many plugs in one pass.
+
+    Usage::
+
+        pr.set_values({
+            "ctrl.translate": (0.0, 1.0, 0.0),
+            "ctrl.rotateOrder": "zxy",
+            ctrl["visibility"]: True,
+        }, force_lock=True)
+    """
+    pyrig.attribute.set_values(values, **kwargs)
+
+
+def move_many(matrices, **kwargs):
+    """Move many transforms to their world matrix in one pass.
+
+    Usage::
+
+        pr.move_many({"root_jnt": root_matrix, "spine_jnt": spine_matrix})
+    """
+    pyrig.transform.move_many(matrices, **kwargs)
+
+
+def reparent_many(pairs):
+    """Reparent many DAG nodes keeping their world pose.
+
+    Usage::
+
+        pr.reparent_many(zip(joints[1:], joints[:-1]))
+    """
+    pyrig.transform.reparent_many(pairs)
+
+
+def create_chain(points, name="joint", parent=None, **kwargs):
+    """Create a joint chain in one pass, see `pyrig.joint.create_chain`.
+
+    Usage::
+
+        spine = pr.create_chain(positions, name="spine", up_vector=(0, 0, 1))
+    """
+    return pyrig.joint.create_chain(points, name=name, parent=parent, **kwargs)
+
+
+def edit_session(chunk_name="pyrig"):
+    """Batch the graph edits made in a with statement.
+
+    Usage::
+
+        with pr.edit_session():
+            mmx["matrixSum"] >> ctrl["offsetParentMatrix"]
+            ctrl["inheritsTransform"].value = False
+    """
+    return pyrig.session.EditSession(chunk_name)
+
+
 def create_attr(node, **kwargs):
     """"""
     obj = get(node)
@@ -78,26 +248,35 @@ def create_attr(node, **kwargs):
     return obj.add_attr(**kwargs)
 
 
+def register_class(node_type, cls):
+    """Use cls for the nodes of node_type, see `pyrig.node.register_class`."""
+    pyrig.node.register_class(node_type, cls)
+
+
 def _find_cls_from_types(types):
-    """"""
-    import pyrig.node
-    import pyrig.transform
-    import pyrig.joint
-
-    maya_type_remap = {
-        MayaType.joint: pyrig.joint.Joint,
-        MayaType.dagContainer: pyrig.container.DagContainer,
-        MayaType.transform: pyrig.transform.Transform,
-        MayaType.dagNode: pyrig.node.DagNode,
-        MayaType.container: pyrig.container.Container,
-    }
-
-    for type_, cls in maya_type_remap.items():
-        if type_ in types:
-            return cls
-    return pyrig.node.Node
+    """Return the class of the most derived registered type in types."""
+    return pyrig.node.find_class(types)
+
+
+class _LazyType(object):
+    """Class attribute importing its type on first access."""
+
+    def __init__(self, module, name):
+        """"""
+        self.module = module
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = getattr(importlib.import_module(self.module), self.name)
+        setattr(owner, self.name, value)
+        return value
+
 
 class Types(object):
     """Datatypes class."""
-    from pyrig.dataType import Mat44
-    from pyrig.dataType import Vec3
\ No newline at end of file
+    if pyrig.maths.BACKEND == "numpy":
+        Mat44 = _LazyType("pyrig.maths.numpy_backend", "Mat44")
+        Vec3 = _LazyType("pyrig.maths.numpy_backend", "Vec3")
+    else:
+        Mat44 = _LazyType("pyrig.dataType", "Mat44")
+        Vec3 = _LazyType("pyrig.dataType", "Vec3")
\ No newline at end of file
@@ -15,6 +15,8 @@ class Mat44(om.MMatrix):
             args = [list(args)]
 
         super(Mat44, self).__init__(*args, **kwargs)
+        # decomposition cache, see `_cached`
+        self._cache = {}
 
     # Builtin Methods ---
     def __repr__(self):
@@ -34,11 +36,25 @@ class Mat44(om.MMatrix):
         if isinstance(obj, Mat44):
             obj = obj._api_matrix
         return Mat44(self._api_matrix * obj)
+
+    def __setitem__(self, index, value):
+        super(Mat44, self).__setitem__(index, value)
+        self._cache.clear()
+
+    # in-place operators return new matrices, the cache can't go stale
+    def __iadd__(self, obj):
+        return self.__add__(obj)
+
+    def __isub__(self, obj):
+        return self.__sub__(obj)
+
+    def __imul__(self, obj):
+        return self.__mul__(obj)
     
     # Properties ---
     @property
     def translate(self):
-        self.get_translate()
+        return self.get_translate()
     
     @translate.setter
     def translate(self, val):
@@ -76,10 +92,28 @@ class Mat44(om.MMatrix):
     def shear(self, val):
         self.set_shear(val)
 
+    # Methods - MMatrix ---
+    def setElement(self, row, col, value):
+        """"""
+        super(Mat44, self).setElement(row, col, value)
+        self._cache.clear()
+
+    def setToIdentity(self):
+        """"""
+        super(Mat44, self).setToIdentity()
+        self._cache.clear()
+        return self
+
+    def setToProduct(self, left, right):
+        """"""
+        super(Mat44, self).setToProduct(left, right)
+        self._cache.clear()
+        return self
+
     # Methods ---
     def decompose(self, **kwargs):
         """"""
-        translate = self.get_translate(*kwargs)
+        translate = self.get_translate(**kwargs)
         rotate = self.get_rotate(**kwargs)
         scale = self.get_scale(**kwargs)
         shear = self.get_shear(**kwargs)
@@ -101,8 +135,7 @@ class Mat44(om.MMatrix):
     
     def get_translate(self, **kwargs):
         """"""
-        mVector = self._api_tMat.translation(om.MSpace.kWorld)
-        return list(mVector)
+        return list(self._cached(("translate",), self._get_translate))
 
     def get_rotate(self, **kwargs):
         """"""
@@ -110,52 +143,48 @@ class Mat44(om.MMatrix):
         angle_unit = kwargs.get("angle_unit", Unit.degree)
         rotate_order = kwargs.get("rotate_order", RotateOrder.xyz)
 
-        # set rotate order
-        kRotationOrder = getattr(
-            om.MTransformationMatrix,
-            RotateOrder.maya_api_type(rotate_order),
-        )
-        self._api_tMat.reorderRotation(kRotationOrder)
-
-        # get rotation
-        if rotation_formalism == RotationFormalism.quaternion:
-            mQuat = self._api_tMat.rotation(om.MSpace.kWorld)
-            rotate_ = list(mQuat)
-        elif rotation_formalism == RotationFormalism.euler:
-            mEuler = self._api_tMat.rotation()
-            rotate_ = list(mEuler)
-            if angle_unit == Unit.degree:
-                rotate_ = [math.degrees(_) for _ in rotate_]
-
-        return rotate_
+        key = ("rotate", rotation_formalism, angle_unit, rotate_order)
+        return list(self._cached(
+            key,
+            lambda: self._get_rotate(rotation_formalism, angle_unit, rotate_order),
+        ))
 
     def get_scale(self, **kwargs):
         """"""
-        return self._api_tMat.scale(om.MSpace.kWorld)
+        return list(self._cached(
+            ("scale",), lambda: self._api_tMat.scale(om.MSpace.kWorld)
+        ))
     
     def get_shear(self, **kwargs):
         """"""
-        return self._api_tMat.shear(om.MSpace.kWorld)
+        return list(self._cached(
+            ("shear",), lambda: self._api_tMat.shear(om.MSpace.kWorld)
+        ))
 
     def set_translate(self, val, **kwargs):
         """"""
-        _, rotate, scale, shear = self.decompose(**kwargs)
-        self.__init__(val, rotate, scale, shear)
+        for i, value in enumerate(val):
+            om.MMatrix.setElement(self, 3, i, value)
+        self._cache.pop("tMat", None)
+        self._cache.pop(("translate",), None)
 
     def set_rotate(self, val, **kwargs):
         """"""
-        translate, _, scale, shear = self.decompose(**kwargs)
-        self.__init__(translate, val, scale, shear)
+        api_tMat = self._api_tMat
+        api_tMat.setRotation(self._api_rotation(val, **kwargs))
+        self._assign(api_tMat, "rotate")
 
     def set_scale(self, val, **kwargs):
         """"""
-        translate, rotate, _, shear = self.decompose(**kwargs)
-        self.__init__(translate, rotate, val, shear)
+        api_tMat = self._api_tMat
+        api_tMat.setScale(val, om.MSpace.kWorld)
+        self._assign(api_tMat, "scale")
 
     def set_shear(self, val, **kwargs):
         """"""
-        translate, rotate, scale, _ = self.decompose(**kwargs)
-        self.__init__(translate, rotate, scale, val)
+        api_tMat = self._api_tMat
+        api_tMat.setShear(val, om.MSpace.kWorld)
+        self._assign(api_tMat, "shear")
     
     # Internal Methods ---
     @property
@@ -164,7 +193,73 @@ class Mat44(om.MMatrix):
     
     @property
     def _api_tMat(self):
-        return om.MTransformationMatrix(self)
+        """Cached MTransformationMatrix, shared by the accessors."""
+        api_tMat = self._cache.get("tMat")
+        if api_tMat is None:
+            api_tMat = self._cache["tMat"] = om.MTransformationMatrix(self)
+        return api_tMat
+
+    def _cached(self, key, compute):
+        """Return the cached decomposition value for key, compute it if needed."""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _get_translate(self):
+        """"""
+        return list(self._api_tMat.translation(om.MSpace.kWorld))
+
+    def _get_rotate(self, rotation_formalism, angle_unit, rotate_order):
+        """"""
+        # set rotate order, on a copy: the cached matrix is shared by the
+        # queries made with other rotate orders
+        api_tMat = om.MTransformationMatrix(self._api_tMat)
+        kRotationOrder = getattr(
+            om.MTransformationMatrix,
+            RotateOrder.maya_api_type(rotate_order),
+        )
+        api_tMat.reorderRotation(kRotationOrder)
+
+        # get rotation
+        if rotation_formalism == RotationFormalism.quaternion:
+            mQuat = api_tMat.rotation(om.MSpace.kWorld)
+            rotate_ = list(mQuat)
+        elif rotation_formalism == RotationFormalism.euler:
+            mEuler = api_tMat.rotation()
+            rotate_ = list(mEuler)
+            if angle_unit == Unit.degree:
+                rotate_ = [math.degrees(_) for _ in rotate_]
+
+        return rotate_
+
+    def _assign(self, api_tMat, component):
+        """Set the matrix from the given MTransformationMatrix.
+
+        Only the cached values of the edited component are dropped, the
+        other components are not affected by the edit.
+        """
+        om.MMatrix.__init__(self, api_tMat.asMatrix())
+        for key in list(self._cache):
+            if key[0] == component:
+                del self._cache[key]
+
+    @staticmethod
+    def _api_rotation(rotate, **kwargs):
+        """Convert euler or quaternion values to an OpenMaya rotation."""
+        rotate_order = kwargs.get("rotate_order", RotateOrder.xyz)
+        angle_unit = kwargs.get("angle_unit", Unit.degree)
+
+        if len(rotate) == 4:  # RotationFormalism.quaternion
+            return om.MQuaternion(rotate)
+        if angle_unit == Unit.degree:
+            # convert to radian
+            rotate = [math.radians(_) for _ in rotate]
+        # set rotate order
+        kRotationOrder = getattr(
+            om.MEulerRotation,
+            RotateOrder.maya_api_type(rotate_order),
+        )
+        return om.MEulerRotation(rotate, kRotationOrder)
 
     @staticmethod
     def _compose(translate, rotate, scale, shear=(0, 0, 0), **kwargs):
@@ -176,23 +271,8 @@ class Mat44(om.MMatrix):
             translate = om.MVector(translate)
         api_tMat.setTranslation(translate, om.MSpace.kWorld)
 
-        rotate_order = kwargs.get("rotate_order", RotateOrder.xyz)
-        angle_unit = kwargs.get("angle_unit", Unit.degree)
-
         # rotate
-        if len(rotate) == 4:  # RotationFormalism.quaternion
-            mRotate = om.MQuaternion(rotate)
-        elif len(rotate) == 3:  # RotationFormalism.euler
-            if angle_unit == Unit.degree:
-                # convert to radian
-                rotate = [math.radians(_) for _ in rotate]
-            # set rotate order
-            kRotationOrder = getattr(
-                om.MEulerRotation,
-                RotateOrder.maya_api_type(rotate_order),
-            )
-            mRotate = om.MEulerRotation(rotate, kRotationOrder)
-        api_tMat.setRotation(mRotate)
+        api_tMat.setRotation(Mat44._api_rotation(rotate, **kwargs))
 
         # scale
         api_tMat.setScale(scale, om.MSpace.kWorld)
@@ -1,12 +1,192 @@
 import logging
 
-from maya import cmds
+import numpy as np
+
+from pyrig.backend import cmds, om
+from pyrig.constants import MayaType
 
 import pyrig.core as pr
+import pyrig.maths.matrix_array
+import pyrig.name
+import pyrig.node
+import pyrig.session
 import pyrig.transform
 
 LOG = logging.getLogger(__name__)
 
+AXES = "xyz"
+
+
+def _parse_axis(axis):
+    """Return the (index, sign) of an axis name like "x" or "-z"."""
+    sign = -1.0 if axis.startswith("-") else 1.0
+    return AXES.index(axis.lstrip("+-").lower()), sign
+
+
+def _normalize(vectors):
+    """Normalize an (N, 3) array, the null vectors are kept null."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms > 1e-10, norms, 1.0)
+
+
+def orient_chain(positions, aim_axis="x", up_axis="y", up_vector=(0, 1, 0)):
+    """Return the world matrices of joints placed at the given positions.
+
+    Each joint aims its aim_axis at the next one and points its up_axis
+    towards up_vector, the last joint keeps the orientation of the one
+    before. Everything is computed on the whole chain at once.
+
+    Parameters
+    ----------
+    positions : list
+        (N, 3) world positions.
+    aim_axis : str, optional
+        "x", "y", "z", prefixed by "-" for the negative axis.
+        by default "x"
+    up_axis : str, optional
+        Same as aim_axis, must be another axis.
+        by default "y"
+    up_vector : tuple, optional
+        World up vector, or (N, 3) for one per joint.
+        by default (0, 1, 0)
+
+    Returns
+    -------
+    pyrig.maths.matrix_array.Mat44Array
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    size = len(positions)
+    aim_index, aim_sign = _parse_axis(aim_axis)
+    up_index, up_sign = _parse_axis(up_axis)
+    if aim_index == up_index:
+        raise ValueError("The aim and up axes must be different.")
+
+    aim = np.zeros((size, 3))
+    aim[:, aim_index] = 1.0
+    if size > 1:
+        aim[:-1] = positions[1:] - positions[:-1]
+        aim[-1] = aim[-2]
+    aim = _normalize(aim)
+
+    up = np.broadcast_to(np.asarray(up_vector, dtype=np.float64), (size, 3))
+    side = np.cross(aim, up)
+    degenerate = np.linalg.norm(side, axis=-1) < 1e-6
+    if np.any(degenerate):
+        # up vector along the aim, use the world axis the less aligned
+        fallback = np.where(
+            np.abs(aim[:, 2:3]) < 0.9, [[0.0, 0.0, 1.0]], [[1.0, 0.0, 0.0]]
+        )
+        side[degenerate] = np.cross(aim[degenerate], fallback[degenerate])
+    side = _normalize(side)
+    up = np.cross(side, aim)
+
+    rows = np.zeros((size, 3, 3))
+    rows[:, aim_index] = aim * aim_sign
+    rows[:, up_index] = up * up_sign
+    # right handed: x = y ^ z, y = z ^ x, z = x ^ y
+    other = 3 - aim_index - up_index
+    rows[:, other] = np.cross(
+        rows[:, (other + 1) % 3], rows[:, (other + 2) % 3]
+    )
+
+    matrices = np.zeros((size, 4, 4))
+    matrices[:, :3, :3] = rows
+    matrices[:, 3, :3] = positions
+    matrices[:, 3, 3] = 1.0
+    return pyrig.maths.matrix_array.Mat44Array(matrices)
+
+
+def create_chain(points, name="joint", parent=None, **kwargs):
+    """Create a joint chain in one pass and return its Joints.
+
+    The joints are created by a single DAG modifier with OpenMaya, their
+    local translate, jointOrient and scale are computed on the whole
+    chain then set by one `pr.set_values`.
+
+    Parameters
+    ----------
+    points : list
+        World positions, oriented with `orient_chain`, or world matrices
+        (Mat44/16 floats) used as they are.
+    name : str/list, optional
+        Base name indexed for each joint, or one name per joint.
+        by default "joint"
+    parent : str/pyrig.node.Node, optional
+        Parent of the first joint.
+        by default None
+    aim_axis, up_axis, up_vector : optional
+        See `orient_chain`.
+    """
+    points = list(points)
+    if not points:
+        return []
+    if len(points[0]) == 3:
+        worlds = orient_chain(
+            points,
+            aim_axis=kwargs.get("aim_axis", "x"),
+            up_axis=kwargs.get("up_axis", "y"),
+            up_vector=kwargs.get("up_vector", (0, 1, 0)),
+        )
+    else:
+        worlds = pyrig.maths.matrix_array.Mat44Array(points)
+
+    if isinstance(name, (list, tuple)):
+        names = [str(each) for each in name]
+    else:
+        names = [
+            pyrig.name.find_next_available_name(str(name)) for _ in points
+        ]
+    if len(names) != len(points):
+        raise ValueError("Expected {} names, got {}.".format(len(points), len(names)))
+
+    # local matrices, the first one relative to the parent
+    world_array = worlds.array
+    locals_ = np.empty_like(world_array)
+    locals_[1:] = np.matmul(world_array[1:], np.linalg.inv(world_array[:-1]))
+    locals_[0] = world_array[0]
+    if parent:
+        parent_world = np.array(
+            list(pr.get(parent)["worldMatrix"][0].value), dtype=np.float64
+        ).reshape(4, 4)
+        locals_[0] = np.matmul(world_array[0], np.linalg.inv(parent_world))
+    # a non-uniformly scaled parent shears the first local matrix, the
+    # shear attribute keeps it so the world matrices stay exact
+    translate, orient, scale, shear = pyrig.maths.matrix_array.Mat44Array(
+        locals_
+    ).decompose_many()
+
+    # create the chain
+    if om is not None:
+        with pr.edit_session("pyrig_create_chain") as session:
+            created = session.create_chain("joint", names, parent=parent)
+        inherited_types = cmds.nodeType(created[0][0], inherited=True)
+    else:
+        nodes = []
+        node_parent = str(parent) if parent else None
+        for each in names:
+            flags = {"name": each, "skipSelect": True}
+            if node_parent:
+                flags["parent"] = node_parent
+            node_parent = cmds.createNode("joint", **flags)
+            nodes.append(node_parent)
+        created = list(zip(nodes, cmds.ls(nodes, uuid=True)))
+        inherited_types = cmds.nodeType(nodes[0], inherited=True)
+
+    joints = []
+    for node, uuid in created:
+        pyrig.name.NAME_INDEX.add(node)
+        joints.append(Joint._from_scene(node, uuid, inherited_types))
+
+    values = {}
+    for i, joint in enumerate(joints):
+        values[joint["translate"]] = tuple(translate[i])
+        values[joint["jointOrient"]] = tuple(orient[i])
+        values[joint["scale"]] = tuple(scale[i])
+        if np.any(np.abs(shear[i]) > 1e-10):
+            values[joint["shear"]] = tuple(shear[i])
+    pr.set_values(values)
+    return joints
+
 
 class Joint(pyrig.transform.Transform):
     """"""
@@ -17,29 +197,32 @@ class Joint(pyrig.transform.Transform):
         kwargs.setdefault("node_type", "joint")
         super(Joint, self).__init__(*args, **kwargs)
 
-    def _set_dag_parent(self, value, relative=True):
-        """Override the dag_parent setter to remove jointOrients."""
+    def _set_parent(self, value, relative=True):
+        """Override the parent setter to remove jointOrients."""
         # sets the parent
         if value:
             self._inverse_parent(value)
 
         # Move in the outliner/DAG.
         matrix = self["worldMatrix"].value
-        super(Joint, self)._set_dag_parent(value, relative)
-        if self.jointOrient.exists():
-            self.jointOrient.value = 0, 0, 0
+        super(Joint, self)._set_parent(value, relative)
+        if self["jointOrient"].exists():
+            self["jointOrient"].value = 0, 0, 0
         self.move_to(matrix)
 
+    # Kept for the callers of the former name.
+    _set_dag_parent = _set_parent
+
     def _inverse_parent(self, value):
         # Grab the inverse parent and feed it into the live child.
-        input_attr = self.translate.input or self.translateX.input
+        input_attr = self["translate"].input or self["translateX"].input
         if not input_attr:
             return
 
         input_node = input_attr.node
         dcc_type = input_node.dcc_type
         if dcc_type == "decomposeMatrix":
-            decompose_attr = input_node.inputMatrix
+            decompose_attr = input_node["inputMatrix"]
             traversed_connection = decompose_attr.get_input()
             if traversed_connection:
                 name = [self.name, "DAGParent"]
@@ -49,19 +232,22 @@ class Joint(pyrig.transform.Transform):
                 inverse.name.append_type()
 
                 # Connections.
-                pr.get(value).worldMatrix >> inverse.inputMatrix
-                traversed_connection >> mult.attr("matrixIn[0]")
-                inverse.outputMatrix >> mult.attr("matrixIn[1]")
+                pr.get(value)["worldMatrix"][0] >> inverse["inputMatrix"]
+                traversed_connection >> mult["matrixIn"][0]
+                inverse["outputMatrix"] >> mult["matrixIn"][1]
 
                 # Remove the previous decompose matrix.
                 input_node.delete()
 
                 # Relink the Joint.
-                self.link_to(mult.output)
+                self.link_to(mult["matrixSum"])
 
     def compensate_scale(self):
         """Reconnect the scaleCompensate attributes."""
-        parent = self.dag_parent
+        parent = self.parent
         if not parent or parent.node_type != "joint":
             return
         parent["scale"].connect(self["inverseScale"], connect_leaf=True)
+
+
+pyrig.node.register_class(MayaType.joint, Joint)
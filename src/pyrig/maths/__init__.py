@@ -0,0 +1,24 @@
+import importlib
+import importlib.util
+import os
+
+# Backend implementing pyrig.core.Types: "openmaya" or "numpy".
+# Uses OpenMaya when it is available, PYRIG_MATHS_BACKEND forces one.
+BACKEND = os.environ.get("PYRIG_MATHS_BACKEND", "")
+if not BACKEND:
+    try:
+        available = importlib.util.find_spec("maya.api.OpenMaya") is not None
+    except ImportError:
+        available = False
+    BACKEND = "openmaya" if available else "numpy"
+
+SUBMODULES = ("matrix", "matrix_array", "numpy_backend")
+
+
+def __getattr__(name):
+    """Import the submodules on first access."""
+    if name in SUBMODULES:
+        return importlib.import_module("{}.{}".format(__name__, name))
+    raise AttributeError(
+        "module '{}' has no attribute '{}'".format(__name__, name)
+    )
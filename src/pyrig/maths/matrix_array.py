@@ -0,0 +1,183 @@
+import logging
+
+import numpy as np
+
+import pyrig.core as pr
+from pyrig.constants import RotationFormalism, Unit, RotateOrder
+from pyrig.maths import numpy_backend
+
+LOG = logging.getLogger(__name__)
+
+
+def values_to_array(values):
+    """Stack values read by `pyrig.apiAttribute.read_values` in an (N, size)
+    float64 array.
+    """
+    rows = []
+    for value in values:
+        if hasattr(value, "__iter__"):
+            rows.append([float(each) for each in value])
+        else:
+            rows.append([float(value)])
+    if len(set(len(row) for row in rows)) > 1:
+        raise ValueError("Values of different sizes can't be stacked.")
+    return np.array(rows, dtype=np.float64).reshape(len(rows), -1)
+
+
+def _by_rotate_order(rotate_order, size):
+    """Yield (rotate_order, mask) pairs for scalar or per matrix orders."""
+    if np.ndim(rotate_order) == 0:
+        yield rotate_order, slice(None)
+        return
+    orders = np.asarray(rotate_order)
+    if len(orders) != size:
+        raise ValueError(
+            "Expected {} rotate orders, got {}.".format(size, len(orders))
+        )
+    for order in np.unique(orders):
+        yield int(order), orders == order
+
+
+class Mat44Array(object):
+    """Stack of N Mat44 backed by an (N, 4, 4) float64 array.
+
+    Compose, decompose, inverse and products run on the whole stack at
+    once, use it instead of Mat44 loops when handling many transforms.
+    """
+
+    def __init__(self, data=None):
+        """_summary_
+
+        Parameters
+        ----------
+        data : ndarray/list, optional
+            (N, 4, 4) or (N, 16) array, or a list of Mat44/16 floats.
+            by default None, an empty array.
+        """
+        if data is None:
+            data = np.zeros((0, 4, 4))
+        elif isinstance(data, Mat44Array):
+            data = data._data
+        elif not isinstance(data, np.ndarray):
+            data = [list(matrix) for matrix in data]
+        self._data = np.array(data, dtype=np.float64).reshape(-1, 4, 4)
+
+    # Builtin Methods ---
+    def __repr__(self):
+        return "{}(<{} matrices>)".format(self.__class__.__name__, len(self))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return pr.Types.Mat44(self._data[index].ravel().tolist())
+        return Mat44Array(self._data[index])
+
+    def __mul__(self, obj):
+        return self.multiply(obj)
+
+    # Properties ---
+    @property
+    def array(self):
+        """The (N, 4, 4) array, not copied."""
+        return self._data
+
+    # Methods ---
+    def to_list(self):
+        """Convert to a list of Mat44."""
+        return [pr.Types.Mat44(matrix) for matrix in self._data.reshape(-1, 16).tolist()]
+
+    def decompose_many(self, **kwargs):
+        """Decompose every matrix.
+
+        Returns the translate (N, 3), rotate (N, 3) or (N, 4) for the
+        quaternion formalism, scale (N, 3) and shear (N, 3) arrays.
+        """
+        rotation_formalism = kwargs.get("rotation", RotationFormalism.euler)
+        angle_unit = kwargs.get("angle_unit", Unit.degree)
+        rotate_order = kwargs.get("rotate_order", RotateOrder.xyz)
+
+        translate, rotation, scale, shear = numpy_backend.decompose_arrays(self._data)
+        size = 4 if rotation_formalism == RotationFormalism.quaternion else 3
+        rotate = np.zeros((len(self), size))
+        for order, mask in _by_rotate_order(rotate_order, len(self)):
+            rotate[mask] = numpy_backend.from_rotation_matrix(
+                rotation[mask],
+                rotate_order=order,
+                angle_unit=angle_unit,
+                rotation_formalism=rotation_formalism,
+            )
+        return translate, rotate, scale, shear
+
+    def inverse(self):
+        """Return the inverse of every matrix."""
+        return Mat44Array(np.linalg.inv(self._data))
+
+    def multiply(self, obj):
+        """Matrix product, broadcast against a Mat44, (4, 4) or (N, 4, 4)."""
+        if isinstance(obj, Mat44Array):
+            obj = obj._data
+        elif not isinstance(obj, np.ndarray):
+            obj = np.array(list(obj), dtype=np.float64).reshape(4, 4)
+        return Mat44Array(np.matmul(self._data, obj))
+
+    def cleanup(self, precision=4):
+        """Vectorized pyrig.maths.matrix.cleanup_matrix.
+
+        Matrices whose scale rounds to 1.0 are rebuilt with an exact unit
+        scale (and no shear), the other ones are kept as they are.
+        """
+        translate, rotation, scale, _ = numpy_backend.decompose_arrays(self._data)
+        dirty = np.all(np.round(scale, precision) == 1.0, axis=-1)
+        dirty &= np.any(scale != 1.0, axis=-1)
+
+        result = self._data.copy()
+        if np.any(dirty):
+            result[dirty, :3, :3] = rotation[dirty]
+            result[dirty, 3, :3] = translate[dirty]
+        return Mat44Array(result)
+
+    # Class Methods ---
+    @classmethod
+    def from_list(cls, matrices):
+        """Build from a list of Mat44."""
+        return cls(matrices)
+
+    @classmethod
+    def compose_many(cls, translate, rotate, scale, shear=(0, 0, 0), **kwargs):
+        """Compose N matrices.
+
+        Each component is an (N, 3) array, or a single value broadcast to
+        every matrix. rotate can be euler (N, 3) or quaternions (N, 4), and
+        rotate_order a single order or one per matrix.
+        """
+        angle_unit = kwargs.get("angle_unit", Unit.degree)
+        rotate_order = kwargs.get("rotate_order", RotateOrder.xyz)
+
+        rotate = np.asarray(rotate, dtype=np.float64)
+        if np.ndim(rotate_order) == 0:
+            return cls(
+                numpy_backend.compose_arrays(
+                    translate,
+                    rotate,
+                    scale,
+                    shear,
+                    rotate_order=rotate_order,
+                    angle_unit=angle_unit,
+                )
+            )
+
+        size = len(rotate_order)
+        rotate = np.broadcast_to(rotate, (size, rotate.shape[-1]))
+        rotation = np.zeros((size, 3, 3))
+        for order, mask in _by_rotate_order(rotate_order, size):
+            rotation[mask] = numpy_backend.to_rotation_matrix(
+                rotate[mask], rotate_order=order, angle_unit=angle_unit
+            )
+        return cls(
+            numpy_backend.compose_rotation_arrays(translate, rotation, scale, shear)
+        )
@@ -0,0 +1,602 @@
+"""NumPy implementation of pyrig.core.Types, usable without OpenMaya.
+
+Matrices follow the Maya conventions: row vectors, translation in the last
+row and a S * SH * R * T composition order, with the shear matrix defined
+as in the xform documentation.
+
+The functions work on stacks of matrices (..., 4, 4) so they can be used
+for one matrix or thousands at once.
+"""
+import numpy as np
+
+from pyrig.constants import RotationFormalism, Unit, RotateOrder
+
+EPSILON = 1e-10
+
+_AXES = {"x": 0, "y": 1, "z": 2}
+_ROTATE_ORDERS = {
+    RotateOrder.xyz: "xyz",
+    RotateOrder.yzx: "yzx",
+    RotateOrder.zxy: "zxy",
+    RotateOrder.xzy: "xzy",
+    RotateOrder.yxz: "yxz",
+    RotateOrder.zyx: "zyx",
+}
+
+
+def _order_axes(rotate_order):
+    """Return the axis indices of the given rotate order, first applied first."""
+    order = _ROTATE_ORDERS.get(rotate_order, rotate_order)
+    if order not in _ROTATE_ORDERS.values():
+        raise ValueError("'{}' is not a valid rotate order.".format(rotate_order))
+    return [_AXES[axis] for axis in order]
+
+
+def axis_rotation(axis, angles):
+    """Row vector rotation matrices (..., 3, 3) around the given axis."""
+    angles = np.asarray(angles, dtype=np.float64)
+    cos, sin = np.cos(angles), np.sin(angles)
+    result = np.zeros(angles.shape + (3, 3))
+    i, j = [(1, 2), (2, 0), (0, 1)][axis]
+    result[..., axis, axis] = 1.0
+    result[..., i, i] = cos
+    result[..., j, j] = cos
+    result[..., i, j] = sin
+    result[..., j, i] = -sin
+    return result
+
+
+def euler_to_matrix(angles, rotate_order=RotateOrder.xyz):
+    """Convert (..., 3) radian euler angles to (..., 3, 3) rotation matrices."""
+    angles = np.asarray(angles, dtype=np.float64)
+    result = None
+    for axis in _order_axes(rotate_order):
+        rotation = axis_rotation(axis, angles[..., axis])
+        result = rotation if result is None else np.matmul(result, rotation)
+    return result
+
+
+def matrix_to_euler(rotation, rotate_order=RotateOrder.xyz):
+    """Convert (..., 3, 3) rotation matrices to (..., 3) radian euler angles."""
+    rotation = np.asarray(rotation, dtype=np.float64)
+    i, j, k = _order_axes(rotate_order)
+    parity = 1.0 if (j - i) % 3 == 1 else -1.0
+
+    # work on the column vector matrix, C = Rk * Rj * Ri
+    col = np.swapaxes(rotation, -1, -2)
+    cos_j = np.hypot(col[..., i, i], col[..., j, i])
+    angle_i = np.arctan2(parity * col[..., k, j], col[..., k, k])
+    angle_j = np.arctan2(-parity * col[..., k, i], cos_j)
+    angle_k = np.arctan2(parity * col[..., j, i], col[..., i, i])
+
+    # gimbal lock, the remaining rotation is carried by the first axis
+    gimbal = cos_j < EPSILON
+    if np.any(gimbal):
+        angle_i = np.where(
+            gimbal,
+            np.arctan2(-parity * col[..., j, k], col[..., j, j]),
+            angle_i,
+        )
+        angle_k = np.where(gimbal, 0.0, angle_k)
+
+    result = np.zeros(rotation.shape[:-2] + (3,))
+    result[..., i] = angle_i
+    result[..., j] = angle_j
+    result[..., k] = angle_k
+    return result
+
+
+def quaternion_to_matrix(quaternion):
+    """Convert (..., 4) xyzw quaternions to (..., 3, 3) rotation matrices."""
+    quaternion = np.asarray(quaternion, dtype=np.float64)
+    norm = np.linalg.norm(quaternion, axis=-1, keepdims=True)
+    x, y, z, w = np.moveaxis(quaternion / np.where(norm, norm, 1.0), -1, 0)
+    result = np.empty(quaternion.shape[:-1] + (3, 3))
+    result[..., 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    result[..., 0, 1] = 2.0 * (x * y + z * w)
+    result[..., 0, 2] = 2.0 * (x * z - y * w)
+    result[..., 1, 0] = 2.0 * (x * y - z * w)
+    result[..., 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    result[..., 1, 2] = 2.0 * (y * z + x * w)
+    result[..., 2, 0] = 2.0 * (x * z + y * w)
+    result[..., 2, 1] = 2.0 * (y * z - x * w)
+    result[..., 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return result
+
+
+def matrix_to_quaternion(rotation):
+    """Convert (..., 3, 3) rotation matrices to (..., 4) xyzw quaternions."""
+    rotation = np.asarray(rotation, dtype=np.float64)
+    r00, r11, r22 = rotation[..., 0, 0], rotation[..., 1, 1], rotation[..., 2, 2]
+    result = np.empty(rotation.shape[:-2] + (4,))
+    result[..., 3] = np.sqrt(np.maximum(0.0, 1.0 + r00 + r11 + r22)) / 2.0
+    result[..., 0] = np.copysign(
+        np.sqrt(np.maximum(0.0, 1.0 + r00 - r11 - r22)) / 2.0,
+        rotation[..., 1, 2] - rotation[..., 2, 1],
+    )
+    result[..., 1] = np.copysign(
+        np.sqrt(np.maximum(0.0, 1.0 - r00 + r11 - r22)) / 2.0,
+        rotation[..., 2, 0] - rotation[..., 0, 2],
+    )
+    result[..., 2] = np.copysign(
+        np.sqrt(np.maximum(0.0, 1.0 - r00 - r11 + r22)) / 2.0,
+        rotation[..., 0, 1] - rotation[..., 1, 0],
+    )
+    return result
+
+
+def shear_matrix(shear):
+    """Convert (..., 3) xy, xz, yz shear values to (..., 3, 3) matrices."""
+    shear = np.asarray(shear, dtype=np.float64)
+    result = np.zeros(shear.shape[:-1] + (3, 3))
+    result[..., 0, 0] = result[..., 1, 1] = result[..., 2, 2] = 1.0
+    result[..., 1, 0] = shear[..., 0]
+    result[..., 2, 0] = shear[..., 1]
+    result[..., 2, 1] = shear[..., 2]
+    return result
+
+
+def to_rotation_matrix(rotate, rotate_order=RotateOrder.xyz, angle_unit=Unit.degree):
+    """Convert euler (..., 3) or quaternion (..., 4) rotations to matrices."""
+    rotate = np.asarray(rotate, dtype=np.float64)
+    if rotate.shape[-1] == 4:  # RotationFormalism.quaternion
+        return quaternion_to_matrix(rotate)
+    if angle_unit == Unit.degree:
+        rotate = np.radians(rotate)
+    return euler_to_matrix(rotate, rotate_order)
+
+
+def compose_arrays(
+    translate,
+    rotate,
+    scale,
+    shear=(0, 0, 0),
+    rotate_order=RotateOrder.xyz,
+    angle_unit=Unit.degree,
+):
+    """Compose (..., 4, 4) matrices, the components are broadcast together."""
+    rotation = to_rotation_matrix(rotate, rotate_order, angle_unit)
+    return compose_rotation_arrays(translate, rotation, scale, shear)
+
+
+def compose_rotation_arrays(translate, rotation, scale, shear=(0, 0, 0)):
+    """Compose (..., 4, 4) matrices from (..., 3, 3) rotation matrices."""
+    scale = np.asarray(scale, dtype=np.float64)
+    upper = scale[..., :, None] * np.matmul(shear_matrix(shear), rotation)
+
+    translate = np.asarray(translate, dtype=np.float64)
+    shape = np.broadcast_shapes(upper.shape[:-2], translate.shape[:-1])
+    result = np.zeros(shape + (4, 4))
+    result[..., :3, :3] = upper
+    result[..., 3, :3] = translate
+    result[..., 3, 3] = 1.0
+    return result
+
+
+def decompose_arrays(matrix):
+    """Decompose (..., 4, 4) matrices.
+
+    Returns the translate (..., 3), rotation matrix (..., 3, 3),
+    scale (..., 3) and shear (..., 3) arrays.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    translate = matrix[..., 3, :3].copy()
+    row0, row1, row2 = (matrix[..., i, :3] for i in range(3))
+
+    def _norm(vector):
+        length = np.linalg.norm(vector, axis=-1)
+        return length, vector / np.where(length, length, 1.0)[..., None]
+
+    def _dot(a, b):
+        return np.sum(a * b, axis=-1)
+
+    scale_x, axis_x = _norm(row0)
+    xy = _dot(row1, axis_x)
+    scale_y, axis_y = _norm(row1 - xy[..., None] * axis_x)
+    xz = _dot(row2, axis_x)
+    yz = _dot(row2, axis_y)
+    scale_z, axis_z = _norm(row2 - xz[..., None] * axis_x - yz[..., None] * axis_y)
+
+    scale = np.stack([scale_x, scale_y, scale_z], axis=-1)
+    safe = np.where(scale, scale, 1.0)
+    shear = np.stack(
+        [xy / safe[..., 1], xz / safe[..., 2], yz / safe[..., 2]], axis=-1
+    )
+    rotation = np.stack([axis_x, axis_y, axis_z], axis=-2)
+
+    # mirrored matrices, flip the scale to keep a proper rotation
+    flip = np.linalg.det(rotation) < 0.0
+    if np.any(flip):
+        sign = np.where(flip, -1.0, 1.0)
+        scale = scale * sign[..., None]
+        rotation = rotation * sign[..., None, None]
+
+    return translate, rotation, scale, shear
+
+
+def from_rotation_matrix(
+    rotation,
+    rotate_order=RotateOrder.xyz,
+    angle_unit=Unit.degree,
+    rotation_formalism=RotationFormalism.euler,
+):
+    """Convert (..., 3, 3) rotation matrices to euler or quaternion arrays."""
+    if rotation_formalism == RotationFormalism.quaternion:
+        return matrix_to_quaternion(rotation)
+    euler = matrix_to_euler(rotation, rotate_order)
+    if angle_unit == Unit.degree:
+        euler = np.degrees(euler)
+    return euler
+
+
+class Mat44(object):
+    """4x4 matrix with the pyrig.dataType.Mat44 API, backed by NumPy."""
+
+    def __init__(self, *args, **kwargs):
+        """"""
+        if len(args) >= 3:
+            self._data = compose_arrays(
+                args[0],
+                args[1],
+                args[2],
+                args[3] if len(args) > 3 else (0, 0, 0),
+                rotate_order=kwargs.get("rotate_order", RotateOrder.xyz),
+                angle_unit=kwargs.get("angle_unit", Unit.degree),
+            )
+        elif not args:
+            self._data = np.identity(4)
+        else:
+            data = args[0]
+            if isinstance(data, Mat44):
+                data = data._data
+            elif not isinstance(data, np.ndarray):
+                data = list(data)
+            self._data = np.array(data, dtype=np.float64).reshape(4, 4)
+        # decomposition cache, see `_cached`
+        self._cache = {}
+
+    # Builtin Methods ---
+    def __repr__(self):
+        rows = ", ".join(
+            "({})".format(", ".join("{:g}".format(x) for x in row))
+            for row in self._data
+        )
+        return "dataType.{}(({}))".format(self.__class__.__name__, rows)
+
+    def __iter__(self):
+        return iter(self._data.ravel().tolist())
+
+    def __len__(self):
+        return 16
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            return float(self._data[index])
+        return float(self._data.flat[index])
+
+    def __setitem__(self, index, value):
+        if isinstance(index, tuple):
+            self._data[index] = value
+        else:
+            self._data.flat[index] = value
+        self._cache.clear()
+
+    def __eq__(self, obj):
+        try:
+            return np.array_equal(self._data, Mat44(obj)._data)
+        except (TypeError, ValueError):
+            return False
+
+    def __ne__(self, obj):
+        return not self.__eq__(obj)
+
+    def __add__(self, obj):
+        if isinstance(obj, (int, float)):
+            return Mat44(self._data + obj)
+        return Mat44(self._data + Mat44(obj)._data)
+
+    def __sub__(self, obj):
+        if isinstance(obj, (int, float)):
+            return Mat44(self._data - obj)
+        return Mat44(self._data - Mat44(obj)._data)
+
+    def __mul__(self, obj):
+        if isinstance(obj, (int, float)):
+            return Mat44(self._data * obj)
+        return Mat44(np.matmul(self._data, Mat44(obj)._data))
+
+    def __rmul__(self, obj):
+        if isinstance(obj, (int, float)):
+            return Mat44(self._data * obj)
+        return NotImplemented
+
+    # Properties ---
+    @property
+    def array(self):
+        """Copy of the matrix as a (4, 4) ndarray."""
+        return self._data.copy()
+
+    @property
+    def translate(self):
+        return self.get_translate()
+
+    @translate.setter
+    def translate(self, val):
+        self.set_translate(val)
+
+    @property
+    def rotate(self):
+        return self.get_rotate()
+
+    @rotate.setter
+    def rotate(self, args):
+        if isinstance(args[0], (tuple, list)):
+            kwargs = {}
+            if len(args) >= 2:
+                kwargs["rotate_order"] = args[1]
+            if len(args) >= 3:
+                kwargs["angle_unit"] = args[2]
+            self.set_rotate(val=args[0], **kwargs)
+        else:
+            self.set_rotate(val=args)
+
+    @property
+    def scale(self):
+        return self.get_scale()
+
+    @scale.setter
+    def scale(self, val):
+        self.set_scale(val)
+
+    @property
+    def shear(self):
+        return self.get_shear()
+
+    @shear.setter
+    def shear(self, val):
+        self.set_shear(val)
+
+    # Methods - MMatrix ---
+    def getElement(self, row, col):
+        """"""
+        return float(self._data[row, col])
+
+    def setElement(self, row, col, value):
+        """"""
+        self._data[row, col] = value
+        self._cache.clear()
+
+    def inverse(self):
+        """"""
+        return Mat44(np.linalg.inv(self._data))
+
+    def transpose(self):
+        """"""
+        return Mat44(self._data.T)
+
+    def det3x3(self):
+        """"""
+        return float(np.linalg.det(self._data[:3, :3]))
+
+    def det4x4(self):
+        """"""
+        return float(np.linalg.det(self._data))
+
+    def isEquivalent(self, other, tolerance=EPSILON):
+        """"""
+        return bool(np.allclose(self._data, Mat44(other)._data, rtol=0.0, atol=tolerance))
+
+    # Methods ---
+    def decompose(self, **kwargs):
+        """"""
+        translate = self.get_translate(**kwargs)
+        rotate = self.get_rotate(**kwargs)
+        scale = self.get_scale(**kwargs)
+        shear = self.get_shear(**kwargs)
+
+        return translate, rotate, scale, shear
+
+    def pick(self, translate=False, rotate=False, scale=False, shear=False):
+        """"""
+        t, r, s, sh = self.decompose()
+        if not translate:
+            t = (0, 0, 0)
+        if not rotate:
+            r = (0, 0, 0)
+        if not scale:
+            s = (1, 1, 1)
+        if not shear:
+            sh = (0, 0, 0)
+        return Mat44(t, r, s, sh)
+
+    def get_translate(self, **kwargs):
+        """"""
+        return self._data[3, :3].tolist()
+
+    def get_rotate(self, **kwargs):
+        """"""
+        rotation_formalism = kwargs.get("rotation", RotationFormalism.euler)
+        angle_unit = kwargs.get("angle_unit", Unit.degree)
+        rotate_order = kwargs.get("rotate_order", RotateOrder.xyz)
+
+        key = ("rotate", rotation_formalism, angle_unit, rotate_order)
+        return list(self._cached(
+            key,
+            lambda: from_rotation_matrix(
+                self._components()[0],
+                rotate_order=rotate_order,
+                angle_unit=angle_unit,
+                rotation_formalism=rotation_formalism,
+            ).tolist(),
+        ))
+
+    def get_scale(self, **kwargs):
+        """"""
+        return self._components()[1].tolist()
+
+    def get_shear(self, **kwargs):
+        """"""
+        return self._components()[2].tolist()
+
+    def set_translate(self, val, **kwargs):
+        """"""
+        self._data[3, :3] = val
+
+    def set_rotate(self, val, **kwargs):
+        """"""
+        rotation = to_rotation_matrix(
+            val,
+            rotate_order=kwargs.get("rotate_order", RotateOrder.xyz),
+            angle_unit=kwargs.get("angle_unit", Unit.degree),
+        )
+        _, scale, shear = self._components()
+        self._assign(rotation, scale, shear)
+
+    def set_scale(self, val, **kwargs):
+        """"""
+        rotation, _, shear = self._components()
+        self._assign(rotation, np.asarray(val, dtype=np.float64), shear)
+
+    def set_shear(self, val, **kwargs):
+        """"""
+        rotation, scale, _ = self._components()
+        self._assign(rotation, scale, np.asarray(val, dtype=np.float64))
+
+    # Internal Methods ---
+    def _cached(self, key, compute):
+        """Return the cached decomposition value for key, compute it if needed."""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _components(self):
+        """Cached rotation matrix, scale and shear of the matrix."""
+        return self._cached(
+            ("components",), lambda: decompose_arrays(self._data)[1:]
+        )
+
+    def _assign(self, rotation, scale, shear):
+        """Rebuild the upper 3x3 from its components, keep the translation."""
+        self._data[:3, :3] = compose_rotation_arrays(
+            (0, 0, 0), rotation, scale, shear
+        )[:3, :3]
+        self._cache.clear()
+        self._cache[("components",)] = (rotation, scale, shear)
+
+
+class Vec3(object):
+    """3d vector with the pyrig.dataType.Vec3 API, backed by NumPy."""
+
+    def __init__(self, *args, **kwargs):
+        """"""
+        if not args:
+            args = (0.0, 0.0, 0.0)
+        elif len(args) == 1:
+            args = args[0]
+        self._data = np.array([float(x) for x in args], dtype=np.float64)
+        if self._data.shape != (3,):
+            raise ValueError("Vec3 expects 3 values, got {}.".format(len(self._data)))
+
+    # Builtin Methods ---
+    def __repr__(self):
+        return "dataType.{}({})".format(
+            self.__class__.__name__, ", ".join("{:g}".format(x) for x in self._data)
+        )
+
+    def __iter__(self):
+        return iter(self._data.tolist())
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, index):
+        return float(self._data[index])
+
+    def __setitem__(self, index, value):
+        self._data[index] = value
+
+    def __eq__(self, obj):
+        try:
+            return np.array_equal(self._data, Vec3(obj)._data)
+        except (TypeError, ValueError):
+            return False
+
+    def __ne__(self, obj):
+        return not self.__eq__(obj)
+
+    def __neg__(self):
+        return Vec3(-self._data)
+
+    def __add__(self, obj):
+        return Vec3(self._data + Vec3(obj)._data)
+
+    def __sub__(self, obj):
+        return Vec3(self._data - Vec3(obj)._data)
+
+    def __mul__(self, obj):
+        if isinstance(obj, (int, float)):
+            return Vec3(self._data * obj)
+        if isinstance(obj, Mat44):
+            # directions ignore the translation like MVector * MMatrix
+            return Vec3(np.matmul(self._data, obj._data[:3, :3]))
+        return float(np.dot(self._data, Vec3(obj)._data))
+
+    def __rmul__(self, obj):
+        if isinstance(obj, (int, float)):
+            return Vec3(self._data * obj)
+        return NotImplemented
+
+    def __truediv__(self, obj):
+        return Vec3(self._data / obj)
+
+    __div__ = __truediv__
+
+    def __xor__(self, obj):
+        """Cross product, like MVector ^ MVector."""
+        return Vec3(np.cross(self._data, Vec3(obj)._data))
+
+    # Properties ---
+    @property
+    def x(self):
+        return float(self._data[0])
+
+    @x.setter
+    def x(self, val):
+        self._data[0] = val
+
+    @property
+    def y(self):
+        return float(self._data[1])
+
+    @y.setter
+    def y(self, val):
+        self._data[1] = val
+
+    @property
+    def z(self):
+        return float(self._data[2])
+
+    @z.setter
+    def z(self, val):
+        self._data[2] = val
+
+    # Methods ---
+    def length(self):
+        """"""
+        return float(np.linalg.norm(self._data))
+
+    def normal(self):
+        """"""
+        length = self.length()
+        return Vec3(self._data / length) if length else Vec3(self._data)
+
+    def normalize(self):
+        """"""
+        length = self.length()
+        if length:
+            self._data /= length
+        return self
+
+    def isEquivalent(self, other, tolerance=EPSILON):
+        """"""
+        return bool(np.allclose(self._data, Vec3(other)._data, rtol=0.0, atol=tolerance))
@@ -1,21 +1,34 @@
 import copy
+import heapq
 import six
 import re
 import json
 import logging
 import os
 
-from maya import cmds
+from pyrig.backend import cmds
+
+import pyrig.schema
 
 LOG = logging.getLogger(__name__)
 
-NODE_TYPE_REMAP = {}
+DIGITS = "1234567890"
 FILE_PATH = os.path.dirname(os.path.realpath(__file__))
 NODE_TYPE_REMAP_FILE = os.path.join(
     FILE_PATH, "ressources", "suffix_type_remap.json"
 )
-with open(NODE_TYPE_REMAP_FILE, "r") as stream:
-    NODE_TYPE_REMAP = json.load(stream)
+# {node type: suffix}, read from NODE_TYPE_REMAP_FILE on first use.
+NODE_TYPE_REMAP = {}
+_NODE_TYPE_REMAP_STATE = {"loaded": False}
+
+
+def get_node_type_remap():
+    """Return the {node type: suffix} table, loaded once."""
+    if not _NODE_TYPE_REMAP_STATE["loaded"]:
+        with open(NODE_TYPE_REMAP_FILE, "r") as stream:
+            NODE_TYPE_REMAP.update(json.load(stream))
+        _NODE_TYPE_REMAP_STATE["loaded"] = True
+    return NODE_TYPE_REMAP
 
 
 def validate_name(name, node_type=None):
@@ -34,25 +47,127 @@ def validate_name(name, node_type=None):
 
     return copy.copy(name)
 
-def find_next_available_name(value, index=None):
-    """Recursive."""
-    # Strip trailing numbers.
-    cache_value = copy.copy(value)
-    value.rstrip("1234567890")
-
-    # Append index if specified.
-    if index:
-        value = "{0}{1}".format(value, index)
-    if cmds.objExists(value):
-        # Configure index.
-        index = index or 0
-        index += 1
-        return find_next_available_name(cache_value, index)
-    return value
+def find_next_available_name(value, indexed=False):
+    """Return the first free name made of value and a numeric suffix.
+
+    Trailing numbers of value are stripped, the bare name is used first
+    then value1, value2, etc. With indexed the bare name is skipped, like
+    createNode does when the requested name is taken.
+    """
+    return NAME_INDEX.next_available(value, indexed=indexed)
+
+class _Suffixes(object):
+    """Used numeric suffixes of a single prefix, 0 standing for no suffix."""
+
+    def __init__(self):
+        """"""
+        self.used = set()
+        self._released = []
+        self._next = 0
+
+    def add(self, index):
+        """"""
+        self.used.add(index)
+
+    def discard(self, index):
+        """"""
+        if index in self.used:
+            self.used.remove(index)
+            if index < self._next:
+                heapq.heappush(self._released, index)
+
+    def pop(self, minimum=0):
+        """Reserve and return the smallest free index, minimum or above."""
+        skipped = []
+        index = None
+        while self._released:
+            released = heapq.heappop(self._released)
+            if released in self.used:
+                continue
+            if released < minimum:
+                skipped.append(released)
+                continue
+            index = released
+            break
+        for released in skipped:
+            heapq.heappush(self._released, released)
+        if index is not None:
+            self.used.add(index)
+            return index
+
+        while self._next in self.used or self._next < minimum:
+            if self._next not in self.used:
+                heapq.heappush(self._released, self._next)
+            self._next += 1
+        self.used.add(self._next)
+        return self._next
+
+
+class NameIndex(object):
+    """Index of the numeric suffixes used in the scene, per name prefix.
+
+    A prefix is indexed with a single cmds.ls scan the first time it is
+    requested, pyrig then keeps it up to date when it creates, renames and
+    deletes nodes. Allocated names are still checked with one objExists in
+    case the scene was edited behind pyrig's back.
+    """
+
+    def __init__(self):
+        """"""
+        self._prefixes = {}
+
+    def clear(self):
+        """Forget every indexed prefix, used when a new scene is opened."""
+        self._prefixes.clear()
+
+    def add(self, name):
+        """Mark the given node name as used."""
+        prefix, index = self._split(name)
+        if index is not None and prefix in self._prefixes:
+            self._prefixes[prefix].add(index)
+
+    def discard(self, name):
+        """Mark the given node name as free."""
+        prefix, index = self._split(name)
+        if index is not None and prefix in self._prefixes:
+            self._prefixes[prefix].discard(index)
+
+    def next_available(self, value, indexed=False):
+        """Reserve and return the next free name for the given value.
+
+        With indexed the name always has a numeric suffix.
+        """
+        prefix = value.rstrip(DIGITS)
+        suffixes = self._prefixes.get(prefix)
+        if suffixes is None:
+            suffixes = self._prefixes[prefix] = _Suffixes()
+            for name in cmds.ls("{}*".format(prefix)) or []:
+                self.add(name)
+
+        while True:
+            name = "{}{}".format(prefix, suffixes.pop(int(indexed)) or "")
+            if not cmds.objExists(name):
+                return name
+
+    @staticmethod
+    def _split(name):
+        """Split a node name in prefix and index, index is None if not indexable."""
+        name = str(name).split("|")[-1]
+        prefix = name.rstrip(DIGITS)
+        digits = name[len(prefix):]
+        if not digits:
+            return prefix, 0
+        if digits.startswith("0"):
+            return prefix, None
+        return prefix, int(digits)
+
+
+NAME_INDEX = NameIndex()
+
 
 def transpose_node_type(node_type):
     """"""
-    return NODE_TYPE_REMAP.get(node_type, node_type)
+    return get_node_type_remap().get(node_type, node_type)
 
 class Name(object):
     """"""
@@ -242,31 +357,34 @@ class AttributName(object):
     @property
     def nice(self):
         """"""
-        try:
-            return cmds.attributeName(self.plug, nice=True, leaf=True)
-        except:
-            return None
+        return self._attribute_name("nice")
 
     @property
     def short(self):
         """"""
-        try:
-            return cmds.attributeName(self.plug, short=True, leaf=True)
-        except:
-            return None
+        return self._attribute_name("short")
 
     @property
     def long(self):
         """"""
-        try:
-            return cmds.attributeName(self.plug, long=True, leaf=True)
-        except:
-            return None
+        return self._attribute_name("long")
 
     def to_string(self):
         """"""
         return self.SEPARATOR.join(self.tokens)
     
+    def _attribute_name(self, flag):
+        """Query the leaf attribute name, cached by the schema."""
+        try:
+            return pyrig.schema.SCHEMA.query(
+                self.node,
+                self[-1].unindexed(),
+                ("attributeName", flag),
+                lambda: cmds.attributeName(self.plug, leaf=True, **{flag: True}),
+            )
+        except:
+            return None
+
     def unindexed(self):
         """"""
         if self.index is None:
@@ -1,15 +1,239 @@
+import collections
+import importlib
 import logging
 import six
+import weakref
 
-from maya import cmds
+from pyrig.backend import cmds, om
+from pyrig.constants import MayaType
 
 import pyrig.core as pr
+import pyrig.apiAttribute
 import pyrig.attribute
 import pyrig.name
+import pyrig.schema
+import pyrig.session
 
 LOG = logging.getLogger(__name__)
 
 USE_UUID = True
+USE_HANDLE_CACHE = True
+USE_IDENTITY_MAP = True
+
+# Bumped by scene callbacks whenever a node is renamed or the DAG changes,
+# cached node names older than this generation get resolved again.
+_SCENE_STATE = {"generation": 0, "callbacks": []}
+
+# Identity map of the living pyrig nodes, keyed by uuid.
+_REGISTRY = weakref.WeakValueDictionary()
+
+# Inherited types of the node types, they do not change with the scene.
+_TYPE_HIERARCHY = {}
+
+# node type: pyrig class, see `register_class`.
+_CLASSES = {}
+
+# Modules registering the builtin classes, imported by the first lookup.
+BUILTIN_CLASS_MODULES = ("pyrig.transform", "pyrig.joint", "pyrig.container")
+_BUILTIN_CLASSES = {"loaded": False}
+
+# Most recently used concrete node types and their class, see `find_class`.
+CLASS_CACHE_SIZE = 256
+_CLASS_CACHE = collections.OrderedDict()
+
+
+def _invalidate_names(*args):
+    """Scene callback, invalidates every cached node name."""
+    _SCENE_STATE["generation"] += 1
+
+
+def _on_name_changed(mobject, previous_name, *args):
+    """Scene callback, keeps the name caches and the name index up to date."""
+    _invalidate_names()
+    pyrig.name.NAME_INDEX.discard(previous_name)
+    pyrig.name.NAME_INDEX.add(om.MFnDependencyNode(mobject).name())
+
+
+def _on_node_removed(mobject, *args):
+    """Scene callback, drops deleted nodes from the identity map."""
+    fn_node = om.MFnDependencyNode(mobject)
+    uuid = fn_node.uuid().asString()
+    unregister(uuid)
+    pyrig.schema.SCHEMA.invalidate(uuid)
+    pyrig.name.NAME_INDEX.discard(fn_node.name())
+    _forget_members(uuid)
+
+
+def _on_scene_changed(*args):
+    """Scene callback, forgets the nodes and names of the previous scene."""
+    _REGISTRY.clear()
+    pyrig.name.NAME_INDEX.clear()
+    pyrig.schema.SCHEMA.clear()
+    _forget_members()
+
+
+def _on_undo_redo(*args):
+    """Scene callback, undo and redo revert container edits pyrig made."""
+    _forget_members()
+
+
+def _forget_members(uuid=None):
+    """Drop the given node, or every node, from the container members cache."""
+    if uuid is None:
+        pyrig.container.MEMBERS.clear()
+    else:
+        pyrig.container.MEMBERS.forget(uuid)
+
+
+def register(node):
+    """Store the given node in the identity map."""
+    if not USE_IDENTITY_MAP:
+        return
+    install_callbacks()
+    _REGISTRY[node.uuid] = node
+
+
+def unregister(uuid):
+    """Remove the node matching the given uuid from the identity map."""
+    _REGISTRY.pop(uuid, None)
+
+
+def get_registered(uuid):
+    """Return the living pyrig node matching the given uuid, if any."""
+    if not USE_IDENTITY_MAP:
+        return None
+    return _REGISTRY.get(uuid)
+
+
+def get_node_name(mobject):
+    """Return the shortest unique name of the given MObject."""
+    if mobject.hasFn(om.MFn.kDagNode):
+        return om.MDagPath.getAPathTo(mobject).partialPathName()
+    return om.MFnDependencyNode(mobject).name()
+
+
+def install_callbacks():
+    """Register the scene callbacks keeping the node caches up to date."""
+    if om is None or _SCENE_STATE["callbacks"]:
+        return
+    _SCENE_STATE["callbacks"] = [
+        om.MNodeMessage.addNameChangedCallback(
+            om.MObject.kNullObj, _on_name_changed
+        ),
+        om.MDagMessage.addAllDagChangesCallback(_invalidate_names),
+        om.MDGMessage.addNodeRemovedCallback(_on_node_removed, "dependNode"),
+        om.MSceneMessage.addCallback(
+            om.MSceneMessage.kAfterNew, _on_scene_changed
+        ),
+        om.MSceneMessage.addCallback(
+            om.MSceneMessage.kAfterOpen, _on_scene_changed
+        ),
+        om.MEventMessage.addEventCallback("Undo", _on_undo_redo),
+        om.MEventMessage.addEventCallback("Redo", _on_undo_redo),
+    ]
+
+
+def remove_callbacks():
+    """Remove the scene callbacks installed by `install_callbacks`."""
+    for callback_id in _SCENE_STATE["callbacks"]:
+        om.MMessage.removeCallback(callback_id)
+    _SCENE_STATE["callbacks"] = []
+    _REGISTRY.clear()
+    _invalidate_names()
+
+
+def get_type_hierarchy(node_type):
+    """Return the inherited types of the given node type, queried once."""
+    if node_type not in _TYPE_HIERARCHY:
+        _TYPE_HIERARCHY[node_type] = cmds.nodeType(
+            node_type, isTypeName=True, inherited=True
+        ) or []
+    return list(_TYPE_HIERARCHY[node_type])
+
+
+def register_class(node_type, cls):
+    """Use cls for the nodes of node_type and of the types deriving from it.
+
+    The most derived registered type of a node decides its class, plugins
+    register the classes of their own node types the same way.
+    """
+    _CLASSES[node_type] = cls
+    _CLASS_CACHE.clear()
+
+
+def find_class(inherited_types):
+    """Return the pyrig class of a node from its inherited types."""
+    if not inherited_types:
+        return Node
+    node_type = inherited_types[-1]
+    cls = _CLASS_CACHE.pop(node_type, None)
+    if cls is None:
+        _load_builtin_classes()
+        cls = Node
+        for type_ in reversed(inherited_types):
+            if type_ in _CLASSES:
+                cls = _CLASSES[type_]
+                break
+        if len(_CLASS_CACHE) >= CLASS_CACHE_SIZE:
+            _CLASS_CACHE.popitem(last=False)
+    _CLASS_CACHE[node_type] = cls
+    return cls
+
+
+def _load_builtin_classes():
+    """Import the modules registering the builtin classes, once."""
+    if _BUILTIN_CLASSES["loaded"]:
+        return
+    _BUILTIN_CLASSES["loaded"] = True
+    for module in BUILTIN_CLASS_MODULES:
+        importlib.import_module(module)
+
+
+def create_nodes(node_type, names, parents=None, cls=None):
+    """Create many nodes of a type in one pass and return their pyrig nodes.
+
+    With OpenMaya the nodes are created by a single modifier, the uuids
+    and inherited types are queried once for all of them.
+
+    Parameters
+    ----------
+    node_type : str
+        Type of the nodes.
+    names : list
+        Name of each node, the node type is used for the empty ones.
+    parents : list, optional
+        Parent of each DAG node, None for the world.
+        by default None
+    cls : type, optional
+        pyrig class of the nodes.
+        by default None, the class pr.create would use.
+    """
+    names = [str(pyrig.name.validate_name(name, node_type)) for name in names]
+    if not names:
+        return []
+    parents = parents or [None] * len(names)
+
+    if om is not None:
+        with pr.edit_session("pyrig_create_nodes") as session:
+            created = session.create_nodes(node_type, names, parents)
+    else:
+        nodes = []
+        for name, parent in zip(names, parents):
+            flags = {"name": name, "skipSelect": True}
+            if parent:
+                flags["parent"] = str(parent)
+            nodes.append(cmds.createNode(node_type, **flags))
+        created = list(zip(nodes, cmds.ls(nodes, uuid=True)))
+
+    inherited_types = cmds.nodeType(created[0][0], inherited=True)
+    if cls is None:
+        cls = pr._find_cls_from_types(inherited_types)
+    result = []
+    for node, uuid in created:
+        pyrig.name.NAME_INDEX.add(node)
+        result.append(cls._from_scene(node, uuid, inherited_types))
+    return result
+
 
 class Node(object):
     """Base class for nodes."""
@@ -33,23 +257,33 @@ class Node(object):
             by default True
         """
 
-        self._name = pyrig.name.validate_name(name, node_type)
-        self._name.node = self
-        self._node = str(self.name)
+        self._name = None
+        self._node = None
         self._node_type = node_type
+        self._handle = None
+        self._cached_node = (None, None)
+        self._inherited_dcc_types = None
 
         # create the node
         if create:
             kwargs = {}
-            kwargs["name"] = str(self._name)
+            kwargs["name"] = str(pyrig.name.validate_name(name, node_type))
             if parent:
                 kwargs["parent"] = str(parent)
-            self._node = cmds.createNode(node_type, skipSelect=True, **kwargs)
-            self._name = pyrig.name.validate_name(self._node, node_type)
+            session = pyrig.session.current()
+            if session is not None:
+                self._node = session.create_node(node_type, **kwargs)
+            else:
+                self._node = cmds.createNode(node_type, skipSelect=True, **kwargs)
+            pyrig.name.NAME_INDEX.add(self._node)
+            self._inherited_dcc_types = get_type_hierarchy(node_type)
+        else:
+            self._name = pyrig.name.validate_name(name, node_type)
             self._name.node = self
+            self._node = str(self._name)
 
-        self._uuid = cmds.ls(self._node, uuid=True)[0]
-        self._inherited_dcc_types = cmds.nodeType(self._node, inherited=True)
+        self._bind(cmds.ls(self._node, uuid=True)[0])
+        self._init_from_scene()
 
     # Builtin Methods ---
     def __repr__(self):
@@ -68,26 +302,41 @@ class Node(object):
     
     def attr(self, key):
         """"""
+        if pyrig.attribute.USE_API and om is not None:
+            return pyrig.apiAttribute.ApiAttribute(self, key)
         return pyrig.attribute.Attribute(self, key)
         
     # Properties ---
     @property
     def name(self):
         """"""
+        if self._name is None:
+            self._name = pyrig.name.validate_name(self._node, self._node_type)
+            self._name.node = self
         return self._name
 
     @name.setter
     def name(self, val):
         self._name = pyrig.name.validate_name(val, self.node_type)
         self._name.node = self
-        cmds.rename(self.node, str(self._name))
+        previous_name = self.node
+        new_name = cmds.rename(previous_name, str(self._name))
+        pyrig.name.NAME_INDEX.discard(previous_name)
+        pyrig.name.NAME_INDEX.add(new_name)
 
     @property
     def node(self):
         """"""
+        if USE_HANDLE_CACHE:
+            node = self._get_cached_node()
+            if node:
+                return node
         if USE_UUID:
             node = cmds.ls(self.uuid)
-            return node[0] if node else self._node
+            if node:
+                self._node = node[0]
+                self._resolve_handle()
+            return self._node
         return self._node
 
     @property
@@ -105,20 +354,81 @@ class Node(object):
     @property
     def dcc_type(self):
         """"""
-        try:
-            return cmds.nodeType(self.node)
-        except:
-            return "unknown"
+        inherited_types = self._get_inherited_types()
+        if inherited_types:
+            return inherited_types[-1]
+        return "unknown"
 
     @property
     def exists(self):
         """"""
         return cmds.objExists(self.node)
 
+    # Internal Methods ---
+    def _bind(self, uuid, inherited_types=None):
+        """Store the scene fields of the node and register it.
+
+        The inherited types are queried on first use when not given.
+        """
+        self._uuid = uuid
+        if inherited_types is not None:
+            self._inherited_dcc_types = list(inherited_types)
+        self._resolve_handle()
+        register(self)
+
+    def _get_inherited_types(self):
+        """Return the inherited node types, queried once."""
+        if self._inherited_dcc_types is None:
+            try:
+                self._inherited_dcc_types = cmds.nodeType(self.node, inherited=True)
+            except:
+                return []
+        return self._inherited_dcc_types
+
+    def _init_from_scene(self):
+        """Set the python state of the object, its node being bound.
+
+        Called by the constructor and by `_from_scene`, which skips
+        __init__ (pr.get, the batch builders). Subclasses keeping state
+        override it instead of setting it in __init__.
+        """
+
+    def _resolve_handle(self):
+        """Store an MObjectHandle pointing to the current node."""
+        self._handle = None
+        self._cached_node = (None, None)
+        if not USE_HANDLE_CACHE or om is None:
+            return
+        install_callbacks()
+
+        selection = om.MSelectionList()
+        try:
+            selection.add(self._node)
+        except RuntimeError:
+            return
+        self._handle = om.MObjectHandle(selection.getDependNode(0))
+
+    def _get_cached_node(self):
+        """Return the cached node name, None if the handle is invalid."""
+        if self._handle is None or not self._handle.isValid():
+            return None
+
+        generation, node = self._cached_node
+        if generation != _SCENE_STATE["generation"]:
+            node = get_node_name(self._handle.object())
+            self._node = node
+            self._cached_node = (_SCENE_STATE["generation"], node)
+        return node
+
     # Methods ---
     def delete(self):
         """"""
-        cmds.delete(self.node)
+        node = self.node
+        cmds.delete(node)
+        unregister(self.uuid)
+        pyrig.schema.SCHEMA.invalidate(self.uuid)
+        pyrig.name.NAME_INDEX.discard(node)
+        _forget_members(self.uuid)
 
     # Methods - attribute
     def add_attr(self, attr="", **kwargs):
@@ -144,6 +454,23 @@ class Node(object):
             lock=True,
         )
     
+    def get_values(self, names, as_array=False):
+        """Read the given attributes in one pass, see `pr.get_values`.
+
+        Returns a {name: value} dict or an (N, size) float64 array.
+        """
+        values = pyrig.apiAttribute.read_values([self.attr(name) for name in names])
+        if as_array:
+            return pyrig.maths.matrix_array.values_to_array(values)
+        return dict(zip(names, values))
+
+    def set_values(self, values, **kwargs):
+        """Set {name: value} in one pass, see `pr.set_values`."""
+        pyrig.attribute.set_values(
+            dict((self.attr(name), value) for name, value in values.items()),
+            **kwargs
+        )
+
     def get_unique_attr_name(self, attr_name, idx=None):
         """"""
         result = "{}{}".format(attr_name, idx or "")
@@ -200,6 +527,25 @@ class Node(object):
             self[attr].visible = not hide
 
     # Class Methods ---
+    @classmethod
+    def _from_scene(cls, node, uuid, inherited_types=None):
+        """Wrap an existing node whose uuid, and inherited types, are known.
+
+        Used by `pr.get` and the batch builders, no scene query is made,
+        the name is parsed on first use. __init__ is not called, the state
+        of subclasses is set by `_init_from_scene`.
+        """
+        obj = cls.__new__(cls)
+        obj._name = None
+        obj._node = node
+        obj._node_type = None
+        obj._handle = None
+        obj._cached_node = (None, None)
+        obj._inherited_dcc_types = None
+        obj._bind(uuid, inherited_types)
+        obj._init_from_scene()
+        return obj
+
     @classmethod
     def retrieve(cls, name):
         """Convert given string to Node object."""
@@ -236,9 +582,14 @@ class DagNode(Node):
             raise TypeError("Parent node {} doesn't exists".format(value))
 
         value = pr.get(value)
-        if value.dag_parent and value.dag_parent.node == self.node:
+        value_parent = value.parent
+        current_parent = self.parent
+        if value_parent and value_parent.node == self.node:
             raise TypeError("Cannot parent an object to one of its children")
-        elif self.dag_parent and self.dag_parent.node == value.node:
+        elif current_parent and current_parent.node == value.node:
             LOG.debug("{} is already a child of {}".format(self, value))
             return
         cmds.parent(self, value, relative=relative)
+
+
+register_class(MayaType.dagNode, DagNode)
@@ -0,0 +1,52 @@
+"""Undoable command executing the modifiers queued by pyrig.session."""
+import maya.api.OpenMaya as om
+
+import pyrig.session
+
+
+def maya_useNewAPI():
+    """Use the python API 2.0."""
+    pass
+
+
+class PyrigModifier(om.MPxCommand):
+    """Execute the next pending modifier and register it for undo."""
+
+    def __init__(self):
+        """"""
+        super(PyrigModifier, self).__init__()
+        self._modifier = None
+
+    @staticmethod
+    def creator():
+        """"""
+        return PyrigModifier()
+
+    def doIt(self, args):
+        """"""
+        self._modifier = pyrig.session.pop_pending()
+        self.redoIt()
+
+    def redoIt(self):
+        """"""
+        self._modifier.doIt()
+
+    def undoIt(self):
+        """"""
+        self._modifier.undoIt()
+
+    def isUndoable(self):
+        """"""
+        return True
+
+
+def initializePlugin(plugin):
+    """"""
+    om.MFnPlugin(plugin, "pyrig").registerCommand(
+        pyrig.session.PLUGIN_COMMAND, PyrigModifier.creator
+    )
+
+
+def uninitializePlugin(plugin):
+    """"""
+    om.MFnPlugin(plugin).deregisterCommand(pyrig.session.PLUGIN_COMMAND)
@@ -0,0 +1,299 @@
+import json
+import logging
+import sys
+import time
+
+import pyrig.backend
+
+LOG = logging.getLogger(__name__)
+
+# Module globals replaced by recording proxies while profiling.
+PATCHED_GLOBALS = ("cmds",)
+# Modules whose frames are not tagged as pyrig entry points.
+IGNORED_MODULES = ("pyrig.profiler", "pyrig.backend", "pyrig.benchmark")
+# Modules whose globals are not patched, pyrig.backend itself is patched so
+# the modules imported while profiling bind the proxies.
+UNPATCHED_MODULES = ("pyrig.profiler", "pyrig.backend")
+
+
+def _frame_name(frame):
+    """Return the "Class.method" name of the given frame.
+
+    Before python 3.11 the class is found from the self/cls argument.
+    """
+    qualname = getattr(frame.f_code, "co_qualname", None)
+    if qualname is not None:
+        return qualname
+    return _method_name(frame)
+
+
+def _method_name(frame):
+    """Return the "Class.method" name of a frame from its self/cls argument."""
+    code = frame.f_code
+    if not code.co_argcount or code.co_varnames[0] not in ("self", "cls"):
+        return code.co_name
+    obj = frame.f_locals.get(code.co_varnames[0])
+    if obj is None:
+        return code.co_name
+    cls = obj if isinstance(obj, type) else type(obj)
+    for klass in cls.__mro__:
+        if _defines(klass, code):
+            return "{}.{}".format(klass.__name__, code.co_name)
+    return "{}.{}".format(cls.__name__, code.co_name)
+
+
+def _defines(cls, code):
+    """Check if the given code is a method, or property, of cls itself."""
+    member = cls.__dict__.get(code.co_name)
+    if member is None:
+        return False
+    if isinstance(member, property):
+        functions = (member.fget, member.fset, member.fdel)
+    else:
+        functions = (getattr(member, "__func__", member),)
+    return any(
+        getattr(function, "__code__", None) is code for function in functions
+    )
+
+
+def _is_pyrig_frame(frame):
+    """Check if the given frame belongs to the pyrig API."""
+    module = frame.f_globals.get("__name__", "")
+    if module != "pyrig" and not module.startswith("pyrig."):
+        return False
+    return not module.startswith(IGNORED_MODULES)
+
+
+def _pyrig_stack():
+    """Return the pyrig frames calling the profiled call, outermost first."""
+    stack = []
+    frame = sys._getframe(2)
+    while frame is not None:
+        if _is_pyrig_frame(frame):
+            stack.append(_frame_name(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+class _ModuleProxy(object):
+    """Stand-in of a module whose callables record their calls."""
+
+    def __init__(self, module, prefix, profiler):
+        """"""
+        self._module = module
+        self._prefix = prefix
+        self._profiler = profiler
+        self._wrappers = {}
+
+    def __getattr__(self, name):
+        value = getattr(self._module, name)
+        if not callable(value) or isinstance(value, type):
+            return value
+        if name not in self._wrappers:
+            self._wrappers[name] = self._wrap(name, value)
+        return self._wrappers[name]
+
+    def _wrap(self, name, function):
+        """Return a function recording the calls of the given one."""
+        call_name = "{}.{}".format(self._prefix, name)
+        profiler = self._profiler
+
+        def wrapper(*args, **kwargs):
+            stack = _pyrig_stack()
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.record(stack, call_name, time.perf_counter() - start)
+
+        wrapper.__name__ = name
+        wrapper.__doc__ = function.__doc__
+        return wrapper
+
+
+class Profiler(object):
+    """Record the scene calls made by pyrig and the API that caused them.
+
+    The `cmds` global of the loaded pyrig modules is replaced by a proxy
+    while the profiler is active, each call is recorded with its wall time
+    and tagged with the pyrig frames calling it. The pyrig modules imported
+    while profiling get the proxy from pyrig.backend, unless the modules to
+    patch are given. OpenMaya objects are not instrumented.
+
+    Usage::
+
+        with pyrig.profiler.Profiler() as profiler:
+            build_rig()
+        print(profiler.table())
+        profiler.dump_collapsed("rig.folded")
+    """
+
+    def __init__(self, modules=None):
+        """_summary_
+
+        Parameters
+        ----------
+        modules : list, optional
+            Modules to patch.
+            by default None, every loaded pyrig module.
+        """
+        self._modules = modules
+        self._patched = []
+        self._records = {}
+
+    # Builtin Methods ---
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    # Properties ---
+    @property
+    def records(self):
+        """{(stack, call): [count, seconds]} of the recorded calls."""
+        return self._records
+
+    # Methods ---
+    def start(self):
+        """Patch the modules, the following scene calls are recorded."""
+        if self._patched:
+            return
+        modules = self._modules
+        if modules is None:
+            modules = [
+                module for name, module in sorted(sys.modules.items())
+                if module is not None
+                and (name == "pyrig" or name.startswith("pyrig."))
+                and not name.startswith(UNPATCHED_MODULES)
+            ]
+            modules.append(pyrig.backend)
+
+        proxies = {}
+        for module in modules:
+            for name in PATCHED_GLOBALS:
+                value = getattr(module, name, None)
+                if value is None or isinstance(value, _ModuleProxy):
+                    continue
+                if id(value) not in proxies:
+                    proxies[id(value)] = _ModuleProxy(value, name, self)
+                setattr(module, name, proxies[id(value)])
+                self._patched.append((module, name, value))
+
+    def stop(self):
+        """Restore the patched modules and the ones imported since `start`."""
+        for module, name, value in reversed(self._patched):
+            setattr(module, name, value)
+        self._patched = []
+
+        for module in list(sys.modules.values()):
+            namespace = getattr(module, "__dict__", {})
+            for name in PATCHED_GLOBALS:
+                value = namespace.get(name)
+                if isinstance(value, _ModuleProxy) and value._profiler is self:
+                    setattr(module, name, value._module)
+
+    def clear(self):
+        """Forget the recorded calls."""
+        self._records = {}
+
+    def record(self, stack, call_name, seconds):
+        """Record a call made from the given pyrig stack."""
+        record = self._records.setdefault((stack, call_name), [0, 0.0])
+        record[0] += 1
+        record[1] += seconds
+
+    def summary(self):
+        """Return the calls grouped by outermost pyrig entry point.
+
+        Each item is a dict with the entry point, call, count and seconds
+        keys, sorted by decreasing time.
+        """
+        grouped = {}
+        for (stack, call_name), (count, seconds) in self._records.items():
+            entry_point = stack[0] if stack else "<outside pyrig>"
+            record = grouped.setdefault((entry_point, call_name), [0, 0.0])
+            record[0] += count
+            record[1] += seconds
+
+        rows = [
+            {
+                "entry_point": entry_point,
+                "call": call_name,
+                "count": count,
+                "seconds": seconds,
+            }
+            for (entry_point, call_name), (count, seconds) in grouped.items()
+        ]
+        return sorted(rows, key=lambda row: (-row["seconds"], -row["count"]))
+
+    def table(self, limit=None):
+        """Return the summary as a text table."""
+        rows = self.summary()[:limit]
+        lines = [
+            "{:<40} {:<30} {:>8} {:>12} {:>12}".format(
+                "entry point", "call", "count", "total (ms)", "mean (us)"
+            )
+        ]
+        for row in rows:
+            lines.append(
+                "{:<40} {:<30} {:>8} {:>12.3f} {:>12.1f}".format(
+                    row["entry_point"],
+                    row["call"],
+                    row["count"],
+                    row["seconds"] * 1e3,
+                    row["seconds"] * 1e6 / row["count"],
+                )
+            )
+        total_count = sum(row["count"] for row in rows)
+        total_seconds = sum(row["seconds"] for row in rows)
+        lines.append(
+            "{:<40} {:<30} {:>8} {:>12.3f}".format(
+                "total", "", total_count, total_seconds * 1e3
+            )
+        )
+        return "\n".join(lines)
+
+    def to_json(self):
+        """Return the summary and the full stacks as a JSON string."""
+        stacks = [
+            {
+                "stack": list(stack),
+                "call": call_name,
+                "count": count,
+                "seconds": seconds,
+            }
+            for (stack, call_name), (count, seconds) in self._records.items()
+        ]
+        return json.dumps(
+            {"summary": self.summary(), "stacks": stacks}, indent=4
+        )
+
+    def collapsed(self, weight="time"):
+        """Return the records in the collapsed stack format of flamegraph.pl.
+
+        Parameters
+        ----------
+        weight : str, optional
+            "time" to weight the stacks in microseconds, "count" in calls.
+            by default "time"
+        """
+        lines = []
+        for (stack, call_name), (count, seconds) in sorted(self._records.items()):
+            value = count if weight == "count" else int(round(seconds * 1e6))
+            frames = [frame.replace(";", ":") for frame in stack + (call_name,)]
+            lines.append("{} {}".format(";".join(frames), value))
+        return "\n".join(lines)
+
+    def dump_json(self, file_path):
+        """Write `to_json` to the given file."""
+        with open(file_path, "w") as stream:
+            stream.write(self.to_json())
+
+    def dump_collapsed(self, file_path, weight="time"):
+        """Write `collapsed` to the given file."""
+        with open(file_path, "w") as stream:
+            stream.write(self.collapsed(weight=weight))
+            stream.write("\n")
@@ -0,0 +1,96 @@
+import logging
+
+from pyrig.backend import cmds
+
+LOG = logging.getLogger(__name__)
+
+USE_SCHEMA_CACHE = True
+
+
+class AttributeSchema(object):
+    """Cache of the attribute metadata (attributeQuery, attributeName...).
+
+    Static attributes are the same on every node of a type, their metadata
+    is stored once per (node type, attribute). Dynamic attributes, and the
+    metadata that can differ per node like the data type of a typed or
+    generic attribute, are stored per (node uuid, attribute) and dropped
+    when pyrig edits them, edits made with cmds.addAttr directly are not
+    seen.
+    """
+
+    def __init__(self):
+        """"""
+        self._is_static = {}
+        self._static = {}
+        self._dynamic = {}
+
+    def clear(self, static=False):
+        """Forget the dynamic attributes, and the static ones if specified."""
+        self._dynamic.clear()
+        if static:
+            self._is_static.clear()
+            self._static.clear()
+
+    def invalidate(self, uuid, attr=None):
+        """Forget the dynamic attributes of the given node uuid.
+
+        Only the given attribute is forgotten if specified.
+        """
+        if attr is None:
+            self._dynamic.pop(uuid, None)
+        elif uuid in self._dynamic:
+            self._dynamic[uuid].pop(attr, None)
+
+    def has_static(self, node, attr):
+        """Check if attr is a static attribute of the given node."""
+        if not USE_SCHEMA_CACHE or getattr(node, "uuid", None) is None:
+            return False
+        return self.is_static(node.dcc_type, attr)
+
+    def is_static(self, node_type, attr):
+        """Check if the given attribute is a static attribute of the node type."""
+        key = (node_type, attr)
+        if key not in self._is_static:
+            try:
+                self._is_static[key] = bool(
+                    cmds.attributeQuery(attr, type=node_type, exists=True)
+                )
+            except RuntimeError:
+                self._is_static[key] = False
+        return self._is_static[key]
+
+    def query(self, node, attr, key, getter, per_node=False):
+        """Return the metadata stored under key, getter() computes it once.
+
+        Parameters
+        ----------
+        node : pyrig.node.Node
+            Attribute holder node.
+        attr : str
+            Unindexed leaf attribute name.
+        key : hashable
+            Metadata key, eg. ("listParent", True).
+        getter : callable
+            Query returning the metadata value.
+        per_node : bool, optional
+            Store the value per node even for a static attribute.
+            by default False
+        """
+        entry = self._entry(node, attr, per_node)
+        if entry is None:
+            return getter()
+        if key not in entry:
+            entry[key] = getter()
+        value = entry[key]
+        return list(value) if isinstance(value, list) else value
+
+    def _entry(self, node, attr, per_node=False):
+        """Return the metadata dict of the given attribute, None if not cached."""
+        if not USE_SCHEMA_CACHE or getattr(node, "uuid", None) is None:
+            return None
+        if not per_node and self.has_static(node, attr):
+            return self._static.setdefault((node.dcc_type, attr), {})
+        return self._dynamic.setdefault(node.uuid, {}).setdefault(attr, {})
+
+
+SCHEMA = AttributeSchema()
@@ -0,0 +1,455 @@
+import logging
+import os
+import six
+
+import pyrig.backend
+from pyrig.backend import cmds, om
+
+import pyrig.core as pr
+
+LOG = logging.getLogger(__name__)
+
+PLUGIN_PATH = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "plugins", "pyrigModifier.py"
+)
+PLUGIN_COMMAND = "pyrigModifier"
+
+# Stack of the active sessions, the last one receives the edits.
+_SESSIONS = []
+# Modifiers waiting to be picked up by the pyrigModifier command.
+_PENDING = []
+
+
+def current():
+    """Return the active EditSession, None outside of `pr.edit_session`."""
+    return _SESSIONS[-1] if _SESSIONS else None
+
+
+def pop_pending():
+    """Return the next modifier to execute, used by the undo plugin."""
+    return _PENDING.pop(0)
+
+
+def _load_plugin():
+    """Load the command registering the modifiers in the undo queue."""
+    if not cmds.pluginInfo(PLUGIN_PATH, query=True, loaded=True):
+        cmds.loadPlugin(PLUGIN_PATH, quiet=True)
+
+
+def _is_dag_type(node_type):
+    """Check if the given node type is a DAG node type."""
+    return "dagNode" in pyrig.node.get_type_hierarchy(node_type)
+
+
+def _is_shape_type(node_type):
+    """Check if the given node type is a shape type."""
+    return "shape" in pyrig.node.get_type_hierarchy(node_type)
+
+
+def _get_plug(plug):
+    """Resolve the given plug, raise like cmds does if it does not exist."""
+    selection = om.MSelectionList()
+    try:
+        selection.add(str(plug))
+        return selection.getPlug(0)
+    except (RuntimeError, TypeError):
+        raise RuntimeError("No object matches name: {}".format(plug))
+
+
+def _plug_key(mplug):
+    """Unique key for the given MPlug."""
+    return mplug.partialName(
+        includeNodeName=True,
+        includeNonMandatoryIndices=True,
+        useFullAttributePath=True,
+        useLongNames=True,
+    )
+
+
+def set_plug_value(modifier, mplug, value):
+    """Queue the given value on the modifier.
+
+    Returns False when the value type is not supported, nothing is queued
+    in that case.
+    """
+    if isinstance(value, (om.MMatrix, om.MVector, pr.Types.Mat44, pr.Types.Vec3)):
+        value = list(value)
+
+    if isinstance(value, six.string_types):
+        if mplug.attribute().hasFn(om.MFn.kEnumAttribute):
+            # enum field name
+            fn_enum = om.MFnEnumAttribute(mplug.attribute())
+            modifier.newPlugValueInt(mplug, fn_enum.fieldValue(value))
+            return True
+        modifier.newPlugValueString(mplug, value)
+        return True
+
+    if isinstance(value, (list, tuple)):
+        data = _array_data(mplug, value)
+        if data is not None:
+            modifier.newPlugValue(mplug, data)
+            return True
+        if len(value) == 16 and not mplug.isCompound:
+            data = om.MFnMatrixData().create(om.MMatrix(list(value)))
+            modifier.newPlugValue(mplug, data)
+            return True
+        if mplug.isCompound and len(value) == mplug.numChildren():
+            children = [mplug.child(i) for i in range(len(value))]
+            if not all(_is_scalar_plug(child) for child in children):
+                return False
+            for child, child_value in zip(children, value):
+                set_plug_value(modifier, child, child_value)
+            return True
+        return False
+
+    if not isinstance(value, (bool, int, float)) or not _is_scalar_plug(mplug):
+        return False
+
+    attribute = mplug.attribute()
+    if attribute.hasFn(om.MFn.kUnitAttribute):
+        unit_type = om.MFnUnitAttribute(attribute).unitType()
+        if unit_type == om.MFnUnitAttribute.kAngle:
+            modifier.newPlugValueMAngle(
+                mplug, om.MAngle(value, om.MAngle.uiUnit())
+            )
+        elif unit_type == om.MFnUnitAttribute.kDistance:
+            modifier.newPlugValueMDistance(
+                mplug, om.MDistance(value, om.MDistance.uiUnit())
+            )
+        elif unit_type == om.MFnUnitAttribute.kTime:
+            modifier.newPlugValueMTime(mplug, om.MTime(value, om.MTime.uiUnit()))
+        else:
+            modifier.newPlugValueDouble(mplug, value)
+    elif attribute.hasFn(om.MFn.kEnumAttribute):
+        modifier.newPlugValueInt(mplug, int(value))
+    else:
+        numeric_type = om.MFnNumericAttribute(attribute).numericType()
+        if numeric_type == om.MFnNumericData.kBoolean:
+            modifier.newPlugValueBool(mplug, bool(value))
+        elif numeric_type in (om.MFnNumericData.kFloat, om.MFnNumericData.kDouble):
+            modifier.newPlugValueDouble(mplug, value)
+        else:
+            modifier.newPlugValueInt(mplug, int(value))
+    return True
+
+
+def _array_data(mplug, value):
+    """Return the array data of the given value, None if not an array plug."""
+    attribute = mplug.attribute()
+    if mplug.isArray or not attribute.hasFn(om.MFn.kTypedAttribute):
+        return None
+    data_type = om.MFnTypedAttribute(attribute).attrType()
+    if data_type == om.MFnData.kDoubleArray:
+        return om.MFnDoubleArrayData().create(om.MDoubleArray(list(value)))
+    if data_type == om.MFnData.kIntArray:
+        return om.MFnIntArrayData().create(
+            om.MIntArray([int(each) for each in value])
+        )
+    return None
+
+
+def _is_scalar_plug(mplug):
+    """Check if the given plug holds a single numeric value."""
+    if mplug.isArray or mplug.isCompound:
+        return False
+    attribute = mplug.attribute()
+    if attribute.hasFn(om.MFn.kUnitAttribute):
+        return True
+    if attribute.hasFn(om.MFn.kEnumAttribute):
+        return True
+    if attribute.hasFn(om.MFn.kNumericAttribute):
+        return om.MFnNumericAttribute(attribute).numericType() in (
+            om.MFnNumericData.kBoolean,
+            om.MFnNumericData.kByte,
+            om.MFnNumericData.kChar,
+            om.MFnNumericData.kShort,
+            om.MFnNumericData.kInt,
+            om.MFnNumericData.kInt64,
+            om.MFnNumericData.kFloat,
+            om.MFnNumericData.kDouble,
+        )
+    return False
+
+
+class EditSession(object):
+    """Queue the graph edits into a single MDagModifier.
+
+    Connections, disconnections, values and lock states set through pyrig
+    are queued and executed with one doIt() when the session ends, node
+    creation flushes the queue so the created node can be used right away.
+    Everything done in the session lives in a single undo chunk.
+    """
+
+    def __init__(self, chunk_name="pyrig"):
+        """"""
+        if om is None:
+            raise RuntimeError(
+                "Edit sessions need OpenMaya, the '{}' backend is not supported.".format(
+                    pyrig.backend.BACKEND
+                )
+            )
+        self._chunk_name = chunk_name
+        self._modifier = om.MDagModifier()
+        self._pending = 0
+        self._inputs = {}
+        self._locks = {}
+        # Existing indices of the multis queried in the session, they are
+        # kept up to date by the session edits and are not flushed.
+        self._indices = {}
+
+    # Builtin Methods ---
+    def __enter__(self):
+        parent = current()
+        if parent is not None:
+            parent.flush()
+        else:
+            cmds.undoInfo(openChunk=True, chunkName=self._chunk_name)
+        _SESSIONS.append(self)
+        return self
+
+    def __exit__(self, *args):
+        try:
+            self.flush()
+        finally:
+            _SESSIONS.remove(self)
+            if not _SESSIONS:
+                cmds.undoInfo(closeChunk=True)
+
+    # Properties ---
+    @property
+    def pending(self):
+        """Number of queued edits."""
+        return self._pending
+
+    # Methods ---
+    def flush(self):
+        """Execute the queued edits."""
+        if not self._pending:
+            return
+        _load_plugin()
+        _PENDING.append(self._modifier)
+        self._modifier = om.MDagModifier()
+        self._pending = 0
+        self._inputs = {}
+        self._locks = {}
+        try:
+            getattr(cmds, PLUGIN_COMMAND)()
+        finally:
+            if _PENDING:
+                _PENDING.pop()
+
+    def create_node(self, node_type, name=None, parent=None):
+        """Create a node through the modifier and return its name."""
+        if _is_dag_type(node_type):
+            parent_object = om.MObject.kNullObj
+            if parent:
+                selection = om.MSelectionList()
+                selection.add(str(parent))
+                parent_object = selection.getDependNode(0)
+            mobject = self._modifier.createNode(node_type, parent_object)
+        else:
+            mobject = om.MDGModifier.createNode(self._modifier, node_type)
+        self._pending += 1
+        if not parent and _is_shape_type(node_type):
+            # the modifier returns the transform created above the shape,
+            # cmds.createNode returns the shape and names it
+            self.flush()
+            mobject = om.MFnDagNode(mobject).child(0)
+        if name:
+            self._modifier.renameNode(mobject, name)
+            self._pending += 1
+        self.flush()
+        return pyrig.node.get_node_name(mobject)
+
+    def create_nodes(self, node_type, names, parents=None):
+        """Create many nodes through the modifier, executed once.
+
+        Like cmds.createNode, the shapes created without a parent are
+        returned and named, not their transforms.
+
+        Parameters
+        ----------
+        node_type : str
+            Type of the nodes.
+        names : list
+            Name of each node.
+        parents : list, optional
+            Parent of each node, None for the world.
+            by default None
+
+        Returns the [(name, uuid), ...] of the created nodes.
+        """
+        is_dag = _is_dag_type(node_type)
+        is_shape = _is_shape_type(node_type)
+        parents = parents or [None] * len(names)
+        parent_objects = {}
+        mobjects = []
+        for parent in parents:
+            if is_dag:
+                if parent and str(parent) not in parent_objects:
+                    selection = om.MSelectionList()
+                    selection.add(str(parent))
+                    parent_objects[str(parent)] = selection.getDependNode(0)
+                parent_object = parent_objects.get(str(parent), om.MObject.kNullObj)
+                mobject = self._modifier.createNode(node_type, parent_object)
+            else:
+                mobject = om.MDGModifier.createNode(self._modifier, node_type)
+            mobjects.append(mobject)
+        self._pending += 1
+        if is_shape and not all(parents):
+            # return the shapes, not the transforms created above them
+            self.flush()
+            mobjects = [
+                mobject if parent else om.MFnDagNode(mobject).child(0)
+                for mobject, parent in zip(mobjects, parents)
+            ]
+        for name, mobject in zip(names, mobjects):
+            self._modifier.renameNode(mobject, name)
+        self._pending += 1
+        self.flush()
+        return self._created(mobjects)
+
+    def create_chain(self, node_type, names, parent=None):
+        """Create a chain of DAG nodes, each one under the previous one.
+
+        Returns the [(name, uuid), ...] of the created nodes.
+        """
+        parent_object = om.MObject.kNullObj
+        if parent:
+            selection = om.MSelectionList()
+            selection.add(str(parent))
+            parent_object = selection.getDependNode(0)
+        mobjects = []
+        for name in names:
+            mobject = self._modifier.createNode(node_type, parent_object)
+            self._modifier.renameNode(mobject, name)
+            mobjects.append(mobject)
+            parent_object = mobject
+        self._pending += 1
+        self.flush()
+        return self._created(mobjects)
+
+    def _created(self, mobjects):
+        """Return the [(name, uuid), ...] of the given created nodes."""
+        return [
+            (
+                pyrig.node.get_node_name(mobject),
+                om.MFnDependencyNode(mobject).uuid().asString(),
+            )
+            for mobject in mobjects
+        ]
+
+    def reparent(self, node, parent=None):
+        """Queue the reparenting of a DAG node, under the world if no parent.
+
+        The local transformation is kept, like `cmds.parent(relative=True)`.
+        """
+        selection = om.MSelectionList()
+        selection.add(str(node))
+        parent_object = om.MObject.kNullObj
+        if parent:
+            selection.add(str(parent))
+            parent_object = selection.getDependNode(1)
+        self._modifier.reparentNode(selection.getDependNode(0), parent_object)
+        self._pending += 1
+
+    def connect(self, source, destination, force=True):
+        """Queue a connection between the given plugs."""
+        source_plug = _get_plug(source)
+        destination_plug = _get_plug(destination)
+        key = _plug_key(destination_plug)
+
+        if force:
+            existing = self._inputs.get(key)
+            if existing is None and key not in self._inputs:
+                existing = destination_plug.source()
+                existing = None if existing.isNull else existing
+            if existing is not None:
+                self._modifier.disconnect(existing, destination_plug)
+
+        self._modifier.connect(source_plug, destination_plug)
+        self._inputs[key] = source_plug
+        self._touch_index(destination_plug)
+        self._pending += 1
+
+    def disconnect(self, source, destination):
+        """Queue the disconnection of the given plugs."""
+        destination_plug = _get_plug(destination)
+        self._modifier.disconnect(_get_plug(source), destination_plug)
+        self._inputs[_plug_key(destination_plug)] = None
+        self._pending += 1
+
+    def set_value(self, plug, value):
+        """Queue the given value, False if the value can not be queued.
+
+        The plug is a "node.attr" string or an MPlug. The queue is flushed
+        before returning False so the caller can set the value right away
+        without breaking the edits order.
+        """
+        mplug = plug if isinstance(plug, om.MPlug) else _get_plug(plug)
+        if set_plug_value(self._modifier, mplug, value):
+            self._touch_index(mplug)
+            self._pending += 1
+            return True
+        self.flush()
+        return False
+
+    def set_lock(self, plug, value):
+        """Queue the lock state of the given plug."""
+        self._modifier.commandToExecute(
+            'setAttr -lock {} "{}"'.format(int(bool(value)), plug)
+        )
+        self._locks[str(plug)] = bool(value)
+        self._pending += 1
+
+    def set_flags(self, plug, **flags):
+        """Queue setAttr flags of the given plug, eg. keyable=False."""
+        arguments = " ".join(
+            "-{} {}".format(flag, int(bool(value)))
+            for flag, value in sorted(flags.items())
+        )
+        self._modifier.commandToExecute('setAttr {} "{}"'.format(arguments, plug))
+        self._pending += 1
+
+    def get_lock(self, plug):
+        """Return the queued lock state of the given plug, if any."""
+        return self._locks.get(str(plug))
+
+    def multi_indices(self, plug):
+        """Return the existing indices of the given multi plug.
+
+        The indices are queried once per session, then updated by the
+        connections, values and removals made through the session.
+        """
+        key = _plug_key(_get_plug(plug))
+        if key not in self._indices:
+            self.flush()
+            self._indices[key] = set(cmds.getAttr(str(plug), multiIndices=True) or [])
+        return sorted(self._indices[key])
+
+    def remove_multi_instance(self, plug):
+        """Remove the given element of a multi and break its connections."""
+        mplug = _get_plug(plug)
+        self._modifier.commandToExecute(
+            'removeMultiInstance -break true "{}"'.format(plug)
+        )
+        self._pending += 1
+        removed = [mplug]
+        if mplug.isCompound:
+            removed += [mplug.child(i) for i in range(mplug.numChildren())]
+        for each in removed:
+            self._inputs[_plug_key(each)] = None
+        if mplug.isElement:
+            indices = self._indices.get(_plug_key(mplug.array()))
+            if indices is not None:
+                indices.discard(mplug.logicalIndex())
+
+    def _touch_index(self, mplug):
+        """Register the index of the multi element edited by the given plug."""
+        while mplug.isChild:
+            mplug = mplug.parent()
+        if not mplug.isElement:
+            return
+        indices = self._indices.get(_plug_key(mplug.array()))
+        if indices is not None:
+            indices.add(mplug.logicalIndex())
@@ -1,15 +1,209 @@
 import logging
 import six
 
-import maya.api.OpenMaya as om
-from maya import cmds
+from pyrig.backend import cmds, om
+from pyrig.constants import MayaType
 
 import pyrig.core as pr
+import pyrig.attribute
 import pyrig.maths.matrix
 import pyrig.node
 
 LOG = logging.getLogger(__name__)
 
+# Attributes moving a transform away from its local matrix channels.
+PIVOT_ATTRIBUTES = ("rotatePivot", "scalePivot", "rotateAxis")
+# Set the channels of the transforms moved by move_many in one modifier,
+# else they are moved one by one with cmds.xform.
+SET_CHANNELS = om is not None
+
+
+def move_many(matrices, reset_joint_orient=False):
+    """Move the given transforms to their world matrix in one pass.
+
+    The parents are moved before their children. Without OpenMaya, or if
+    SET_CHANNELS is False, every transform is moved by a
+    `cmds.xform(worldSpace=True)` like `move_to`. Otherwise the local
+    matrix of a transform is computed from its offsetParentMatrix and,
+    if it inherits its transform, the target world matrix of its parent
+    when the parent is moved too, else its current one. Everything is
+    then set as translate/rotate/scale/shear channels by a single
+    `pr.set_values`, transforms with pivots or a rotate axis are moved
+    with `move_to` afterwards.
+
+    Parameters
+    ----------
+    matrices : dict
+        {Transform or name: world matrix}.
+    reset_joint_orient : bool, optional
+        Zero the jointOrient of the joints, their rotate takes it over.
+        by default False
+    """
+    items = [
+        (pr.get(node), pyrig.maths.matrix.cleanup_matrix(pr.Types.Mat44(matrix)))
+        for node, matrix in matrices.items()
+    ]
+    if not items:
+        return
+    paths = cmds.ls([node.uuid for node, _ in items], long=True) or []
+    if len(paths) != len(items):
+        raise RuntimeError("Some of the transforms to move do not exist.")
+
+    # parents first
+    order = sorted(range(len(items)), key=lambda i: paths[i].count("|"))
+    if not SET_CHANNELS:
+        for i in order:
+            node, world = items[i]
+            if reset_joint_orient and node.dcc_type == "joint":
+                cmds.setAttr("{}.jointOrient".format(paths[i]), 0.0, 0.0, 0.0)
+            cmds.xform(paths[i], worldSpace=True, matrix=list(world))
+        return
+    targets = dict((paths[i], items[i][1]) for i in order)
+
+    # read everything needed in one pass
+    plugs = []
+    for i in order:
+        node, _ = items[i]
+        plugs.append("{}.rotateOrder".format(paths[i]))
+        plugs.append("{}.offsetParentMatrix".format(paths[i]))
+        plugs.append("{}.inheritsTransform".format(paths[i]))
+        plugs += ["{}.{}".format(paths[i], attr) for attr in PIVOT_ATTRIBUTES]
+        if node.dcc_type == "joint":
+            plugs.append("{}.jointOrient".format(paths[i]))
+            plugs.append("{}.inverseScale".format(paths[i]))
+        parent_path = paths[i].rpartition("|")[0]
+        if parent_path and parent_path not in targets:
+            plugs.append("{}.worldMatrix[0]".format(parent_path))
+    read = pr.get_values(plugs)
+
+    values = {}
+    moved_after = []
+    for i in order:
+        node, world = items[i]
+        path = paths[i]
+        pivots = [read["{}.{}".format(path, attr)] for attr in PIVOT_ATTRIBUTES]
+        if node.dcc_type == "joint":
+            # compensated parent scale
+            pivots.append([value - 1.0 for value in read["{}.inverseScale".format(path)]])
+        if any(abs(value) > 1e-6 for pivot in pivots for value in pivot):
+            moved_after.append((node, world))
+            continue
+
+        # world = local * offsetParentMatrix * parent world matrix
+        parent_space = pr.Types.Mat44(read["{}.offsetParentMatrix".format(path)])
+        parent_path = path.rpartition("|")[0]
+        if parent_path and read["{}.inheritsTransform".format(path)]:
+            parent_world = targets.get(parent_path)
+            if parent_world is None:
+                parent_world = read["{}.worldMatrix[0]".format(parent_path)]
+            parent_space = parent_space * pr.Types.Mat44(parent_world)
+        local = world * parent_space.inverse()
+
+        translate = local.get_translate()
+        rotation = local
+        if node.dcc_type == "joint":
+            if reset_joint_orient:
+                values[node["jointOrient"]] = (0.0, 0.0, 0.0)
+            else:
+                # local = S * R * jointOrient * T
+                orient = pr.Types.Mat44(
+                    (0, 0, 0), read["{}.jointOrient".format(path)], (1, 1, 1)
+                )
+                rotation = local.pick(rotate=True, scale=True, shear=True)
+                rotation = rotation * orient.inverse()
+
+        _, rotate, scale, shear = rotation.decompose(
+            rotate_order=read["{}.rotateOrder".format(path)]
+        )
+        values[node["translate"]] = translate
+        values[node["rotate"]] = rotate
+        values[node["scale"]] = scale
+        values[node["shear"]] = shear
+
+    pr.set_values(values)
+    for node, world in moved_after:
+        if reset_joint_orient and node.dcc_type == "joint":
+            node["jointOrient"].value = (0.0, 0.0, 0.0)
+        node.move_to(world)
+
+
+def reparent_many(pairs):
+    """Reparent the given [(child, parent), ...] keeping their world pose.
+
+    A None parent moves the child under the world. The world matrices are
+    read up front, the DAG edits are made in one pass, a single
+    MDagModifier with OpenMaya, then the children are placed back by
+    `move_many`. The joints get their jointOrient zeroed and their
+    inverse parent network like with `Joint.parent`.
+    """
+    pairs = [
+        (pr.get(child), pr.get(parent) if parent else None)
+        for child, parent in pairs
+    ]
+    uuids = []
+    for child, parent in pairs:
+        for node in (child, parent):
+            if node is not None and node.uuid not in uuids:
+                uuids.append(node.uuid)
+    if not uuids:
+        return
+    paths = dict(zip(uuids, cmds.ls(uuids, long=True) or []))
+
+    edits = []
+    for child, parent in pairs:
+        path = paths[child.uuid]
+        parent_path = paths[parent.uuid] if parent is not None else ""
+        if parent_path == path or parent_path.startswith(path + "|"):
+            raise TypeError("Cannot parent an object to one of its children")
+        if path.rpartition("|")[0] == parent_path:
+            LOG.debug("{} is already a child of {}".format(child, parent))
+            continue
+        edits.append((child, parent, path, parent_path))
+    if not edits:
+        return
+
+    worlds = pr.get_values(
+        ["{}.worldMatrix[0]".format(path) for _, _, path, _ in edits]
+    )
+
+    # joints driven by a decomposeMatrix, their translate can't be set
+    joint_edits = [edit for edit in edits if edit[0].dcc_type == "joint"]
+    driven_joints = []
+    if joint_edits:
+        plugs = []
+        for _, _, path, _ in joint_edits:
+            plugs += ["{}.translate".format(path), "{}.translateX".format(path)]
+        connections = cmds.listConnections(
+            plugs, s=True, d=False, p=True, c=True
+        ) or []
+        driven = set(plug.split(".")[0] for plug in connections[::2])
+        for child, parent, path, _ in joint_edits:
+            if path in driven or path.rpartition("|")[-1] in driven:
+                driven_joints.append(child)
+                if parent is not None:
+                    child._inverse_parent(parent)
+
+    if om is not None:
+        with pr.edit_session("pyrig_reparent") as session:
+            for _, _, path, parent_path in edits:
+                session.reparent(path, parent_path or None)
+    else:
+        for child, parent, _, _ in edits:
+            if parent is None:
+                cmds.parent(str(child), world=True, relative=True)
+            else:
+                cmds.parent(str(child), str(parent), relative=True)
+
+    pr.move_many(
+        dict(
+            (child, worlds["{}.worldMatrix[0]".format(path)])
+            for child, _, path, _ in edits
+            if child not in driven_joints
+        ),
+        reset_joint_orient=True,
+    )
+
+
 class Transform(pyrig.node.DagNode):
     """"""
 
@@ -36,7 +230,8 @@ class Transform(pyrig.node.DagNode):
 
     def _get_shape(self):
         """"""
-        return [pr.get(each) for each in cmds.listRelatives(self, shapes=True)]
+        shapes = cmds.listRelatives(str(self), shapes=True) or []
+        return pr.get_many(shapes)
 
     @property
     def parent(self):
@@ -58,9 +253,11 @@ class Transform(pyrig.node.DagNode):
             raise TypeError("Parent node {} doesn't exists".format(value))
 
         value = pr.get(value)
-        if value.dag_parent and value.dag_parent.node == self.node:
+        value_parent = value.parent
+        current_parent = self.parent
+        if value_parent and value_parent.node == self.node:
             raise TypeError("Cannot parent an object to one of its children")
-        elif self.dag_parent and self.dag_parent.node == value.node:
+        elif current_parent and current_parent.node == value.node:
             LOG.debug("{} is already a child of {}".format(self, value))
             return
         cmds.parent(self, value, relative=relative)
@@ -68,7 +265,9 @@ class Transform(pyrig.node.DagNode):
     # Methods
     def move_to(self, matrix):
         """Move to given matrix."""
-        if isinstance(matrix, om.MMatrix):
+        if isinstance(matrix, pr.Types.Mat44) or (
+            om is not None and isinstance(matrix, om.MMatrix)
+        ):
             matrix = pyrig.maths.matrix.cleanup_matrix(matrix)
             matrix = list(matrix)
         cmds.xform(self.node, worldSpace=True, matrix=matrix)
@@ -98,9 +297,15 @@ class Transform(pyrig.node.DagNode):
         else:
             attribute >> dcm["inputMatrix"]
 
+        skipped = [self[_].name.long for _ in skip]
+        connections = []
         for channel in ["translate", "rotate", "scale"]:
-            if not channel in [self[_].name.long for _ in skip]:
-                dcm[channel].connect(self[channel], connect_leaf=True, skip=skip)
+            if not channel in skipped:
+                output = "output{}".format(channel.capitalize())
+                connections += pyrig.attribute.plan_connections(
+                    dcm[output], self[channel], skip=skip
+                )
+        pyrig.attribute.connect_all(connections)
 
     def offset_by(
         self, translate=(0, 0, 0), rotate=(0, 0, 0), scale=(1, 1, 1), worldSpace=False
@@ -133,3 +338,4 @@ class Helper(Transform):
         return shape
 
 
+pyrig.node.register_class(MayaType.transform, Transform)
@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+# tests run on the memory backend unless PYRIG_BACKEND says otherwise
+os.environ.setdefault("PYRIG_BACKEND", "memory")
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+)
+
+import pyrig.benchmark
+
+
+@pytest.fixture
+def scene():
+    """A new scene, the caches holding scene state are reset."""
+    pyrig.benchmark.new_scene()
@@ -0,0 +1,61 @@
+import pytest
+
+import pyrig.attribute
+import pyrig.core as pr
+
+
+def test_connect_all_reads_the_module_flags(scene, monkeypatch):
+    first = pr.create("transform", name="first")
+    second = pr.create("transform", name="second")
+    target = pr.create("transform", name="target")
+    pyrig.attribute.connect_all([(first["translate"], target["translate"])])
+
+    monkeypatch.setattr(pyrig.attribute, "FORCE_CONNECTION", False)
+    with pytest.raises(RuntimeError):
+        pyrig.attribute.connect_all([(second["translate"], target["translate"])])
+
+    monkeypatch.setattr(pyrig.attribute, "FORCE_CONNECTION", True)
+    pyrig.attribute.connect_all([(second["translate"], target["translate"])])
+    assert str(target["translate"].input) == "second.translate"
+
+
+def test_move_elements_keeps_the_unconnected_children(scene):
+    source = pr.create("transform", name="source")
+    target = pr.create("transform", name="target")
+    cmds = pyrig.attribute.cmds
+    cmds.addAttr(str(target), longName="points", attributeType="double3", multi=True)
+    for axis in "XYZ":
+        cmds.addAttr(
+            str(target), longName="points" + axis, attributeType="double",
+            parent="points",
+        )
+    points = target["points"]
+    points[0].set_value((1.0, 2.0, 3.0))
+    cmds.setAttr("target.points[1].pointsX", 4.0)
+    cmds.setAttr("target.points[1].pointsZ", 6.0)
+    cmds.connectAttr("source.translateY", "target.points[1].pointsY")
+
+    points.insert_at(0, [source["translate"]])
+
+    assert cmds.getAttr("target.points[1]")[0] == (1.0, 2.0, 3.0)
+    assert cmds.getAttr("target.points[2].pointsX") == 4.0
+    assert cmds.getAttr("target.points[2].pointsZ") == 6.0
+    assert cmds.listConnections(
+        "target.points[2].pointsY", s=True, d=False, p=True
+    ) == ["source.translateY"]
+
+
+def test_move_elements_of_a_locked_element_needs_force_lock(scene):
+    source = pr.create("transform", name="source")
+    target = pr.create("transform", name="target")
+    pyrig.attribute.cmds.addAttr(
+        str(target), longName="values", attributeType="double", multi=True
+    )
+    values = target["values"]
+    values[0].set_value(1.0)
+    values[0].lock = True
+    with pytest.raises(RuntimeError):
+        values.insert_at(0, [source["translateX"]])
+    values.insert_at(0, [source["translateX"]], force_lock=True)
+    assert values[1].get_value() == 1.0
+    assert values[1].lock
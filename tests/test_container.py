@@ -0,0 +1,21 @@
+import pytest
+
+import pyrig.core as pr
+
+
+def test_add_members_with_duplicated_names(scene):
+    container = pr.create("container", name="box")
+    pr.create("transform", name="a")
+    pr.create("transform", name="b")
+
+    container.add_members(["a", "b", "a"])
+    assert [member.node for member in container.members] == ["a", "b"]
+
+
+def test_add_members_with_a_missing_name_raises(scene):
+    container = pr.create("container", name="box")
+    pr.create("transform", name="a")
+
+    with pytest.raises(TypeError):
+        container.add_members(["missing", "a"])
+    assert container.members == []
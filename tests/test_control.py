@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+import pyrig.benchmark
+import pyrig.control
+import pyrig.core as pr
+from pyrig.backend import cmds
+
+SPECS = ["ctl", {"name": "arm_ctl", "parent": "grp"}, "ctl", {"parent": "grp"}]
+
+
+def _group():
+    group = pr.create("transform", name="grp")
+    group["translate"].value = (0.0, 2.0, 0.0)
+    group["rotate"].value = (0.0, 0.0, 30.0)
+    return group
+
+
+def _describe(control):
+    """What Control and create_many have to agree on."""
+    mmx = control["offsetParentMatrix"].input.node
+    return {
+        "class": type(control),
+        "name": str(control),
+        "parent": str(control.parent) if control.parent else None,
+        "shapes": cmds.listRelatives(str(control), shapes=True) or [],
+        "members": [str(member.node) for member in control.members],
+        "network": (str(mmx), mmx.node_type),
+        "inheritsTransform": control["inheritsTransform"].value,
+        "visibility": (
+            control["visibility"].keyable, control["visibility"].visible
+        ),
+        "rotateOrder": (
+            control["rotateOrder"].keyable, control["rotateOrder"].visible
+        ),
+        "offsetParentMatrix": list(control["offsetParentMatrix"].value),
+        "worldMatrix": list(control["worldMatrix"][0].value),
+    }
+
+
+def test_create_many_matches_control(scene):
+    _group()
+    controls = []
+    for spec in SPECS:
+        spec = spec if isinstance(spec, dict) else {"name": spec}
+        controls.append(pyrig.control.Control(create=True, **spec))
+    expected = [_describe(control) for control in controls]
+
+    pyrig.benchmark.new_scene()
+    _group()
+    described = [
+        _describe(control) for control in pyrig.control.Control.create_many(SPECS)
+    ]
+
+    assert [each["name"] for each in described] == [
+        "ctl", "arm_ctl", "ctl2", "dagContainer"
+    ]
+    assert [each["network"][0] for each in described] == [
+        "ctl1", "arm_ctl1", "ctl3", "dagContainer1"
+    ]
+    assert [each["parent"] for each in described] == [None, "grp", None, "grp"]
+    for batched, control in zip(described, expected):
+        for key in ("offsetParentMatrix", "worldMatrix"):
+            np.testing.assert_allclose(
+                batched.pop(key), control.pop(key), atol=1e-9
+            )
+        assert batched == control
+
+
+def test_create_many_matches_control_with_numbered_names(scene):
+    names = ["ctl{}".format(i) for i in range(4)] + ["ctl1"]
+    cmds.createNode("transform", name="ctl3")
+    expected = [
+        _describe(pyrig.control.Control(name=name, create=True))
+        for name in names
+    ]
+
+    pyrig.benchmark.new_scene()
+    cmds.createNode("transform", name="ctl3")
+    described = [
+        _describe(control) for control in pyrig.control.Control.create_many(names)
+    ]
+
+    assert [each["name"] for each in described] == [
+        each["name"] for each in expected
+    ]
+    assert [each["network"] for each in described] == [
+        each["network"] for each in expected
+    ]
+
+
+def test_create_many_of_no_spec(scene):
+    assert pyrig.control.Control.create_many([]) == []
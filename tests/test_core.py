@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+import pyrig.core as pr
+
+OFFSET = ((1.0, 2.0, 3.0), (0.0, 90.0, 0.0), (1.0, 1.0, 1.0))
+
+
+def _node():
+    node = pr.create("transform", name="node")
+    node["translate"].value = (1.0, 2.0, 3.0)
+    node["rotateOrder"].value = 2
+    node["offsetParentMatrix"].value = pr.Types.Mat44(*OFFSET)
+    return node
+
+
+def test_get_values_of_attributes_and_strings(scene):
+    node = _node()
+    values = pr.get_values(
+        [node["translate"], "node.translateY", "node.rotateOrder", node["visibility"]]
+    )
+    assert values == {
+        "node.translate": (1.0, 2.0, 3.0),
+        "node.translateY": 2.0,
+        "node.rotateOrder": 2,
+        "node.visibility": True,
+    }
+
+
+def test_get_values_of_matrices(scene):
+    _node()
+    values = pr.get_values(["node.offsetParentMatrix", "node.worldMatrix[0]"])
+    offset = pr.Types.Mat44(*OFFSET)
+    local = pr.Types.Mat44((1.0, 2.0, 3.0), (0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
+    for plug, expected in (
+        ("node.offsetParentMatrix", offset),
+        ("node.worldMatrix[0]", local * offset),
+    ):
+        assert isinstance(values[plug], pr.Types.Mat44)
+        np.testing.assert_allclose(list(values[plug]), list(expected), atol=1e-9)
+
+
+def test_get_values_of_a_missing_plug_raises(scene):
+    _node()
+    with pytest.raises(ValueError):
+        pr.get_values(["node.translate", "node.missing"])
+
+
+def test_get_values_as_array(scene):
+    node = _node()
+    array = pr.get_values([node["translate"], "node.scale"], as_array=True)
+    assert array.shape == (2, 3)
+    np.testing.assert_allclose(array, [(1.0, 2.0, 3.0), (1.0, 1.0, 1.0)])
+
+    assert node.get_values(["translateX", "rotateOrder"], as_array=True).shape == (2, 1)
+    with pytest.raises(ValueError):
+        pr.get_values(["node.translate", "node.translateX"], as_array=True)
+
+
+def test_set_values_of_attributes_and_strings(scene):
+    node = _node()
+    pr.set_values({
+        node["translate"]: (4.0, 5.0, 6.0),
+        "node.rotateX": 45.0,
+        "node.rotateOrder": "yzx",
+        node["visibility"]: False,
+        "node.offsetParentMatrix": pr.Types.Mat44(),
+    })
+    assert node["translate"].value == (4.0, 5.0, 6.0)
+    assert node["rotateX"].value == 45.0
+    assert node["rotateOrder"].value == 1
+    assert node["visibility"].value is False
+    np.testing.assert_allclose(
+        list(node["offsetParentMatrix"].value), list(pr.Types.Mat44()), atol=1e-9
+    )
+
+
+def test_set_values_none_sets_the_default(scene):
+    node = _node()
+    pr.set_values({"node.translate": None, node["rotateOrder"]: None})
+    assert node["translate"].value == (0.0, 0.0, 0.0)
+    assert node["rotateOrder"].value == 0
+
+
+def test_set_values_of_a_missing_plug_raises(scene):
+    _node()
+    with pytest.raises(RuntimeError):
+        pr.set_values({"node.translateX": 1.0, "node.missing": 1.0})
+
+
+def test_set_values_force_lock_restores_the_locks(scene):
+    node = _node()
+    node["translate"].lock = True
+    node["rotateX"].lock = True
+    with pytest.raises(RuntimeError):
+        pr.set_values({"node.translate": (0.0, 0.0, 0.0)})
+
+    pr.set_values(
+        {"node.translate": (7.0, 8.0, 9.0), "node.rotateX": 10.0, "node.scaleX": 2.0},
+        force_lock=True,
+    )
+    assert node["translate"].value == (7.0, 8.0, 9.0)
+    assert node["rotateX"].value == 10.0
+    assert node["scaleX"].value == 2.0
+    assert node["translate"].lock and node["rotateX"].lock
+    assert not node["scaleX"].lock
@@ -0,0 +1,21 @@
+"""pyrig.dataType wraps OpenMaya, skipped without Maya."""
+import pytest
+
+from pyrig.constants import RotateOrder
+
+pytest.importorskip("maya.api.OpenMaya")
+
+import pyrig.dataType
+
+
+def test_rotate_order_queries_do_not_change_the_matrix():
+    matrix = pyrig.dataType.Mat44((1, 2, 3), (10.0, -35.0, 120.0), (1, 2, 1))
+    fresh = pyrig.dataType.Mat44(list(matrix))
+
+    matrix.get_rotate(rotate_order=RotateOrder.zyx)
+    assert matrix.get_rotate() == pytest.approx(fresh.get_rotate())
+    assert matrix.get_scale() == pytest.approx(fresh.get_scale())
+    assert matrix.get_rotate(rotate_order=RotateOrder.zyx) == pytest.approx(
+        pyrig.dataType.Mat44(list(matrix)).get_rotate(rotate_order=RotateOrder.zyx)
+    )
+    assert list(matrix) == pytest.approx(list(fresh))
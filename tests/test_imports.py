@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+_SCRIPT = """
+import json, sys
+import {module}
+modules = sorted(name for name in sys.modules if name.startswith("pyrig"))
+name = sys.modules.get("pyrig.name")
+print(json.dumps({{
+    "modules": modules,
+    "remap": bool(name and name._NODE_TYPE_REMAP_STATE["loaded"]),
+}}))
+"""
+
+
+def _import(module):
+    """Import module in a fresh interpreter, return what it loaded."""
+    env = dict(os.environ, PYRIG_BACKEND="memory", PYTHONPATH=SRC)
+    output = subprocess.check_output(
+        [sys.executable, "-c", _SCRIPT.format(module=module)], env=env
+    )
+    return json.loads(output.decode())
+
+
+@pytest.mark.parametrize(
+    "module, unexpected",
+    [
+        ("pyrig", ["pyrig.core", "pyrig.node", "pyrig.backend"]),
+        ("pyrig.core", ["pyrig.node", "pyrig.attribute", "pyrig.joint"]),
+        (
+            "pyrig.node",
+            ["pyrig.joint", "pyrig.control", "pyrig.maths.matrix_array"],
+        ),
+    ],
+)
+def test_import_loads_the_submodules_lazily(module, unexpected):
+    loaded = _import(module)
+    assert not set(unexpected) & set(loaded["modules"])
+    assert not loaded["remap"]
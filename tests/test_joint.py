@@ -0,0 +1,33 @@
+import numpy as np
+
+import pyrig.core as pr
+import pyrig.joint
+
+
+def _world(node):
+    return np.array(list(node["worldMatrix"][0].value)).reshape(4, 4)
+
+
+def test_create_chain_world_matrices(scene):
+    positions = [(0, 0, 0), (1, 1, 0), (2, 1, 1), (3, 0, 2)]
+    joints = pr.create_chain(positions, name="jnt", up_vector=(0, 0, 1))
+
+    expected = pyrig.joint.orient_chain(positions, up_vector=(0, 0, 1)).array
+    for joint, matrix in zip(joints, expected):
+        np.testing.assert_allclose(_world(joint), matrix, atol=1e-9)
+
+
+def test_create_chain_under_non_uniform_scale(scene):
+    parent = pr.create("transform", name="parent")
+    parent["translate"].value = (1.0, 2.0, 3.0)
+    parent["rotate"].value = (0.0, 30.0, 10.0)
+    parent["scale"].value = (1.0, 2.0, 0.5)
+
+    positions = [(0, 0, 0), (1, 1, 0), (2, 1, 1), (3, 0, 2)]
+    joints = pr.create_chain(
+        positions, name="jnt", parent=parent, up_vector=(0, 0, 1)
+    )
+
+    expected = pyrig.joint.orient_chain(positions, up_vector=(0, 0, 1)).array
+    for joint, matrix in zip(joints, expected):
+        np.testing.assert_allclose(_world(joint), matrix, atol=1e-9)
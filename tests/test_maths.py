@@ -0,0 +1,100 @@
+"""Parity of pyrig.maths.numpy_backend with OpenMaya, skipped without Maya."""
+import math
+
+import numpy as np
+import pytest
+
+from pyrig.constants import RotateOrder
+from pyrig.maths import numpy_backend
+
+om = pytest.importorskip("maya.api.OpenMaya")
+
+ROTATE_ORDERS = [
+    RotateOrder.xyz,
+    RotateOrder.yzx,
+    RotateOrder.zxy,
+    RotateOrder.xzy,
+    RotateOrder.yxz,
+    RotateOrder.zyx,
+]
+ROTATIONS = [(0.0, 0.0, 0.0), (10.0, -35.0, 120.0), (89.0, 45.0, -170.0)]
+
+
+def _euler(angles, rotate_order):
+    order = getattr(om.MEulerRotation, RotateOrder.maya_api_type(rotate_order))
+    return om.MEulerRotation(*[math.radians(each) for each in angles], order=order)
+
+
+def _array(mmatrix):
+    return np.array(list(mmatrix)).reshape(4, 4)
+
+
+@pytest.mark.parametrize("rotate_order", ROTATE_ORDERS)
+@pytest.mark.parametrize("angles", ROTATIONS)
+def test_euler_to_matrix(angles, rotate_order):
+    result = numpy_backend.to_rotation_matrix(angles, rotate_order)
+    expected = _array(_euler(angles, rotate_order).asMatrix())[:3, :3]
+    np.testing.assert_allclose(result, expected, atol=1e-9)
+
+
+@pytest.mark.parametrize("rotate_order", ROTATE_ORDERS)
+@pytest.mark.parametrize("angles", ROTATIONS)
+def test_matrix_to_euler(angles, rotate_order):
+    rotation = _array(_euler(angles, rotate_order).asMatrix())[:3, :3]
+    euler = numpy_backend.from_rotation_matrix(rotation, rotate_order)
+
+    # angles may differ by a full turn or a flip, the rotation may not
+    result = _array(_euler(euler, rotate_order).asMatrix())[:3, :3]
+    np.testing.assert_allclose(result, rotation, atol=1e-9)
+
+
+@pytest.mark.parametrize("angles", ROTATIONS)
+def test_quaternions(angles):
+    quaternion = _euler(angles, RotateOrder.xyz).asQuaternion()
+    xyzw = (quaternion.x, quaternion.y, quaternion.z, quaternion.w)
+    rotation = _array(quaternion.asMatrix())[:3, :3]
+
+    np.testing.assert_allclose(
+        numpy_backend.quaternion_to_matrix(xyzw), rotation, atol=1e-9
+    )
+    result = numpy_backend.matrix_to_quaternion(rotation)
+    if np.dot(result, xyzw) < 0.0:
+        result = -result
+    np.testing.assert_allclose(result, xyzw, atol=1e-9)
+
+
+@pytest.mark.parametrize("rotate_order", ROTATE_ORDERS)
+def test_compose_decompose(rotate_order):
+    translate = (1.0, -2.0, 3.5)
+    rotate = (10.0, -35.0, 120.0)
+    scale = (1.0, 2.0, 0.5)
+    shear = (0.2, -0.1, 0.3)
+
+    transformation = om.MTransformationMatrix()
+    transformation.setTranslation(om.MVector(*translate), om.MSpace.kTransform)
+    transformation.setRotation(_euler(rotate, rotate_order))
+    transformation.setScale(scale, om.MSpace.kTransform)
+    transformation.setShear(shear, om.MSpace.kTransform)
+    expected = _array(transformation.asMatrix())
+
+    result = numpy_backend.compose_arrays(
+        translate, rotate, scale, shear, rotate_order=rotate_order
+    )
+    np.testing.assert_allclose(result, expected, atol=1e-9)
+
+    t, rotation, s, sh = numpy_backend.decompose_arrays(expected)
+    decomposed = om.MTransformationMatrix(om.MMatrix(list(expected.flatten())))
+    np.testing.assert_allclose(
+        t, list(decomposed.translation(om.MSpace.kTransform)), atol=1e-9
+    )
+    np.testing.assert_allclose(
+        s, decomposed.scale(om.MSpace.kTransform), atol=1e-9
+    )
+    np.testing.assert_allclose(
+        sh, decomposed.shear(om.MSpace.kTransform), atol=1e-9
+    )
+    np.testing.assert_allclose(
+        numpy_backend.compose_rotation_arrays(t, rotation, s, sh),
+        expected,
+        atol=1e-9,
+    )
@@ -0,0 +1,25 @@
+from pyrig.backend import cmds
+
+
+def test_unique_name_reuses_freed_suffixes(scene):
+    names = [cmds.createNode("transform", name="node1") for _ in range(4)]
+    assert names == ["node1", "node2", "node3", "node4"]
+
+    cmds.delete("node2")
+    cmds.rename("node3", "other")
+    assert cmds.createNode("transform", name="node1") == "node2"
+    assert cmds.createNode("transform", name="node1") == "node3"
+    assert cmds.createNode("transform", name="node1") == "node5"
+
+
+def test_delete_breaks_the_node_connections(scene):
+    source = cmds.createNode("transform", name="source")
+    other = cmds.createNode("transform", name="other")
+    mmx = cmds.createNode("multMatrix", name="mmx")
+    cmds.connectAttr(source + ".worldMatrix[0]", mmx + ".matrixIn[0]")
+    cmds.connectAttr(other + ".worldMatrix[0]", mmx + ".matrixIn[1]")
+
+    cmds.delete(source)
+    assert cmds.listConnections(mmx, c=True, p=True) == [
+        "mmx.matrixIn[1]", "other.worldMatrix[0]"
+    ]
@@ -0,0 +1,98 @@
+import pytest
+
+import pyrig.benchmark
+import pyrig.core as pr
+import pyrig.name
+from pyrig.backend import cmds
+
+
+@pytest.fixture
+def index(scene):
+    """An empty name index of its own."""
+    return pyrig.name.NameIndex()
+
+
+def test_next_available_allocates_the_free_suffixes(index):
+    for name in ("ctl", "ctl1", "ctl3", "ctl05", "ctlA"):
+        cmds.createNode("transform", name=name)
+
+    names = [index.next_available("ctl") for _ in range(3)]
+    assert names == ["ctl2", "ctl4", "ctl5"]
+    assert index.next_available("ctl12") == "ctl6"
+    assert index.next_available("jnt") == "jnt"
+    assert index.next_available("jnt") == "jnt1"
+
+
+def test_next_available_reuses_the_released_suffixes(index):
+    names = [index.next_available("ctl") for _ in range(4)]
+    assert names == ["ctl", "ctl1", "ctl2", "ctl3"]
+
+    index.discard("ctl2")
+    index.discard("|grp|ctl")
+    index.discard("ctl02")
+    index.discard("ctl9")
+    assert [index.next_available("ctl") for _ in range(3)] == [
+        "ctl", "ctl2", "ctl4"
+    ]
+
+
+def test_next_available_skips_the_names_created_behind_its_back(index):
+    assert index.next_available("ctl") == "ctl"
+    cmds.createNode("transform", name="ctl1")
+    cmds.createNode("transform", name="ctl2")
+    assert index.next_available("ctl") == "ctl3"
+
+
+def test_stale_index_after_an_external_rename_or_delete(index):
+    for name in ("ctl", "ctl1", "ctl2"):
+        cmds.createNode("transform", name=name)
+    assert index.next_available("ctl") == "ctl3"
+    cmds.createNode("transform", name="ctl3")
+
+    # without scene callbacks the index still holds the old names, their
+    # suffixes are not reused but no existing name is returned either
+    cmds.rename("ctl1", "other")
+    cmds.delete("ctl")
+    cmds.rename("other", "ctl4")
+    name = index.next_available("ctl")
+    assert name == "ctl5"
+    assert not cmds.objExists(name)
+
+    # what the scene callbacks do
+    index.discard("ctl1")
+    index.discard("ctl")
+    index.add("ctl4")
+    assert index.next_available("ctl") == "ctl"
+    assert index.next_available("ctl") == "ctl1"
+    assert index.next_available("ctl") == "ctl6"
+
+
+def test_pyrig_renames_and_deletes_release_the_suffixes(scene):
+    nodes = [pr.create("transform") for _ in range(3)]
+    assert [str(node) for node in nodes] == ["transform", "transform1", "transform2"]
+
+    nodes[1].delete()
+    nodes[0].name = "renamed"
+    assert str(pr.create("transform")) == "transform"
+    assert str(pr.create("transform")) == "transform1"
+    assert str(pr.create("transform")) == "transform3"
+    assert pyrig.name.find_next_available_name("transform7") == "transform4"
+
+
+def test_new_scene_clears_the_index(scene):
+    pr.create("transform", name="ctl")
+    assert pyrig.name.find_next_available_name("ctl") == "ctl1"
+
+    pyrig.benchmark.new_scene()
+    assert pyrig.name.find_next_available_name("ctl") == "ctl"
+
+
+def test_next_available_indexed_skips_the_bare_name(index):
+    cmds.createNode("transform", name="ctl5")
+    assert index.next_available("ctl5", indexed=True) == "ctl1"
+    assert index.next_available("ctl", indexed=True) == "ctl2"
+    assert index.next_available("ctl") == "ctl"
+
+    index.discard("ctl1")
+    assert index.next_available("ctl", indexed=True) == "ctl1"
+    assert index.next_available("ctl", indexed=True) == "ctl3"
@@ -0,0 +1,184 @@
+import collections
+import gc
+
+import pytest
+
+import pyrig.benchmark
+import pyrig.core as pr
+import pyrig.container
+import pyrig.control
+import pyrig.joint
+import pyrig.node
+import pyrig.transform
+from pyrig.backend import cmds
+
+
+class _Tagged(pyrig.node.Node):
+    """Node subclass keeping python state."""
+
+    def _init_from_scene(self):
+        self.tag = "tagged"
+
+
+class _Transform(pyrig.transform.Transform):
+    """Transform subclass registered by the tests."""
+
+
+@pytest.fixture
+def classes(monkeypatch):
+    """Registered classes restored after the test, an empty class cache."""
+    pyrig.node._load_builtin_classes()
+    monkeypatch.setattr(pyrig.node, "_CLASSES", dict(pyrig.node._CLASSES))
+    monkeypatch.setattr(pyrig.node, "_CLASS_CACHE", collections.OrderedDict())
+
+
+def test_get_retrieved_container_keeps_its_state(scene):
+    control = pyrig.control.Control(name="ctl", create=True)
+    members = [member.node for member in control.members]
+    del control
+    gc.collect()
+
+    retrieved = pr.get("ctl")
+    assert isinstance(retrieved, pyrig.container.DagContainer)
+    assert retrieved.dcc_type == "dagContainer"
+    assert [member.node for member in retrieved.members] == members
+    assert retrieved["offsetParentMatrix"].input.node.node == members[0]
+
+
+def test_get_calls_the_init_from_scene_hook(scene):
+    previous = pyrig.node._CLASSES.get("multMatrix")
+    pr.register_class("multMatrix", _Tagged)
+    try:
+        cmds.createNode("multMatrix", name="mmx")
+        assert pr.get("mmx").tag == "tagged"
+        assert pr.get_many(["mmx"])[0].tag == "tagged"
+        assert pr.create("multMatrix").tag == "tagged"
+    finally:
+        pyrig.node._CLASSES.pop("multMatrix")
+        if previous is not None:
+            pr.register_class("multMatrix", previous)
+        pyrig.node._CLASS_CACHE.clear()
+
+
+def test_get_many_resolves_attributes_and_missing_names(scene):
+    node = pr.create("transform", name="node")
+    plug = node["translate"]
+
+    result = pr.get_many([plug, "node", None, node])
+    assert [str(each) for each in result[:2]] == ["node.translate", "node"]
+    assert result[1] is node and result[2] is None and result[3] is node
+
+    result = pr.get_many([plug, "missing"])
+    assert str(result[0]) == "node.translate" and result[1] is None
+
+
+def test_get_reuses_the_living_node(scene):
+    node = pr.create("transform", name="node")
+    control = pyrig.control.Control(name="ctl", create=True)
+
+    assert pr.get("node") is node
+    assert pr.get("node.translate").node is node
+    assert pr.get_many(["node", "ctl"]) == [node, control]
+    assert pr.get("ctl") is control
+
+
+def test_get_does_not_reuse_a_node_of_another_class(scene):
+    plain = pyrig.node.Node(name="node", node_type="transform")
+
+    retrieved = pr.get("node")
+    assert retrieved is not plain
+    assert isinstance(retrieved, pyrig.transform.Transform)
+    assert pr.get("node") is retrieved
+
+
+def test_get_forgets_the_deleted_nodes(scene):
+    node = pr.create("transform", name="node")
+    uuid = node.uuid
+    node.delete()
+    assert pyrig.node.get_registered(uuid) is None
+
+    created = pr.create("transform", name="node")
+    assert pr.get("node") is created
+
+
+def test_get_forgets_the_nodes_of_the_previous_scene(scene):
+    node = pr.create("transform", name="node")
+    uuid = node.uuid
+    pyrig.benchmark.new_scene()
+    assert pyrig.node.get_registered(uuid) is None
+    assert pr.get("node") is None
+
+
+def test_get_follows_the_renamed_nodes(scene):
+    node = pr.create("transform", name="node")
+    node.name = "renamed"
+    assert pr.get("renamed") is node
+
+    cmds.rename("renamed", "external")
+    assert pr.get("external") is node
+    assert str(node) == "external"
+    assert pr.get("renamed") is None
+
+
+def test_get_many_keys_the_ls_results_by_name(scene, monkeypatch):
+    first = pr.create("transform", name="first")
+    second = pr.create("joint", name="second")
+    ls = cmds.ls
+
+    def scene_ordered_ls(*args, **kwargs):
+        # ls returns the nodes in scene order, not in argument order
+        result = ls(*args, **kwargs)
+        if kwargs.get("showType"):
+            pairs = list(zip(result[0::2], result[1::2]))[::-1]
+            return [each for pair in pairs for each in pair]
+        if kwargs.get("uuid"):
+            return result[::-1]
+        return result
+
+    monkeypatch.setattr(pr.cmds, "ls", scene_ordered_ls)
+    result = pr.get_many(["first", "second.translate"])
+    assert result[0] is first
+    assert result[1].node is second
+    assert pr.get_many(["|first", "second"]) == [first, second]
+
+
+def test_register_class_overrides_the_builtin_class(scene, classes):
+    builtin = pr.create("transform", name="builtin")
+    assert type(builtin) is pyrig.transform.Transform
+
+    pr.register_class("transform", _Transform)
+    assert type(pr.get("builtin")) is _Transform
+    assert type(pr.create("transform")) is _Transform
+    assert isinstance(pr.create("joint"), pyrig.joint.Joint)
+
+
+def test_find_class_picks_the_most_derived_registered_type(classes):
+    joint = pyrig.node.get_type_hierarchy("joint")
+    dag_container = pyrig.node.get_type_hierarchy("dagContainer")
+    pr.register_class("transform", _Transform)
+
+    assert pyrig.node.find_class(joint) is pyrig.joint.Joint
+    assert pyrig.node.find_class(dag_container) is pyrig.container.DagContainer
+    assert pyrig.node.find_class(joint[:-1]) is _Transform
+    assert pyrig.node.find_class(joint + ["pluginJoint"]) is pyrig.joint.Joint
+    assert pyrig.node.find_class(["entity", "dagNode"]) is pyrig.node.DagNode
+    assert pyrig.node.find_class(["network"]) is pyrig.node.Node
+    assert pyrig.node.find_class([]) is pyrig.node.Node
+
+
+def test_find_class_cache(classes, monkeypatch):
+    monkeypatch.setattr(pyrig.node, "CLASS_CACHE_SIZE", 2)
+    transform = pyrig.node.get_type_hierarchy("transform")
+    joint = pyrig.node.get_type_hierarchy("joint")
+    find_class = pyrig.node.find_class
+
+    find_class(transform)
+    find_class(joint)
+    find_class(transform)
+    find_class(["network"])
+    assert list(pyrig.node._CLASS_CACHE) == ["transform", "network"]
+
+    pr.register_class("transform", _Transform)
+    assert not pyrig.node._CLASS_CACHE
+    assert find_class(transform) is _Transform
+    assert find_class(joint) is pyrig.joint.Joint
@@ -0,0 +1,78 @@
+import json
+import os
+import subprocess
+import sys
+
+import pyrig.benchmark
+import pyrig.profiler
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+class _Base(object):
+    def method(self):
+        return pyrig.profiler._method_name(sys._getframe())
+
+    @property
+    def value(self):
+        return pyrig.profiler._method_name(sys._getframe())
+
+    @classmethod
+    def build(cls):
+        return pyrig.profiler._method_name(sys._getframe())
+
+
+class _Child(_Base):
+    def method(self):
+        return super(_Child, self).method()
+
+
+def _function():
+    return pyrig.profiler._method_name(sys._getframe())
+
+
+def test_method_name_finds_the_defining_class():
+    """The fallback used before python 3.11 matches co_qualname."""
+    child = _Child()
+    assert child.method() == "_Base.method"
+    assert child.value == "_Base.value"
+    assert _Child.build() == "_Base.build"
+    assert _function() == "_function"
+
+
+def test_benchmark_frames_are_not_entry_points(scene):
+    run = pyrig.benchmark.WORKLOADS["controls_batch"][0](2)
+    with pyrig.profiler.Profiler() as profiler:
+        run()
+
+    entry_points = set(row["entry_point"] for row in profiler.summary())
+    assert entry_points == {"Control.create_many"}
+
+
+_LAZY_IMPORT_SCRIPT = """
+import json
+import pyrig.profiler
+with pyrig.profiler.Profiler() as profiler:
+    import pyrig.name
+    pyrig.name.find_next_available_name("ctl")
+print(json.dumps({
+    "calls": [
+        [row["entry_point"], row["call"], row["count"]]
+        for row in profiler.summary()
+    ],
+    "restored": not isinstance(pyrig.name.cmds, pyrig.profiler._ModuleProxy),
+}))
+"""
+
+
+def test_modules_imported_while_profiling_are_recorded():
+    env = dict(os.environ, PYRIG_BACKEND="memory", PYTHONPATH=SRC)
+    output = subprocess.check_output(
+        [sys.executable, "-c", _LAZY_IMPORT_SCRIPT], env=env
+    )
+    result = json.loads(output.decode())
+    assert sorted(result["calls"]) == [
+        ["find_next_available_name", "cmds.ls", 1],
+        ["find_next_available_name", "cmds.objExists", 1],
+    ]
+    assert result["restored"]
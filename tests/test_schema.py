@@ -0,0 +1,64 @@
+import pyrig.attribute
+import pyrig.core as pr
+import pyrig.schema
+
+
+def _count_queries(monkeypatch):
+    """Count the cmds.attributeQuery calls made by pyrig.attribute."""
+    calls = []
+    query = pyrig.attribute.cmds.attributeQuery
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return query(*args, **kwargs)
+
+    monkeypatch.setattr(pyrig.attribute.cmds, "attributeQuery", counted)
+    return calls
+
+
+def test_static_metadata_is_queried_once_per_node_type(scene, monkeypatch):
+    first = pr.create("transform", name="first")
+    second = pr.create("transform", name="second")
+    first["translate"].children
+
+    calls = _count_queries(monkeypatch)
+    assert len(second["translate"].children) == 3
+    assert not calls
+
+
+def test_per_node_metadata_is_stored_per_uuid(scene):
+    first = pr.create("transform", name="first")
+    second = pr.create("transform", name="second")
+    schema = pyrig.schema.SCHEMA
+    for node in (first, second):
+        value = schema.query(node, "translate", ("test",), lambda: str(node), per_node=True)
+        assert value == str(node)
+    assert schema.query(first, "translate", ("test",), lambda: None, per_node=True) == "first"
+
+    schema.invalidate(first.uuid)
+    assert schema.query(first, "translate", ("test",), lambda: None, per_node=True) is None
+    assert schema.query(second, "translate", ("test",), lambda: None, per_node=True) == "second"
+
+
+def test_typed_attribute_type_is_stored_per_node(scene):
+    node = pr.create("transform", name="node")
+    node.add_attr("data", dataType="string")
+    assert node["data"].type == "string"
+    assert node["data"]._attribute_query(attributeType=True) == "typed"
+    assert "data" in pyrig.schema.SCHEMA._dynamic[node.uuid]
+
+
+def test_edits_made_by_pyrig_invalidate_the_metadata(scene):
+    node = pr.create("transform", name="node")
+    node.add_attr("weight", attributeType="double", min=0, max=1)
+    weight = node["weight"]
+    assert weight.max == [1]
+
+    weight.max = 5
+    assert weight.max == [5]
+
+    weight.delete()
+    assert not weight.exists()
+    node.add_attr("weight", dataType="string")
+    assert node["weight"].type == "string"
+    assert node["weight"].max is None
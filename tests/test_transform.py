@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+import pyrig.control
+import pyrig.core as pr
+import pyrig.transform
+
+TARGET = ((1.0, 2.0, 3.0), (10.0, 20.0, 30.0), (1.0, 1.0, 1.0))
+
+
+def _world(node):
+    return np.array(list(node["worldMatrix"][0].value)).reshape(4, 4)
+
+
+def _plain(suffix):
+    parent = pr.create("transform", name="parent" + suffix)
+    parent["translate"].value = (5.0, 0.0, 0.0)
+    parent["rotate"].value = (0.0, 45.0, 0.0)
+    node = pr.create("transform", name="node" + suffix)
+    node.parent = parent
+    return node
+
+
+def _joint(suffix):
+    parent = pr.create("joint", name="root" + suffix)
+    parent["translate"].value = (5.0, 0.0, 0.0)
+    parent["jointOrient"].value = (0.0, 0.0, 30.0)
+    node = pr.create("joint", name="node" + suffix)
+    cmds = pyrig.transform.cmds
+    cmds.parent(str(node), str(parent), relative=True)
+    node["jointOrient"].value = (10.0, 20.0, 30.0)
+    return node
+
+
+def _offset(suffix):
+    node = _plain(suffix)
+    node["offsetParentMatrix"].value = pr.Types.Mat44(
+        (0.0, 10.0, 0.0), (0.0, 0.0, 0.0), (1.0, 1.0, 1.0)
+    )
+    return node
+
+
+def _not_inherited(suffix):
+    node = _plain(suffix)
+    node["inheritsTransform"].value = False
+    return node
+
+
+@pytest.mark.parametrize("set_channels", [True, False])
+@pytest.mark.parametrize("build", [_plain, _joint, _offset, _not_inherited])
+def test_move_many_matches_move_to(scene, monkeypatch, build, set_channels):
+    monkeypatch.setattr(pyrig.transform, "SET_CHANNELS", set_channels)
+    target = pr.Types.Mat44(*TARGET)
+    moved = build("A")
+    batched = build("B")
+
+    moved.move_to(target)
+    pr.move_many({batched: target})
+
+    np.testing.assert_allclose(_world(batched), _world(moved), atol=1e-9)
+    np.testing.assert_allclose(
+        _world(batched), np.array(list(target)).reshape(4, 4), atol=1e-9
+    )
+    if build is _joint:
+        assert batched["jointOrient"].value == pytest.approx((10.0, 20.0, 30.0))
+
+
+@pytest.mark.parametrize("set_channels", [True, False])
+def test_move_many_moves_the_parents_first(scene, monkeypatch, set_channels):
+    monkeypatch.setattr(pyrig.transform, "SET_CHANNELS", set_channels)
+    parent = _plain("A")
+    child = _offset("B")
+    child.parent = parent
+    targets = {
+        child: pr.Types.Mat44(*TARGET),
+        parent: pr.Types.Mat44((0.0, 1.0, 0.0), (0.0, 0.0, 90.0), (2.0, 2.0, 2.0)),
+    }
+
+    pr.move_many(targets)
+
+    for node, target in targets.items():
+        np.testing.assert_allclose(
+            _world(node), np.array(list(target)).reshape(4, 4), atol=1e-9
+        )
+
+
+@pytest.mark.parametrize("set_channels", [True, False])
+def test_reparent_many_keeps_the_world_matrices(scene, monkeypatch, set_channels):
+    monkeypatch.setattr(pyrig.transform, "SET_CHANNELS", set_channels)
+    group = pr.create("transform", name="grp")
+    group["translate"].value = (0.0, 3.0, 0.0)
+    group["rotate"].value = (20.0, 0.0, 45.0)
+    group["scale"].value = (2.0, 2.0, 2.0)
+    control = pyrig.control.Control(name="ctl", create=True)
+    control["translate"].value = (1.0, 0.0, 0.0)
+    joints = []
+    for i in range(3):
+        joint = pr.create("joint", name="jnt{}".format(i))
+        joint["translate"].value = (1.0, float(i), 0.0)
+        joint["rotate"].value = (0.0, 0.0, 10.0 * i)
+        joints.append(joint)
+    nodes = [control] + joints
+    worlds = [_world(node) for node in nodes]
+
+    pr.reparent_many(
+        [(control, group), (joints[0], group)] + list(zip(joints[1:], joints))
+    )
+
+    assert str(control.parent) == "grp"
+    assert str(joints[2].parent) == "jnt1"
+    assert control["translate"].value == pytest.approx((1.0, 0.0, 0.0))
+    for node, world in zip(nodes, worlds):
+        np.testing.assert_allclose(_world(node), world, atol=1e-9)
+    for joint in joints:
+        assert joint["jointOrient"].value == pytest.approx((0.0, 0.0, 0.0))